@@ -52,14 +52,62 @@ export interface DataMakerFieldType {
 export const SDK_VERSION = "0.8.1";
 
 export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
+  {
+    label: "close",
+    kind: CompletionItemKind.Method,
+    insertText: "close()",
+    documentation: "Close the pooled connections held by the shared transport.",
+    detail: "Method: close",
+    sortText: "close",
+  },
   {
     label: "generate",
     kind: CompletionItemKind.Method,
-    insertText: "generate(${1:template}: any)",
-    documentation: "Generate data using a template.",
+    insertText: "generate(${1:template}: any, ${2:columnar}: bool)",
+    documentation: "Generate data using a template.  Args:     template: A Template or template dictionary.     columnar: Return a ColumnarResult (one NumPy array per column,         convertible with ``to_pandas()``/``to_arrow()``) instead of a         list of row dicts. Requires NumPy.  Example:     >>> df = dm.generate(template, columnar=True).to_pandas()",
     detail: "Method: generate",
     sortText: "generate",
   },
+  {
+    label: "generate_hybrid",
+    kind: CompletionItemKind.Method,
+    insertText: "generate_hybrid(${1:template}: any, ${2:quantity}: Optional[int], ${3:columnar}: bool, ${4:seed}: Optional[int])",
+    documentation: "Generate cheap fields locally and send only the rest to the API.  UUID, Number, Float, Boolean, Custom and Words fields are sampled locally, Derived fields that only substitute other fields are filled in locally, and the remaining fields go to the API in one request. The columns are joined back by row index. Requires NumPy.  Args:     template: A Template or template dictionary.     quantity: Optional row count overriding the template's quantity.     columnar: Return a ColumnarResult instead of row dicts.     seed: Seed for the locally generated fields.  Returns:     The generated rows, in template field order.  Example:     >>> rows = dm.generate_hybrid(template, 10_000)",
+    detail: "Method: generate_hybrid",
+    sortText: "generate_hybrid",
+  },
+  {
+    label: "generate_sharded",
+    kind: CompletionItemKind.Method,
+    insertText: "generate_sharded(${1:template}: any, ${2:quantity}: Optional[int], ${3:shards}: int, ${4:seed}: Optional[int], ${5:workers}: Optional[int], ${6:columnar}: bool)",
+    documentation: "Generate a template locally in seeded shards on a process pool.  Each shard is seeded from (seed, shard index), so the same template, quantity, shards and seed give identical rows for any number of workers. Only locally generated field types are supported. Requires NumPy. Workers are started with spawn and re-import the main module, so scripts must call this under ``if __name__ == \"__main__\":`` (or pass ``workers=1``).  Args:     template: A Template, AccountTemplate or template dictionary.     quantity: Optional row count overriding the template's quantity.     shards: Number of shards. Changing it changes the rows.     seed: Base seed; defaults to the template's seed, if any.     workers: Number of worker processes; defaults to the CPU count.     columnar: Return a ColumnarResult instead of row dicts.  Returns:     The generated rows, in shard order.  Example:     >>> if __name__ == \"__main__\":     ...     rows = dm.generate_sharded(template, 10_000_000, shards=64, seed=7)",
+    detail: "Method: generate_sharded",
+    sortText: "generate_sharded",
+  },
+  {
+    label: "iter_generate",
+    kind: CompletionItemKind.Method,
+    insertText: "iter_generate(${1:template}: any, ${2:quantity}: Optional[int], ${3:columnar}: bool, ${4:batch_size}: int)",
+    documentation: "Generate data and yield rows as the response streams in.  Parses the response incrementally, so memory stays flat no matter how many rows come back.  Args:     template: A Template or template dictionary.     quantity: Optional row count overriding the template's quantity.     columnar: Yield ColumnarResult batches of up to ``batch_size``         rows instead of row dicts.     batch_size: Rows per batch when ``columnar`` is set.  Returns:     An iterator over the generated row dictionaries.  Example:     >>> dm = DataMaker()     >>> for row in dm.iter_generate(template, 100_000):     ...     writer.writerow(row)",
+    detail: "Method: iter_generate",
+    sortText: "iter_generate",
+  },
+  {
+    label: "generate_bulk",
+    kind: CompletionItemKind.Method,
+    insertText: "generate_bulk(${1:template}: any, ${2:quantity}: int, ${3:chunk_size}: int, ${4:concurrency}: int, ${5:retries}: int, ${6:columnar}: bool)",
+    documentation: "Generate a large quantity of rows as concurrent chunks.  Args:     template: A Template or template dictionary.     quantity: Total number of rows to generate.     chunk_size: Maximum rows per request.     concurrency: Maximum number of chunk requests in flight.     retries: Extra attempts per chunk before giving up.     columnar: Return one ColumnarResult instead of row dicts.  Returns:     The generated rows, in order.  Example:     >>> dm = DataMaker(pool_maxsize=8)     >>> rows = dm.generate_bulk(template, 500_000, chunk_size=5000, concurrency=8)",
+    detail: "Method: generate_bulk",
+    sortText: "generate_bulk",
+  },
+  {
+    label: "iter_generate_bulk",
+    kind: CompletionItemKind.Method,
+    insertText: "iter_generate_bulk(${1:template}: any, ${2:quantity}: int, ${3:chunk_size}: int, ${4:concurrency}: int, ${5:retries}: int, ${6:columnar}: bool)",
+    documentation: "Generate rows in concurrent chunks, yielding them in order.  Same as generate_bulk, but only the chunks in flight are held in memory. With ``columnar`` set, each chunk is yielded as a ColumnarResult.",
+    detail: "Method: iter_generate_bulk",
+    sortText: "iter_generate_bulk",
+  },
   {
     label: "generate_from_template_id",
     kind: CompletionItemKind.Method,
@@ -623,16 +671,32 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
   {
     label: "download_scenario_file_to_path",
     kind: CompletionItemKind.Method,
-    insertText: "download_scenario_file_to_path(${1:file_id}: str, ${2:destination_path}: str, ${3:scenario_id}: Optional[str])",
-    documentation: "Download a file and save it to a local path.  Args:     file_id: The unique identifier of the file.     destination_path: Local file path to save the downloaded content.     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.  Returns:     The destination path where the file was saved.",
+    insertText: "download_scenario_file_to_path(${1:file_id}: str, ${2:destination_path}: str, ${3:scenario_id}: Optional[str], ${4:chunk_size}: int, ${5:progress}: any, ${6:timeout}: any)",
+    documentation: "Download a file and save it to a local path.  The content is streamed to disk in chunks and renamed into place once complete, so large files are never held in memory.  Args:     file_id: The unique identifier of the file.     destination_path: Local file path to save the downloaded content.     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     chunk_size: Bytes read from the connection per write.     progress: Optional callback(bytes_written, total_or_None) per chunk.     timeout: (connect, read) timeouts in seconds.  Returns:     The destination path where the file was saved.",
     detail: "Method: download_scenario_file_to_path",
     sortText: "download_scenario_file_to_path",
   },
+  {
+    label: "download_scenario_file_ranged",
+    kind: CompletionItemKind.Method,
+    insertText: "download_scenario_file_ranged(${1:file_id}: str, ${2:destination_path}: str, ${3:scenario_id}: Optional[str], ${4:part_size}: int, ${5:concurrency}: int, ${6:progress}: any, ${7:timeout}: any)",
+    documentation: "Download a large file in parallel byte ranges, resuming after failures.  Re-running after an interruption only fetches the missing ranges, and an expired presigned URL is refreshed automatically.  Args:     file_id: The unique identifier of the file.     destination_path: Local file path to save the downloaded content.     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     part_size: Bytes per ranged request (default 8 MiB).     concurrency: Maximum ranges in flight.     progress: Optional callback(bytes_on_disk, total).     timeout: (connect, read) timeouts in seconds.  Returns:     The destination path where the file was saved.",
+    detail: "Method: download_scenario_file_ranged",
+    sortText: "download_scenario_file_ranged",
+  },
+  {
+    label: "download_file_by_path_ranged",
+    kind: CompletionItemKind.Method,
+    insertText: "download_file_by_path_ranged(${1:file_path}: str, ${2:destination_path}: str, ${3:part_size}: int, ${4:concurrency}: int, ${5:progress}: any, ${6:timeout}: any)",
+    documentation: "Download a file by its storage path in parallel, resumable ranges.  Args:     file_path: The file path (key) in storage.     destination_path: Local file path to save the downloaded content.     part_size: Bytes per ranged request (default 8 MiB).     concurrency: Maximum ranges in flight.     progress: Optional callback(bytes_on_disk, total).     timeout: (connect, read) timeouts in seconds.  Returns:     The destination path where the file was saved.",
+    detail: "Method: download_file_by_path_ranged",
+    sortText: "download_file_by_path_ranged",
+  },
   {
     label: "create_scenario_file",
     kind: CompletionItemKind.Method,
-    insertText: "create_scenario_file(${1:name}: str, ${2:content}: any, ${3:scenario_id}: Optional[str], ${4:team_id}: Optional[str], ${5:project_id}: Optional[str], ${6:description}: Optional[str], ${7:mime_type}: Optional[str], ${8:folder_id}: Optional[str])",
-    documentation: "Create/upload a new file in a scenario.  Args:     name: The filename (e.g., 'data.json', 'config.yaml').     content: The file content - can be a string, bytes, or file-like object.     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     team_id: Optional team ID. Falls back to DATAMAKER_TEAM_ID env var.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID env var.     description: Optional description of the file.     mime_type: Optional MIME type. If not provided, will be guessed from filename.     folder_id: Optional folder ID to place the file in.  Returns:     The created file metadata dictionary.",
+    insertText: "create_scenario_file(${1:name}: str, ${2:content}: any, ${3:scenario_id}: Optional[str], ${4:team_id}: Optional[str], ${5:project_id}: Optional[str], ${6:description}: Optional[str], ${7:mime_type}: Optional[str], ${8:folder_id}: Optional[str], ${9:folder}: str)",
+    documentation: "Create/upload a new file in a scenario.  Content is streamed to the multipart upload endpoint in chunks, so large file objects are not read into memory. When ``description`` or ``folder_id`` is given, the file is created through the JSON endpoint instead, which stores them but reads the content into memory.  Args:     name: The filename (e.g., 'data.json', 'config.yaml').     content: The file content - can be a string, bytes, or file-like object.     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     team_id: Optional team ID. Falls back to DATAMAKER_TEAM_ID env var.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID env var.     description: Optional description of the file.     mime_type: Optional MIME type. If not provided, will be guessed from filename.     folder_id: Optional folder ID to place the file in.     folder: Folder to upload to (\"uploads\" or \"outputs\", default:         \"uploads\"). Not used when ``description`` or ``folder_id``         is given.  Returns:     The created file metadata dictionary.",
     detail: "Method: create_scenario_file",
     sortText: "create_scenario_file",
   },
@@ -644,6 +708,14 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: upload_scenario_file_from_path",
     sortText: "upload_scenario_file_from_path",
   },
+  {
+    label: "upload_scenario_file_multipart",
+    kind: CompletionItemKind.Method,
+    insertText: "upload_scenario_file_multipart(${1:file_path}: str, ${2:scenario_id}: Optional[str], ${3:name}: Optional[str], ${4:folder}: str, ${5:part_size}: int, ${6:concurrency}: int)",
+    documentation: "Upload a large local file in parallel parts with a final commit.  Parts are retried individually; servers without multipart support get a single upload_scenario_file_from_path request instead.  Args:     file_path: Path to the local file to upload.     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     name: Optional filename. If not provided, uses the original filename.     folder: Folder to upload to (\"uploads\" or \"outputs\", default: \"uploads\").     part_size: Bytes per part (default 8 MiB).     concurrency: Maximum parts in flight.  Returns:     The created file metadata dictionary.",
+    detail: "Method: upload_scenario_file_multipart",
+    sortText: "upload_scenario_file_multipart",
+  },
   {
     label: "delete_scenario_file",
     kind: CompletionItemKind.Method,
@@ -660,6 +732,14 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: read_file_by_path",
     sortText: "read_file_by_path",
   },
+  {
+    label: "map_file_by_path",
+    kind: CompletionItemKind.Method,
+    insertText: "map_file_by_path(${1:file_path}: str, ${2:chunk_size}: int, ${3:timeout}: any)",
+    documentation: "Read a file by its storage path as a read-only memory map.  Requires ``file_cache_dir``. The file is downloaded into the cache once and mapped from there; later calls revalidate it by ETag and return a new zero-copy view, shared across processes using the same cache directory.  Args:     file_path: The file path (key) in storage.     chunk_size: Bytes read from the connection per write.     timeout: (connect, read) timeouts in seconds.  Returns:     A read-only ``memoryview`` over the cached file.  Example:     >>> dm = DataMaker(file_cache_dir=\"/tmp/datamaker-cache\")     >>> view = dm.map_file_by_path(\"scenarios/.../uploads/lookup.csv\")",
+    detail: "Method: map_file_by_path",
+    sortText: "map_file_by_path",
+  },
   {
     label: "read_file_by_path_as_text",
     kind: CompletionItemKind.Method,
@@ -676,6 +756,22 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: save_file",
     sortText: "save_file",
   },
+  {
+    label: "save_directory",
+    kind: CompletionItemKind.Method,
+    insertText: "save_directory(${1:local_dir}: str, ${2:folder}: str, ${3:scenario_id}: Optional[str], ${4:include}: str, ${5:concurrency}: int, ${6:skip_unchanged}: bool)",
+    documentation: "Upload every matching file in a local directory concurrently.  Files already saved with the same name, size and MD5 checksum are skipped; files listed without an MD5 are always uploaded.  Args:     local_dir: Local directory to upload from.     folder: Folder to upload to (\"uploads\" or \"outputs\", default: \"outputs\").     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     include: Glob pattern relative to local_dir (e.g. \"*.csv\", \"**/*.json\").     concurrency: Maximum uploads in flight.     skip_unchanged: Whether to skip files that already match remotely.  Returns:     Dictionary with the ``uploaded`` file metadata and ``skipped`` names.  Example:     >>> dm = DataMaker()     >>> result = dm.save_directory(\"out/run-42\", include=\"*.csv\")",
+    detail: "Method: save_directory",
+    sortText: "save_directory",
+  },
+  {
+    label: "download_folder",
+    kind: CompletionItemKind.Method,
+    insertText: "download_folder(${1:dest_dir}: str, ${2:folder}: str, ${3:scenario_id}: Optional[str], ${4:concurrency}: int, ${5:skip_unchanged}: bool)",
+    documentation: "Download every file in a scenario folder into a local directory.  Local files with the same name, size and MD5 checksum are left as they are; files listed without an MD5 are always downloaded.  Args:     dest_dir: Local directory to download into; created if missing.     folder: Folder to download (\"uploads\" or \"outputs\", default: \"outputs\").     scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.     concurrency: Maximum downloads in flight.     skip_unchanged: Whether to skip files that already match locally.  Returns:     Dictionary with the ``downloaded`` and ``skipped`` local paths.  Example:     >>> dm = DataMaker()     >>> result = dm.download_folder(\"fixtures/\", folder=\"uploads\")",
+    detail: "Method: download_folder",
+    sortText: "download_folder",
+  },
   {
     label: "get_sets",
     kind: CompletionItemKind.Method,
@@ -687,8 +783,8 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
   {
     label: "get_set",
     kind: CompletionItemKind.Method,
-    insertText: "get_set(${1:set_id}: str)",
-    documentation: "Get a single saved set by ID, including its full rows payload.  Args:     set_id: The unique identifier of the set.  Returns:     The set dictionary (including its saved rows in ``data``).",
+    insertText: "get_set(${1:set_id}: str, ${2:columnar}: bool)",
+    documentation: "Get a single saved set by ID, including its full rows payload.  Args:     set_id: The unique identifier of the set.     columnar: Return ``data`` as a ColumnarResult instead of a list of         row dicts. Requires NumPy.  Returns:     The set dictionary (including its saved rows in ``data``).",
     detail: "Method: get_set",
     sortText: "get_set",
   },
@@ -724,6 +820,46 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: save_set",
     sortText: "save_set",
   },
+  {
+    label: "append_set_rows",
+    kind: CompletionItemKind.Method,
+    insertText: "append_set_rows(${1:set_id}: str, ${2:rows}: any)",
+    documentation: "Append rows to a saved set, sending only the new rows.  Args:     set_id: The unique identifier of the set.     rows: The rows to append.  Returns:     The updated set dictionary, or {\"id\": set_id, \"changed\": False}     when there was nothing to append.  Example:     >>> dm = DataMaker()     >>> dm.append_set_rows(\"set-123\", todays_rows)",
+    detail: "Method: append_set_rows",
+    sortText: "append_set_rows",
+  },
+  {
+    label: "patch_set_rows",
+    kind: CompletionItemKind.Method,
+    insertText: "patch_set_rows(${1:set_id}: str, ${2:upserts}: any, ${3:deletes}: any, ${4:key}: str)",
+    documentation: "Insert, replace and delete rows of a saved set by key.  Only the changed rows are sent. On servers that only support full replacement the change is diffed locally and no-op updates are skipped.  Args:     set_id: The unique identifier of the set.     upserts: Rows to insert or replace; each must contain key.     deletes: Key values of rows to remove.     key: The row field identifying a row (default \"id\").  Returns:     The updated set dictionary, or {\"id\": set_id, \"changed\": False}     when the patch changed nothing.  Example:     >>> dm = DataMaker()     >>> dm.patch_set_rows(\"set-123\", upserts=[{\"id\": 7, \"qty\": 2}], deletes=[9])",
+    detail: "Method: patch_set_rows",
+    sortText: "patch_set_rows",
+  },
+  {
+    label: "get_set_rows",
+    kind: CompletionItemKind.Method,
+    insertText: "get_set_rows(${1:set_id}: str, ${2:page}: int, ${3:page_size}: int)",
+    documentation: "Fetch one page of a saved set's rows.  Args:     set_id: The unique identifier of the set.     page: 1-based page number.     page_size: Rows per page.  Returns:     A dictionary with rows, total, page and pageSize.",
+    detail: "Method: get_set_rows",
+    sortText: "get_set_rows",
+  },
+  {
+    label: "iter_set_rows",
+    kind: CompletionItemKind.Method,
+    insertText: "iter_set_rows(${1:set_id}: str, ${2:page_size}: int, ${3:concurrency}: int, ${4:columnar}: bool)",
+    documentation: "Iterate over a saved set's rows, prefetching compressed pages.  Memory stays bounded by the prefetch window however large the set.  Args:     set_id: The unique identifier of the set.     page_size: Rows per page.     concurrency: Maximum pages in flight.     columnar: Yield each page as a ColumnarResult instead of row dicts.  Returns:     An iterator of row dictionaries.",
+    detail: "Method: iter_set_rows",
+    sortText: "iter_set_rows",
+  },
+  {
+    label: "save_set_stream",
+    kind: CompletionItemKind.Method,
+    insertText: "save_set_stream(${1:name}: str, ${2:rows}: any, ${3:description}: Optional[str], ${4:project_id}: Optional[str], ${5:page_size}: int, ${6:concurrency}: int)",
+    documentation: "Save rows from any iterable as a named set in gzip-compressed pages.  Rows are consumed lazily and rowCount is counted as pages upload, so memory stays bounded however many rows are saved.  Args:     name: A name for the saved set.     rows: The rows to save; may be a generator (or, on         AsyncDataMaker, an async iterable).     description: Optional short description of what the set captures.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.     page_size: Rows per uploaded page.     concurrency: Maximum pages in flight.  Returns:     The saved set dictionary.  Example:     >>> dm = DataMaker()     >>> rows = dm.iter_generate_bulk(template, 1_000_000)     >>> result = dm.save_set_stream(\"regression-1m\", rows)",
+    detail: "Method: save_set_stream",
+    sortText: "save_set_stream",
+  },
   {
     label: "get_keymaps",
     kind: CompletionItemKind.Method,
@@ -740,6 +876,14 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: keymap_put",
     sortText: "keymap_put",
   },
+  {
+    label: "keymap_put_bulk",
+    kind: CompletionItemKind.Method,
+    insertText: "keymap_put_bulk(${1:map_name}: str, ${2:object}: str, ${3:entries}: any, ${4:batch_size}: int, ${5:concurrency}: int, ${6:run_id}: Optional[str], ${7:project_id}: Optional[str])",
+    documentation: "Record any number of old-to-new key mappings in parallel batches.  Splits entries into keymap_put calls of at most batch_size pairs and sends up to concurrency of them at once. Failed batches are reported rather than aborting the run.  Args:     map_name: Logical map name, e.g. \"sap-material-migration\".     object: The domain object type, e.g. \"Material\".     entries: A dict or any iterable/generator of (old_key, new_key) pairs         (or, on AsyncDataMaker, an async iterable of pairs).     batch_size: Pairs per request (server-capped at 5000).     concurrency: Maximum batches in flight.     run_id: Optional run/job id that minted these keys.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.  Returns:     A dictionary with mapName, object, upserted (total), batches and     failed (the batches that could not be written, with their entries).  Example:     >>> dm = DataMaker(pool_maxsize=8)     >>> pairs = ((row[\"old\"], row[\"new\"]) for row in rows)     >>> result = dm.keymap_put_bulk(     ...     \"sap-material-migration\", \"Material\", pairs, concurrency=8     ... )",
+    detail: "Method: keymap_put_bulk",
+    sortText: "keymap_put_bulk",
+  },
   {
     label: "keymap_lookup",
     kind: CompletionItemKind.Method,
@@ -748,6 +892,22 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: keymap_lookup",
     sortText: "keymap_lookup",
   },
+  {
+    label: "keymap_lookup_bulk",
+    kind: CompletionItemKind.Method,
+    insertText: "keymap_lookup_bulk(${1:map_name}: str, ${2:object}: str, ${3:old_keys}: any, ${4:batch_size}: int, ${5:concurrency}: int, ${6:project_id}: Optional[str])",
+    documentation: "Translate any number of source-system keys in parallel batches.  Keys are de-duplicated, split into batches of at most batch_size and looked up concurrently; the results are merged.  Args:     map_name: The key map to look up in.     object: The domain object type, e.g. \"Material\".     old_keys: Any iterable or generator of source-system keys (or,         on AsyncDataMaker, an async iterable).     batch_size: Keys per request (server-capped at 5000).     concurrency: Maximum batches in flight.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.  Returns:     A dictionary with mapName, object, mappings (all found keys) and     missing (unique keys with no mapping).",
+    detail: "Method: keymap_lookup_bulk",
+    sortText: "keymap_lookup_bulk",
+  },
+  {
+    label: "iter_keymap_lookup",
+    kind: CompletionItemKind.Method,
+    insertText: "iter_keymap_lookup(${1:map_name}: str, ${2:object}: str, ${3:old_keys}: any, ${4:batch_size}: int, ${5:concurrency}: int, ${6:project_id}: Optional[str])",
+    documentation: "Like keymap_lookup_bulk, but yield each batch's result in order.  Returns:     An iterator of dictionaries with mappings and missing per batch.",
+    detail: "Method: iter_keymap_lookup",
+    sortText: "iter_keymap_lookup",
+  },
   {
     label: "get_keymap_entries",
     kind: CompletionItemKind.Method,
@@ -756,6 +916,22 @@ export const METHOD_SUGGESTIONS: DataMakerMethod[] = [
     detail: "Method: get_keymap_entries",
     sortText: "get_keymap_entries",
   },
+  {
+    label: "iter_keymap_entries",
+    kind: CompletionItemKind.Method,
+    insertText: "iter_keymap_entries(${1:map_name}: str, ${2:object}: Optional[str], ${3:page_size}: int, ${4:concurrency}: int, ${5:project_id}: Optional[str])",
+    documentation: "Iterate over every entry of a key map, prefetching pages concurrently.  Args:     map_name: The key map to read.     object: Optional domain object type filter.     page_size: Entries per page (server-capped at 500).     concurrency: Maximum pages in flight.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.  Returns:     An iterator of entry dictionaries (object, oldKey, newKey).",
+    detail: "Method: iter_keymap_entries",
+    sortText: "iter_keymap_entries",
+  },
+  {
+    label: "export_keymap",
+    kind: CompletionItemKind.Method,
+    insertText: "export_keymap(${1:map_name}: str, ${2:path}: str, ${3:object}: Optional[str], ${4:concurrency}: int, ${5:project_id}: Optional[str])",
+    documentation: "Stream a whole key map into a SQLite snapshot file at path.  Args:     map_name: The key map to export.     path: Destination file path; replaced atomically when complete.     object: Optional domain object type filter.     concurrency: Maximum pages in flight.     project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.  Returns:     A dictionary with mapName, path and entries (count).",
+    detail: "Method: export_keymap",
+    sortText: "export_keymap",
+  },
   {
     label: "delete_keymap",
     kind: CompletionItemKind.Method,
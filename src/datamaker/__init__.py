@@ -1,2 +1,4 @@
 from .main import DataMaker  # noqa
+from .async_main import AsyncDataMaker  # noqa
 from .template import Template  # noqa
+from .columnar import ColumnarResult  # noqa
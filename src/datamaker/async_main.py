@@ -0,0 +1,121 @@
+from typing import Optional
+from .main import DataMaker
+from .routes.async_clients import (
+    AsyncGenerationClient,
+    AsyncTemplatesClient,
+    AsyncApiKeysClient,
+    AsyncConnectionsClient,
+    AsyncProjectsClient,
+    AsyncUsersClient,
+    AsyncTeamsClient,
+    AsyncTeamMembersClient,
+    AsyncCustomDataTypesClient,
+    AsyncEndpointFoldersClient,
+    AsyncEndpointsClient,
+    AsyncTemplateFoldersClient,
+    AsyncShortcutsClient,
+    AsyncFeedbackClient,
+    AsyncExportClient,
+    AsyncValidationClient,
+    AsyncScenarioFilesClient,
+    AsyncSetsClient,
+    AsyncKeyMapsClient,
+)
+from .transport import AsyncTransport
+
+
+class AsyncDataMaker(DataMaker):
+    """Asyncio DataMaker client.
+
+    Exposes the same methods as ``DataMaker``, but every API method returns an
+    awaitable. All route clients share one ``AsyncTransport`` connection pool,
+    so many requests can be in flight from a single event loop.
+
+    Example:
+        >>> async with AsyncDataMaker() as dm:
+        ...     rows, result = await asyncio.gather(
+        ...         dm.generate(template),
+        ...         dm.keymap_lookup("sap-material-migration", "Material", keys),
+        ...     )
+    """
+
+    transport_class = AsyncTransport
+    client_classes = {
+        "generation": AsyncGenerationClient,
+        "templates": AsyncTemplatesClient,
+        "api_keys": AsyncApiKeysClient,
+        "connections": AsyncConnectionsClient,
+        "projects": AsyncProjectsClient,
+        "users": AsyncUsersClient,
+        "teams": AsyncTeamsClient,
+        "team_members": AsyncTeamMembersClient,
+        "custom_data_types": AsyncCustomDataTypesClient,
+        "endpoint_folders": AsyncEndpointFoldersClient,
+        "endpoints": AsyncEndpointsClient,
+        "template_folders": AsyncTemplateFoldersClient,
+        "shortcuts": AsyncShortcutsClient,
+        "feedback": AsyncFeedbackClient,
+        "export": AsyncExportClient,
+        "validation": AsyncValidationClient,
+        "scenario_files": AsyncScenarioFilesClient,
+        "sets": AsyncSetsClient,
+        "keymaps": AsyncKeyMapsClient,
+    }
+
+    def __init__(
+        self,
+        *args,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        **kwargs,
+    ):
+        """Create the client; takes the same options as ``DataMaker``.
+
+        Args:
+            max_connections: Maximum concurrent connections in the httpx pool
+                (default 100), used instead of ``DataMaker``'s
+                ``pool_connections`` and ``pool_maxsize``.
+            max_keepalive_connections: Idle connections kept open for reuse
+                (default 20).
+
+        Raises:
+            ValueError: If ``transport`` is given together with transport
+                options, or ``pool_connections``/``pool_maxsize`` are passed.
+        """
+        pool_options = sorted({"pool_connections", "pool_maxsize"}.intersection(kwargs))
+        if pool_options:
+            raise ValueError(
+                f"{', '.join(pool_options)} do not apply to AsyncDataMaker; "
+                "use max_connections and max_keepalive_connections"
+            )
+        self._pool_options = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+        }
+        super().__init__(*args, **kwargs)
+
+    def _transport_options(self, transport, options):
+        return super()._transport_options(transport, {**options, **self._pool_options})
+
+    def _create_transport(self, verify, **options):
+        return self.transport_class(verify=verify, **options)
+
+    async def close(self):
+        """Close the pooled connections held by the shared transport."""
+        await self.transport.aclose()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with AsyncDataMaker()' instead of 'with'.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # =================== GENERATION METHODS ===================
+    async def generate_from_template_id(self, template_id: str, quantity: int = 10):
+        """Generate data from a template ID with specified quantity."""
+        template = await self._templates.get_template_by_id(template_id)
+        template["quantity"] = quantity
+        return await self.generate(template)
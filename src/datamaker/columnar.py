@@ -0,0 +1,294 @@
+"""Column-oriented results for large generations and sets.
+
+Rows are collected straight into one buffer per column as they are parsed,
+so a million-row result costs a few arrays rather than a million dicts with
+repeated key strings. Requires NumPy (install with
+``pip install "datamaker-py[columnar]"``); ``to_pandas`` and ``to_arrow``
+additionally need pandas or pyarrow.
+"""
+
+from array import array
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List
+from typing import Optional, Union
+from .error import DataMakerError
+
+COLUMNAR_BATCH_SIZE = 10_000
+
+# Template field types collected into compact typed buffers; every other type
+# is kept as a NumPy object array
+FIELD_TYPECODES = {"Number": "q", "Float": "d", "Boolean": "b"}
+_DTYPES = {"q": "int64", "d": "float64", "b": "int8"}
+
+Schema = Dict[str, str]
+
+
+def _require(module: str, extra: str):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise DataMakerError(
+            f"Columnar results require {module}. Install it with "
+            f"'pip install {extra}'."
+        )
+
+
+def _numpy():
+    return _require("numpy", '"datamaker-py[columnar]"')
+
+
+def schema_from_template(template) -> Schema:
+    """Map each field name of a ``Template`` or template dict to its type."""
+    payload = template.to_dict() if hasattr(template, "to_dict") else template
+    return {
+        field["name"]: field.get("type")
+        for field in (payload or {}).get("fields") or []
+        if isinstance(field, dict) and "name" in field
+    }
+
+
+def _infer_typecode(value) -> Optional[str]:
+    if isinstance(value, bool):
+        return "b"
+    if isinstance(value, int):
+        return "q"
+    if isinstance(value, float):
+        return "d"
+    return None
+
+
+def _widen(column: Union[array, list], value) -> Union[array, list]:
+    """Return ``column`` with ``value`` appended when its buffer cannot hold it."""
+    if not isinstance(column, array):
+        widened = column
+    elif column.typecode == "q" and isinstance(value, float):
+        widened = array("d", column)
+    else:
+        widened = column.tolist()
+        if column.typecode == "b":
+            widened = [bool(item) for item in widened]
+    widened.append(value)
+    return widened
+
+
+class ColumnarResult:
+    """Rows held as one array per column instead of one dict per row.
+
+    Columns of ``Number``, ``Float`` and ``Boolean`` fields (or, without a
+    template, columns whose values are all ints, floats or bools) are typed
+    ``int64``, ``float64`` and ``bool`` NumPy arrays. A column that mixes in
+    other values, such as nulls, falls back to an ``object`` array.
+
+    Args:
+        columns: Mapping of column name to NumPy array, in column order.
+        length: Number of rows; taken from the columns when omitted.
+
+    Example:
+        >>> result = dm.generate(template, columnar=True)
+        >>> result["price"].mean()
+        >>> df = result.to_pandas()
+    """
+
+    def __init__(
+        self, columns: Dict[str, "numpy.ndarray"], length: Optional[int] = None
+    ):
+        self.columns = columns
+        if length is None:
+            length = len(next(iter(columns.values()))) if columns else 0
+        self.length = length
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Dict], schema: Optional[Schema] = None
+    ) -> "ColumnarResult":
+        """Build a result from row dictionaries, consuming ``rows`` lazily.
+
+        Args:
+            rows: Row dictionaries; may be a generator.
+            schema: Optional field types by column name, e.g. from
+                ``schema_from_template``.
+        """
+        builder = ColumnBuilder(schema)
+        for row in rows:
+            builder.append(row)
+        return builder.build()
+
+    @classmethod
+    def concat(cls, results: Iterable["ColumnarResult"]) -> "ColumnarResult":
+        """Join results end to end, e.g. the batches of a streaming iterator.
+
+        Columns missing from some results are filled with None there.
+        """
+        np = _numpy()
+        results = list(results)
+        names = dict.fromkeys(name for result in results for name in result.columns)
+        columns = {}
+        for name in names:
+            parts = [
+                result.columns.get(name, np.full(len(result), None, dtype=object))
+                for result in results
+            ]
+            columns[name] = np.concatenate(parts)
+        return cls(columns, sum(len(result) for result in results))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> "numpy.ndarray":
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(rows={self.length}, columns={self.column_names})"
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    def iter_rows(self) -> Iterator[Dict]:
+        """Yield the rows as dictionaries of plain Python values."""
+        if not self.columns:
+            for _ in range(self.length):
+                yield {}
+            return
+        names = self.column_names
+        for values in zip(*(column.tolist() for column in self.columns.values())):
+            yield dict(zip(names, values))
+
+    def to_rows(self) -> List[Dict]:
+        """Return the rows as a list of dictionaries."""
+        return list(self.iter_rows())
+
+    def to_pandas(self):
+        """Return a ``pandas.DataFrame`` sharing memory with the typed columns.
+
+        Raises:
+            DataMakerError: If pandas is not installed.
+        """
+        pandas = _require("pandas", "pandas")
+        return pandas.DataFrame(
+            self.columns, index=pandas.RangeIndex(self.length), copy=False
+        )
+
+    def to_arrow(self):
+        """Return a ``pyarrow.Table``.
+
+        ``int64`` and ``float64`` columns are wrapped without copying;
+        booleans are bit-packed and text is encoded into Arrow strings.
+
+        Raises:
+            DataMakerError: If pyarrow is not installed.
+        """
+        pyarrow = _require("pyarrow", "pyarrow")
+        return pyarrow.table(
+            {name: pyarrow.array(column) for name, column in self.columns.items()}
+        )
+
+
+class ColumnBuilder:
+    """Collects rows into per-column buffers as they arrive.
+
+    Typed columns are appended to ``array.array`` buffers, which NumPy wraps
+    without copying when the result is built. The builder is empty again
+    after ``build``, so it can collect the next batch.
+
+    Args:
+        schema: Optional field types by column name. Columns not named in
+            it are typed from their first value.
+
+    Raises:
+        DataMakerError: If NumPy is not installed.
+    """
+
+    def __init__(self, schema: Optional[Schema] = None):
+        self._np = _numpy()
+        self.schema = schema or {}
+        self._columns: Dict[str, Union[array, list]] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, row: Dict) -> None:
+        """Add one row."""
+        columns = self._columns
+        if row.keys() != columns.keys():
+            self._align(row)
+        for name, value in row.items():
+            try:
+                columns[name].append(value)
+            except (TypeError, OverflowError):
+                columns[name] = _widen(columns[name], value)
+        self._length += 1
+
+    def _align(self, row: Dict) -> None:
+        """Add columns first seen in ``row`` and pad those it lacks."""
+        for name in row:
+            if name in self._columns:
+                continue
+            if self._length:
+                # Earlier rows did not have this column
+                self._columns[name] = [None] * self._length
+                continue
+            if name in self.schema:
+                typecode = FIELD_TYPECODES.get(self.schema[name])
+            else:
+                typecode = _infer_typecode(row[name])
+            self._columns[name] = array(typecode) if typecode else []
+        for name, column in self._columns.items():
+            if name not in row:
+                self._columns[name] = _widen(column, None)
+
+    def build(self) -> ColumnarResult:
+        """Return the rows collected so far and reset the builder."""
+        columns, length = self._columns, self._length
+        self._columns, self._length = {}, 0
+        return ColumnarResult(
+            {name: self._to_numpy(column) for name, column in columns.items()}, length
+        )
+
+    def _to_numpy(self, column: Union[array, list]) -> "numpy.ndarray":
+        np = self._np
+        if not isinstance(column, array):
+            return np.fromiter(column, dtype=object, count=len(column))
+        values = np.frombuffer(column, dtype=_DTYPES[column.typecode])
+        if column.typecode != "b":
+            return values
+        if ((values == 0) | (values == 1)).all():
+            return values.view(bool)
+        return np.fromiter(column.tolist(), dtype=object, count=len(column))
+
+
+def iter_columnar(
+    rows: Iterable[Dict],
+    batch_size: int = COLUMNAR_BATCH_SIZE,
+    schema: Optional[Schema] = None,
+) -> Iterator[ColumnarResult]:
+    """Group ``rows`` into ``ColumnarResult`` batches of up to ``batch_size``."""
+    if batch_size < 1:
+        raise DataMakerError("batch_size must be at least 1.")
+    builder = ColumnBuilder(schema)
+    for row in rows:
+        builder.append(row)
+        if len(builder) == batch_size:
+            yield builder.build()
+    if len(builder):
+        yield builder.build()
+
+
+async def aiter_columnar(
+    rows: AsyncIterable[Dict],
+    batch_size: int = COLUMNAR_BATCH_SIZE,
+    schema: Optional[Schema] = None,
+) -> AsyncIterator[ColumnarResult]:
+    """Like ``iter_columnar``, for an async iterable of rows."""
+    if batch_size < 1:
+        raise DataMakerError("batch_size must be at least 1.")
+    builder = ColumnBuilder(schema)
+    async for row in rows:
+        builder.append(row)
+        if len(builder) == batch_size:
+            yield builder.build()
+    if len(builder):
+        yield builder.build()
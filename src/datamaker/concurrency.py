@@ -0,0 +1,142 @@
+"""Helpers for fanning API calls out over the pooled transport."""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+AnyIterable = Union[Iterable[T], AsyncIterable[T]]
+
+
+def imap_ordered(
+    fn: Callable[[T], R], items: Iterable[T], concurrency: int
+) -> Iterator[R]:
+    """Apply ``fn`` to ``items`` on a thread pool, yielding results in order.
+
+    ``items`` is consumed lazily and at most ``concurrency`` calls are in flight
+    at once, so arbitrarily long generators can be processed with bounded
+    memory. If ``fn`` raises, the exception propagates from the position of the
+    failing item and calls that have not started yet are cancelled.
+
+    Args:
+        fn: Function to call for each item.
+        items: Items to process; may be a generator.
+        concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        An iterator over ``fn(item)`` for each item, in input order.
+    """
+    concurrency = max(1, concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= concurrency:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def aimap_ordered(
+    fn: Callable[[T], Awaitable[R]], items: AnyIterable[T], concurrency: int
+) -> AsyncIterator[R]:
+    """Asyncio counterpart of ``imap_ordered`` for coroutine functions.
+
+    ``items`` may be a sync or an async iterable.
+    """
+    concurrency = max(1, concurrency)
+    pending = deque()
+    try:
+        async for item in aiterate(items):
+            pending.append(asyncio.ensure_future(fn(item)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split ``items`` lazily into lists of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def unique(items: Iterable[T]) -> Iterator[T]:
+    """Lazily yield the first occurrence of each item."""
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+async def aiterate(items: AnyIterable[T]) -> AsyncIterator[T]:
+    """Iterate a sync or an async iterable from a coroutine."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def abatched(items: AnyIterable[T], size: int) -> AsyncIterator[List[T]]:
+    """Async ``batched`` over a sync or an async iterable."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    batch = []
+    async for item in aiterate(items):
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def aenumerate(
+    items: AnyIterable[T], start: int = 0
+) -> AsyncIterator[Tuple[int, T]]:
+    """Async ``enumerate`` over a sync or an async iterable."""
+    index = start
+    async for item in aiterate(items):
+        yield index, item
+        index += 1
+
+
+async def aunique(items: AnyIterable[T]) -> AsyncIterator[T]:
+    """Async ``unique`` over a sync or an async iterable."""
+    seen = set()
+    async for item in aiterate(items):
+        if item not in seen:
+            seen.add(item)
+            yield item
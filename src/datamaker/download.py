@@ -0,0 +1,337 @@
+"""Streaming, ranged and resumable downloads of presigned storage URLs."""
+
+import calendar
+import json
+import os
+import re
+import threading
+import time
+import requests
+from typing import Callable, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlparse
+from .concurrency import imap_ordered
+from .error import DataMakerError
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# (connect, read) seconds: a large download may take any time overall, as
+# long as bytes keep arriving
+DEFAULT_DOWNLOAD_TIMEOUT = (10.0, 60.0)
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+DEFAULT_PART_RETRIES = 3
+
+# Storage answers an expired presigned URL with one of these
+EXPIRED_URL_STATUSES = (400, 401, 403)
+MAX_URL_REFRESHES = 2
+# A cached presigned URL is replaced this many seconds before it expires
+URL_EXPIRY_MARGIN = 60.0
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+_CONTENT_RANGE = re.compile(r"bytes (?:\d+-\d+|\*)/(\d+)")
+
+
+def _parse_timestamp(value: str, formats: Tuple[str, ...]) -> Optional[float]:
+    for fmt in formats:
+        try:
+            return float(calendar.timegm(time.strptime(value, fmt)))
+        except ValueError:
+            continue
+    return None
+
+
+def presigned_url_expiry(url: str) -> Optional[float]:
+    """Return when a presigned URL expires, in epoch seconds, if it says.
+
+    Understands the query parameters of S3 (SigV4 ``X-Amz-Date`` plus
+    ``X-Amz-Expires`` and SigV2 ``Expires``), Google Cloud Storage
+    (``X-Goog-Date`` plus ``X-Goog-Expires``) and Azure SAS (``se``) URLs.
+
+    Args:
+        url: The presigned URL.
+
+    Returns:
+        The expiry as a Unix timestamp, or None if it cannot be determined.
+    """
+    query = {name.lower(): value for name, value in parse_qsl(urlparse(url).query)}
+    for prefix in ("x-amz-", "x-goog-"):
+        signed_at, expires = query.get(prefix + "date"), query.get(prefix + "expires")
+        if signed_at and expires and expires.isdigit():
+            start = _parse_timestamp(signed_at, ("%Y%m%dT%H%M%SZ",))
+            return None if start is None else start + int(expires)
+    if query.get("expires", "").isdigit():
+        return float(query["expires"])
+    if query.get("se"):
+        return _parse_timestamp(
+            query["se"], ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%MZ", "%Y-%m-%d")
+        )
+    return None
+
+
+class PartialFile:
+    """Writes to ``path + ".part"`` and renames it to ``path`` on success."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.partial_path = f"{path}.part"
+        self.written = 0
+
+    def __enter__(self):
+        self._file = open(self.partial_path, "wb")
+        return self
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self.written += len(data)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None:
+            os.replace(self.partial_path, self.path)
+        elif os.path.exists(self.partial_path):
+            os.remove(self.partial_path)
+
+
+class _IncompleteDownload(DataMakerError):
+    """The connection ended before all announced bytes arrived."""
+
+
+def check_complete(written: int, total: Optional[int]) -> None:
+    """Raise if fewer bytes arrived than the server announced."""
+    if total is not None and written != total:
+        raise _IncompleteDownload(
+            f"Download incomplete: received {written} of {total} bytes"
+        )
+
+
+class RangedDownload:
+    """Download a presigned URL in byte ranges, in parallel and resumably.
+
+    The object is split into ``part_size`` ranges that are fetched with up to
+    ``concurrency`` requests at once and written in place into a preallocated
+    ``path + ".part"`` file. Completed parts are recorded in a
+    ``path + ".part.json"`` sidecar, so running the same download again after
+    a failure only fetches the missing parts (as long as the object's size and
+    ETag are unchanged). When the presigned URL expires mid-transfer a fresh
+    one is requested from ``presigned_url``. Servers that ignore ``Range``
+    get a plain streamed download.
+
+    Args:
+        transport: Transport used for the storage requests.
+        presigned_url: Callable returning a fresh presigned URL.
+        path: Destination file path; replaced atomically when complete.
+        part_size: Bytes per ranged request.
+        concurrency: Maximum parts in flight.
+        chunk_size: Bytes read from the connection per write.
+        progress: Optional callback with bytes on disk and the total size.
+        timeout: ``(connect, read)`` timeouts in seconds.
+        part_retries: Retries per part after connection errors.
+        not_found_message: Error message when storage answers 404.
+    """
+
+    def __init__(
+        self,
+        transport,
+        presigned_url: Callable[[], str],
+        path: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        timeout: Tuple[float, float] = DEFAULT_DOWNLOAD_TIMEOUT,
+        part_retries: int = DEFAULT_PART_RETRIES,
+        not_found_message: str = "File not found",
+    ):
+        if part_size < 1:
+            raise DataMakerError("part_size must be at least 1.")
+        self.transport = transport
+        self.presigned_url = presigned_url
+        self.path = path
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.timeout = timeout
+        self.part_retries = part_retries
+        self.not_found_message = not_found_message
+
+        self.partial_path = f"{path}.part"
+        self.state_path = f"{path}.part.json"
+        self.url = None
+        self.size = None
+        self.etag = None
+        self.done: Set[int] = set()
+        self.written = 0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def run(self) -> str:
+        """Download the object and return the destination path."""
+        self.url = self.presigned_url()
+        response = self._request(0, 0)
+        try:
+            if response.status_code == 200:
+                # Range is not supported: take the whole body from this response
+                self._save_whole(response)
+                return self.path
+            if response.status_code == 416:
+                self.size = self._total_size(response)
+            elif response.status_code == 206:
+                self.size = self._total_size(response)
+                self.etag = response.headers.get("ETag")
+            else:
+                self._raise_for_status(response)
+        finally:
+            response.close()
+
+        self._prepare()
+        parts = [
+            (index, start, min(start + self.part_size, self.size) - 1)
+            for index, start in enumerate(range(0, self.size, self.part_size))
+            if index not in self.done
+        ]
+        for _ in imap_ordered(self._download_part, parts, self.concurrency):
+            pass
+
+        os.replace(self.partial_path, self.path)
+        os.remove(self.state_path)
+        return self.path
+
+    def _request(self, start: int, end: int):
+        """GET a byte range, refreshing an expired presigned URL as needed."""
+        refreshes = 0
+        while True:
+            url = self.url
+            response = self.transport.request(
+                "GET",
+                url,
+                headers={"Range": f"bytes={start}-{end}"},
+                stream=True,
+                timeout=self.timeout,
+            )
+            if (
+                response.status_code not in EXPIRED_URL_STATUSES
+                or refreshes >= MAX_URL_REFRESHES
+            ):
+                return response
+            response.close()
+            self._refresh(url)
+            refreshes += 1
+
+    def _refresh(self, stale_url: str) -> None:
+        """Fetch a new presigned URL unless another part already did."""
+        with self._refresh_lock:
+            if self.url == stale_url:
+                self.url = self.presigned_url()
+
+    def _raise_for_status(self, response) -> None:
+        if response.status_code == 404:
+            raise DataMakerError(self.not_found_message)
+        raise DataMakerError(
+            f"Failed to download file: HTTP {response.status_code}"
+        )
+
+    @staticmethod
+    def _total_size(response) -> int:
+        match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if not match:
+            raise DataMakerError(
+                "Storage returned a range without a Content-Range size."
+            )
+        return int(match.group(1))
+
+    def _save_whole(self, response) -> None:
+        length = response.headers.get("Content-Length")
+        total = int(length) if length and length.isdigit() else None
+        with PartialFile(self.path) as f:
+            for chunk in response.iter_content(self.chunk_size):
+                f.write(chunk)
+                if self.progress:
+                    self.progress(f.written, total)
+            check_complete(f.written, total)
+
+    def _prepare(self) -> None:
+        """Resume from a matching sidecar, or preallocate a fresh part file."""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+
+        resumable = (
+            state.get("size") == self.size
+            and state.get("etag") == self.etag
+            and state.get("partSize") == self.part_size
+            and os.path.exists(self.partial_path)
+            and os.path.getsize(self.partial_path) == self.size
+        )
+        if resumable:
+            self.done = set(state.get("done", []))
+            self.written = sum(
+                min(self.part_size, self.size - index * self.part_size)
+                for index in self.done
+            )
+            if self.progress and self.written:
+                self.progress(self.written, self.size)
+        else:
+            with open(self.partial_path, "wb") as f:
+                f.truncate(self.size)
+            self.done = set()
+            self.written = 0
+        self._save_state()
+
+    def _save_state(self) -> None:
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "size": self.size,
+                    "etag": self.etag,
+                    "partSize": self.part_size,
+                    "done": sorted(self.done),
+                },
+                f,
+            )
+        os.replace(tmp_path, self.state_path)
+
+    def _advance(self, count: int) -> None:
+        with self._lock:
+            self.written += count
+            if self.progress:
+                self.progress(self.written, self.size)
+
+    def _download_part(self, part: Tuple[int, int, int]) -> int:
+        """Fetch one range into the part file, retrying transient failures."""
+        index, start, end = part
+        attempt = 0
+        while True:
+            written = 0
+            try:
+                response = self._request(start, end)
+                try:
+                    if response.status_code != 206:
+                        self._raise_for_status(response)
+                    etag = response.headers.get("ETag")
+                    if self.etag and etag and etag != self.etag:
+                        raise DataMakerError("File changed during download.")
+                    with open(self.partial_path, "r+b") as f:
+                        f.seek(start)
+                        for chunk in response.iter_content(self.chunk_size):
+                            f.write(chunk)
+                            written += len(chunk)
+                            self._advance(len(chunk))
+                finally:
+                    response.close()
+                check_complete(written, end - start + 1)
+            except (requests.RequestException, _IncompleteDownload):
+                self._advance(-written)
+                if attempt >= self.part_retries:
+                    raise
+                time.sleep(self.transport.retry.backoff(attempt))
+                attempt += 1
+                continue
+
+            with self._lock:
+                self.done.add(index)
+                self._save_state()
+            return index
@@ -1,2 +1,16 @@
+from typing import Optional
+
+
 class DataMakerError(Exception):
-    pass
+    def __init__(
+        self,
+        message: str = "",
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ):
+        super().__init__(message)
+        # HTTP status of the failed API response, when there was one
+        self.status_code = status_code
+        # The response's Retry-After header, so callers retrying on their own
+        # wait as long as the server asked
+        self.retry_after = retry_after
@@ -0,0 +1,163 @@
+"""On-disk cache of downloaded file contents, validated by ETag."""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import uuid
+from typing import Dict, Optional
+
+
+class FileCache:
+    """Keeps downloaded file contents in a local directory.
+
+    Each entry is stored under a hash of its file key, together with the
+    storage ``ETag`` and size it was downloaded with. Callers revalidate an
+    entry by sending the ETag as ``If-None-Match`` and serve the cached copy
+    when storage answers ``304 Not Modified``. Content files are written once
+    under a unique name and published with an atomic rename of the entry's
+    metadata. Several processes can therefore share one cache directory, and
+    a memory map from ``open_mmap`` stays valid after a newer version
+    replaces it.
+
+    Args:
+        directory: Cache directory (``~`` is expanded); created if missing.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{self._digest(key)}.json")
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for ``key`` (``etag``, ``size``, ``path``).
+
+        Returns:
+            The entry, or None if nothing usable is cached.
+        """
+        try:
+            with open(self._meta_path(key)) as f:
+                entry = json.load(f)
+            path = os.path.join(self.directory, entry["file"])
+            if os.path.getsize(path) != entry["size"]:
+                return None
+        except (OSError, ValueError, KeyError):
+            return None
+        return {"etag": entry["etag"], "size": entry["size"], "path": path}
+
+    def read(self, entry: Dict) -> bytes:
+        """Return the content of an entry returned by ``lookup``."""
+        with open(entry["path"], "rb") as f:
+            return f.read()
+
+    def open_mmap(self, entry: Dict) -> memoryview:
+        """Map an entry's content read-only into memory.
+
+        The pages are shared with every other process mapping the same
+        cached file, and slicing the returned view does not copy.
+
+        Args:
+            entry: An entry returned by ``lookup`` or ``store``.
+
+        Returns:
+            A read-only ``memoryview`` over the mapped file.
+        """
+        if entry["size"] == 0:
+            # Empty files cannot be mapped
+            return memoryview(b"")
+        with open(entry["path"], "rb") as f:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def store(self, key: str, content: bytes, etag: Optional[str]) -> Dict:
+        """Cache ``content`` for ``key`` as downloaded with ``etag``.
+
+        Returns:
+            The new entry, as ``lookup`` would return it.
+        """
+        with self.writer(key, etag) as writer:
+            writer.write(content)
+        return writer.entry
+
+    def writer(self, key: str, etag: Optional[str]) -> "CacheWriter":
+        """Return a context manager that streams a new version of ``key`` to disk.
+
+        The version becomes visible to ``lookup`` only when the block exits
+        without an exception.
+        """
+        return CacheWriter(self, key, etag)
+
+    def _commit(self, key: str, etag: Optional[str], tmp_path: str, size: int) -> Dict:
+        """Publish a fully written content file as the entry for ``key``."""
+        previous = self.lookup(key)
+        name = f"{self._digest(key)}-{uuid.uuid4().hex[:16]}.bin"
+        path = os.path.join(self.directory, name)
+        os.replace(tmp_path, path)
+
+        fd, meta_tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"etag": etag, "size": size, "file": name}, f)
+        os.replace(meta_tmp, self._meta_path(key))
+
+        if previous:
+            self._remove(previous["path"])
+        return {"etag": etag, "size": size, "path": path}
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def pop(self, key: str) -> None:
+        """Drop the entry for ``key`` if present."""
+        entry = self.lookup(key)
+        self._remove(self._meta_path(key))
+        if entry:
+            self._remove(entry["path"])
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        for name in os.listdir(self.directory):
+            if name.endswith((".json", ".bin")):
+                self._remove(os.path.join(self.directory, name))
+
+
+class CacheWriter:
+    """Streams one new version of a ``FileCache`` entry to a temporary file.
+
+    Use through ``FileCache.writer``. After a successful ``with`` block the
+    published entry is available as ``entry``.
+    """
+
+    def __init__(self, cache: FileCache, key: str, etag: Optional[str]):
+        self.cache = cache
+        self.key = key
+        self.etag = etag
+        self.written = 0
+        self.entry: Optional[Dict] = None
+
+    def __enter__(self):
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.cache.directory, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        return self
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self.written += len(data)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None:
+            self.entry = self.cache._commit(
+                self.key, self.etag, self._tmp_path, self.written
+            )
+        else:
+            self.cache._remove(self._tmp_path)
@@ -0,0 +1,235 @@
+"""Offline key map store backed by SQLite.
+
+``LocalKeyMap`` answers ``lookup`` in the same ``{mappings, missing}`` shape
+as ``KeyMapsClient.keymap_lookup`` without any API access, e.g. for
+air-gapped validation runs. Entries live in an indexed SQLite table on disk,
+so maps with tens of millions of entries are queried without loading them
+into Python.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .concurrency import batched
+from .error import DataMakerError
+
+# Rows per executemany() when loading, and keys per IN (...) query when
+# looking up (kept under SQLite's default bound-parameter limit)
+LOAD_BATCH_SIZE = 5000
+LOOKUP_BATCH_SIZE = 500
+
+Entries = Union[Dict[str, str], Iterable[Union[Dict, Tuple[str, str]]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    object TEXT NOT NULL,
+    old_key TEXT NOT NULL,
+    new_key TEXT NOT NULL,
+    PRIMARY KEY (object, old_key)
+) WITHOUT ROWID;
+-- Lookups without an object only constrain old_key
+CREATE INDEX IF NOT EXISTS entries_old_key ON entries (old_key);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class LocalKeyMap:
+    """Indexed local mirror of a key map.
+
+    Entries are unique per (object, old key) and the last write wins, as on
+    the server. The file written by ``DataMaker.export_keymap`` can be opened
+    directly.
+
+    Args:
+        path: SQLite file to open or create. Defaults to an in-memory store.
+        bulk_load: Disable SQLite's journal and fsyncs for faster loading.
+            Only use for files that are discarded if loading fails.
+
+    Example:
+        >>> dm.export_keymap("sap-material-migration", "materials.sqlite")
+        >>> with LocalKeyMap("materials.sqlite") as keymap:
+        ...     keymap.lookup(["MAT-001", "MAT-999"], object="Material")
+        {'mappings': {'MAT-001': '700001'}, 'missing': ['MAT-999']}
+    """
+
+    def __init__(self, path: str = ":memory:", bulk_load: bool = False):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if bulk_load:
+            self._conn.execute("PRAGMA journal_mode = OFF")
+            self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, entries: Entries, object: Optional[str] = None) -> int:
+        """Insert or overwrite entries.
+
+        Args:
+            entries: Entry dictionaries as returned by ``get_keymap_entries``
+                or ``iter_keymap_entries`` (``object``, ``oldKey``,
+                ``newKey``), a dict of old key to new key, or
+                ``(old_key, new_key)`` pairs. Consumed lazily.
+            object: Object type for entries that do not carry one.
+
+        Returns:
+            The number of entries written.
+        """
+        if isinstance(entries, dict):
+            entries = entries.items()
+
+        def rows():
+            for entry in entries:
+                if isinstance(entry, dict):
+                    yield (
+                        entry.get("object") or object or "",
+                        entry["oldKey"],
+                        entry["newKey"],
+                    )
+                else:
+                    old_key, new_key = entry
+                    yield (object or "", old_key, new_key)
+
+        count = 0
+        for batch in batched(rows(), LOAD_BATCH_SIZE):
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", batch
+                )
+            count += len(batch)
+        return count
+
+    def load_pages(self, pages: Iterable[Dict]) -> int:
+        """Insert the entries of ``get_keymap_entries`` page responses."""
+        return self.add(entry for page in pages for entry in page.get("entries", []))
+
+    def load_file(self, path: str, object: Optional[str] = None) -> int:
+        """Insert entries from a CSV, JSON Lines or SQLite snapshot file.
+
+        CSV files need a header with ``oldKey`` and ``newKey`` (or
+        ``old_key``/``new_key``) and an optional ``object`` column. JSON Lines
+        files hold one entry dictionary per line. ``.sqlite``/``.db`` files
+        are snapshots written by ``export_keymap``.
+
+        Args:
+            path: The file to load.
+            object: Object type for entries that do not carry one.
+
+        Returns:
+            The number of entries written.
+
+        Raises:
+            DataMakerError: If the file type is not supported or a CSV file
+                lacks the key columns.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            with open(path, newline="", encoding="utf-8") as f:
+                return self.add(self._csv_entries(csv.DictReader(f)), object)
+        if extension in (".jsonl", ".ndjson"):
+            with open(path, encoding="utf-8") as f:
+                return self.add((json.loads(line) for line in f if line.strip()), object)
+        if extension in (".sqlite", ".sqlite3", ".db"):
+            return self._attach_snapshot(path)
+        raise DataMakerError(
+            f"Unsupported key map file type '{extension}'; "
+            "expected .csv, .jsonl, .ndjson, .sqlite, .sqlite3 or .db."
+        )
+
+    @staticmethod
+    def _csv_entries(reader: csv.DictReader) -> Iterator[Dict]:
+        fields = reader.fieldnames or []
+        old_column = "oldKey" if "oldKey" in fields else "old_key"
+        new_column = "newKey" if "newKey" in fields else "new_key"
+        if old_column not in fields or new_column not in fields:
+            raise DataMakerError(
+                "CSV key map files need oldKey and newKey columns."
+            )
+        for row in reader:
+            yield {
+                "object": row.get("object"),
+                "oldKey": row[old_column],
+                "newKey": row[new_column],
+            }
+
+    def _attach_snapshot(self, path: str) -> int:
+        with self._conn:
+            self._conn.execute("ATTACH DATABASE ? AS snapshot", (path,))
+        try:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "SELECT object, old_key, new_key FROM snapshot.entries"
+                )
+            return cursor.rowcount
+        finally:
+            self._conn.execute("DETACH DATABASE snapshot")
+
+    def lookup(self, old_keys: Iterable[str], object: Optional[str] = None) -> Dict:
+        """Translate old keys to new keys from the local store.
+
+        Args:
+            old_keys: Keys to translate; any iterable, duplicates allowed.
+            object: The domain object type. ``None`` matches any object,
+                which is only unambiguous for single-object maps.
+
+        Returns:
+            A dictionary with ``mappings`` (old key to new key for the keys
+            that were found) and ``missing`` (keys with no mapping).
+        """
+        mappings: Dict[str, str] = {}
+        missing: List[str] = []
+        unique = dict.fromkeys(old_keys)
+        for batch in batched(unique, LOOKUP_BATCH_SIZE):
+            params = list(batch) if object is None else [*batch, object]
+            query = self._lookup_query(len(batch), object is not None)
+            found = dict(self._conn.execute(query, params).fetchall())
+            for old_key in batch:
+                if old_key in found:
+                    mappings[old_key] = found[old_key]
+                else:
+                    missing.append(old_key)
+        return {"mappings": mappings, "missing": missing}
+
+    @staticmethod
+    def _lookup_query(count: int, by_object: bool) -> str:
+        """SQL selecting ``count`` old keys, optionally within one object."""
+        placeholders = ", ".join("?" * count)
+        query = (
+            f"SELECT old_key, new_key FROM entries WHERE old_key IN ({placeholders})"
+        )
+        if by_object:
+            query += " AND object = ?"
+        return query
+
+    def get(
+        self, old_key: str, object: Optional[str] = None, default: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the new key for a single old key, or ``default``."""
+        return self.lookup([old_key], object)["mappings"].get(old_key, default)
+
+    @property
+    def meta(self) -> Dict[str, str]:
+        """Snapshot metadata, e.g. ``mapName`` and ``entryCount``."""
+        return dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def set_meta(self, **values: str) -> None:
+        """Store snapshot metadata."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [(key, str(value)) for key, value in values.items()],
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,9 +1,18 @@
 import os
 from dotenv import load_dotenv
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 from .routes.base import BaseClient
-from .routes.generation import GenerationClient
-from .routes.templates import TemplatesClient
+from .routes.generation import (
+    GenerationClient,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_CHUNK_RETRIES,
+)
+from .routes.templates import (
+    TemplatesClient,
+    DEFAULT_TEMPLATE_CACHE_SIZE,
+    DEFAULT_TEMPLATE_CACHE_TTL,
+)
 from .routes.api_keys import ApiKeysClient
 from .routes.connections import ConnectionsClient
 from .routes.projects import ProjectsClient
@@ -20,9 +29,41 @@ from .routes.folders_and_utils import (
     FeedbackClient,
 )
 from .routes.export_and_validation import ExportClient, ValidationClient
-from .routes.scenario_files import ScenarioFilesClient
-from .routes.sets import SetsClient
-from .routes.keymaps import KeyMapsClient
+from .routes.scenario_files import (
+    ScenarioFilesClient,
+    DEFAULT_TRANSFER_CONCURRENCY,
+    DEFAULT_UPLOAD_CONCURRENCY,
+    DEFAULT_URL_CACHE_SIZE,
+    DEFAULT_UPLOAD_PART_SIZE,
+)
+from .routes.sets import (
+    SetsClient,
+    DEFAULT_SET_CACHE_SIZE,
+    DEFAULT_SET_CACHE_TTL,
+    DEFAULT_SET_CONCURRENCY,
+    SET_PAGE_SIZE,
+)
+from .routes.keymaps import (
+    KeyMapsClient,
+    KEYMAP_BATCH_LIMIT,
+    KEYMAP_PAGE_LIMIT,
+    DEFAULT_KEYMAP_CONCURRENCY,
+    DEFAULT_KEYMAP_CACHE_SIZE,
+    DEFAULT_KEYMAP_CACHE_TTL,
+)
+from .cache import TTLCache
+from .columnar import COLUMNAR_BATCH_SIZE
+from .file_cache import FileCache
+from .sharding import DEFAULT_SHARDS
+from .download import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_DOWNLOAD_TIMEOUT,
+    DEFAULT_PART_SIZE,
+    DOWNLOAD_CHUNK_SIZE,
+)
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .transport import Transport
 
 load_dotenv()
 
@@ -30,48 +71,120 @@ load_dotenv()
 class DataMaker:
     """Main DataMaker client that provides access to all API functionality."""
 
+    # The transport and route clients to build; AsyncDataMaker swaps in the
+    # asyncio ones, so both share this constructor
+    transport_class = Transport
+    client_classes = {
+        "generation": GenerationClient,
+        "templates": TemplatesClient,
+        "api_keys": ApiKeysClient,
+        "connections": ConnectionsClient,
+        "projects": ProjectsClient,
+        "users": UsersClient,
+        "teams": TeamsClient,
+        "team_members": TeamMembersClient,
+        "custom_data_types": CustomDataTypesClient,
+        "endpoint_folders": EndpointFoldersClient,
+        "endpoints": EndpointsClient,
+        "template_folders": TemplateFoldersClient,
+        "shortcuts": ShortcutsClient,
+        "feedback": FeedbackClient,
+        "export": ExportClient,
+        "validation": ValidationClient,
+        "scenario_files": ScenarioFilesClient,
+        "sets": SetsClient,
+        "keymaps": KeyMapsClient,
+    }
+
     def __init__(
         self,
         api_key: str = None,
         default_headers: Dict[str, Optional[str]] = None,
         base_url: Optional[str] = None,
         verify: bool = True,
+        transport: Optional[Transport] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        template_cache_size: int = DEFAULT_TEMPLATE_CACHE_SIZE,
+        template_cache_ttl: Optional[float] = DEFAULT_TEMPLATE_CACHE_TTL,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        keymap_cache_size: int = DEFAULT_KEYMAP_CACHE_SIZE,
+        keymap_cache_ttl: Optional[float] = DEFAULT_KEYMAP_CACHE_TTL,
+        keymap_missing_ttl: float = 0.0,
+        file_url_cache_size: int = DEFAULT_URL_CACHE_SIZE,
+        file_cache_dir: Optional[str] = None,
+        set_cache_size: int = DEFAULT_SET_CACHE_SIZE,
+        set_cache_ttl: Optional[float] = DEFAULT_SET_CACHE_TTL,
     ):
+        """Create the client and the transport shared by its route clients.
+
+        ``pool_connections``, ``pool_maxsize``, ``retry`` and ``rate_limiter``
+        configure the transport built when ``transport`` is omitted. An
+        explicit ``transport`` already carries its own pool, retry policy and
+        limiter, so combining it with any of them raises ``ValueError`` rather
+        than silently ignoring them.
+
+        Raises:
+            ValueError: If ``transport`` is given together with transport
+                options.
+        """
         if default_headers is None:
             default_headers = {"Content-Type": "application/json"}
 
-        # Initialize all route clients
-        self._generation = GenerationClient(api_key, default_headers, base_url, verify)
-        self._templates = TemplatesClient(api_key, default_headers, base_url, verify)
-        self._api_keys = ApiKeysClient(api_key, default_headers, base_url, verify)
-        self._connections = ConnectionsClient(
-            api_key, default_headers, base_url, verify
+        transport_options = self._transport_options(
+            transport,
+            {
+                "pool_connections": pool_connections,
+                "pool_maxsize": pool_maxsize,
+                "retry": retry,
+                "rate_limiter": rate_limiter,
+            },
         )
-        self._projects = ProjectsClient(api_key, default_headers, base_url, verify)
-        self._users = UsersClient(api_key, default_headers, base_url, verify)
-        self._teams = TeamsClient(api_key, default_headers, base_url, verify)
-        self._team_members = TeamMembersClient(
-            api_key, default_headers, base_url, verify
+        # One pooled transport shared by every route client, so keep-alive
+        # connections are reused across all API calls
+        self.transport = transport or self._create_transport(
+            verify, **transport_options
         )
-        self._custom_data_types = CustomDataTypesClient(
-            api_key, default_headers, base_url, verify
+        client_args = (api_key, default_headers, base_url, verify, self.transport)
+
+        # Initialize all route clients
+        clients = self.client_classes
+        self._generation = clients["generation"](*client_args)
+        self._templates = clients["templates"](
+            *client_args,
+            template_cache=TTLCache(
+                maxsize=template_cache_size, ttl=template_cache_ttl
+            ),
         )
-        self._endpoint_folders = EndpointFoldersClient(
-            api_key, default_headers, base_url, verify
+        self._api_keys = clients["api_keys"](*client_args)
+        self._connections = clients["connections"](*client_args)
+        self._projects = clients["projects"](*client_args)
+        self._users = clients["users"](*client_args)
+        self._teams = clients["teams"](*client_args)
+        self._team_members = clients["team_members"](*client_args)
+        self._custom_data_types = clients["custom_data_types"](*client_args)
+        self._endpoint_folders = clients["endpoint_folders"](*client_args)
+        self._endpoints = clients["endpoints"](*client_args)
+        self._template_folders = clients["template_folders"](*client_args)
+        self._shortcuts = clients["shortcuts"](*client_args)
+        self._feedback = clients["feedback"](*client_args)
+        self._export = clients["export"](*client_args)
+        self._validation = clients["validation"](*client_args)
+        self._scenario_files = clients["scenario_files"](
+            *client_args,
+            url_cache=TTLCache(maxsize=file_url_cache_size, ttl=None),
+            file_cache=FileCache(file_cache_dir) if file_cache_dir else None,
         )
-        self._endpoints = EndpointsClient(api_key, default_headers, base_url, verify)
-        self._template_folders = TemplateFoldersClient(
-            api_key, default_headers, base_url, verify
+        self._sets = clients["sets"](
+            *client_args,
+            set_cache=TTLCache(maxsize=set_cache_size, ttl=set_cache_ttl),
         )
-        self._shortcuts = ShortcutsClient(api_key, default_headers, base_url, verify)
-        self._feedback = FeedbackClient(api_key, default_headers, base_url, verify)
-        self._export = ExportClient(api_key, default_headers, base_url, verify)
-        self._validation = ValidationClient(api_key, default_headers, base_url, verify)
-        self._scenario_files = ScenarioFilesClient(
-            api_key, default_headers, base_url, verify
+        self._keymaps = clients["keymaps"](
+            *client_args,
+            lookup_cache=TTLCache(maxsize=keymap_cache_size, ttl=keymap_cache_ttl),
+            missing_ttl=keymap_missing_ttl,
         )
-        self._sets = SetsClient(api_key, default_headers, base_url, verify)
-        self._keymaps = KeyMapsClient(api_key, default_headers, base_url, verify)
 
         # Maintain backward compatibility
         self.api_key = self._generation.api_key
@@ -79,10 +192,224 @@ class DataMaker:
         self.base_url = self._generation.base_url
         self.verify = verify
 
+    @staticmethod
+    def _transport_options(
+        transport: Optional[Transport], options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return the transport options that were set, rejecting any set
+        alongside an explicit ``transport``."""
+        options = {name: value for name, value in options.items() if value is not None}
+        if transport is not None and options:
+            raise ValueError(
+                f"{', '.join(sorted(options))} cannot be combined with transport; "
+                "configure the transport instead"
+            )
+        return options
+
+    def _create_transport(self, verify: bool, **options) -> Transport:
+        """Open the transport used when none is passed in."""
+        return self.transport_class(**options)
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """The rate limiter shared by all route clients, if configured."""
+        return self.transport.rate_limiter
+
+    @property
+    def keymap_cache(self) -> TTLCache:
+        """The keymap_lookup cache; ``keymap_cache.stats()`` gives hits/misses."""
+        return self._keymaps.lookup_cache
+
+    @property
+    def file_url_cache(self) -> TTLCache:
+        """The presigned download URL cache of the scenario file methods."""
+        return self._scenario_files.url_cache
+
+    @property
+    def file_cache(self) -> Optional[FileCache]:
+        """The on-disk file content cache, if ``file_cache_dir`` was given."""
+        return self._scenario_files.file_cache
+
+    @property
+    def set_cache(self) -> TTLCache:
+        """The local copies of set rows used to diff set row updates."""
+        return self._sets.set_cache
+
+    def close(self):
+        """Close the pooled connections held by the shared transport."""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     # =================== GENERATION METHODS ===================
-    def generate(self, template):
-        """Generate data using a template."""
-        return self._generation.generate(template)
+    def generate(self, template, columnar: bool = False):
+        """Generate data using a template.
+
+        Args:
+            template: A Template or template dictionary.
+            columnar: Return a ColumnarResult (one NumPy array per column,
+                convertible with ``to_pandas()``/``to_arrow()``) instead of a
+                list of row dicts. Requires NumPy.
+
+        Example:
+            >>> df = dm.generate(template, columnar=True).to_pandas()
+        """
+        return self._generation.generate(template, columnar=columnar)
+
+    def generate_hybrid(
+        self,
+        template,
+        quantity: Optional[int] = None,
+        columnar: bool = False,
+        seed: Optional[int] = None,
+    ):
+        """Generate cheap fields locally and send only the rest to the API.
+
+        UUID, Number, Float, Boolean, Custom and Words fields are sampled
+        locally, Derived fields that only substitute other fields are filled
+        in locally, and the remaining fields go to the API in one request.
+        The columns are joined back by row index. Requires NumPy.
+
+        Args:
+            template: A Template or template dictionary.
+            quantity: Optional row count overriding the template's quantity.
+            columnar: Return a ColumnarResult instead of row dicts.
+            seed: Seed for the locally generated fields.
+
+        Returns:
+            The generated rows, in template field order.
+
+        Example:
+            >>> rows = dm.generate_hybrid(template, 10_000)
+        """
+        return self._generation.generate_hybrid(
+            template, quantity, columnar=columnar, seed=seed
+        )
+
+    def generate_sharded(
+        self,
+        template,
+        quantity: Optional[int] = None,
+        shards: int = DEFAULT_SHARDS,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        columnar: bool = False,
+    ):
+        """Generate a template locally in seeded shards on a process pool.
+
+        Each shard is seeded from (seed, shard index), so the same template,
+        quantity, shards and seed give identical rows for any number of
+        workers. Only locally generated field types are supported. Requires
+        NumPy. Workers are started with spawn and re-import the main module,
+        so scripts must call this under ``if __name__ == "__main__":`` (or
+        pass ``workers=1``).
+
+        Args:
+            template: A Template, AccountTemplate or template dictionary.
+            quantity: Optional row count overriding the template's quantity.
+            shards: Number of shards. Changing it changes the rows.
+            seed: Base seed; defaults to the template's seed, if any.
+            workers: Number of worker processes; defaults to the CPU count.
+            columnar: Return a ColumnarResult instead of row dicts.
+
+        Returns:
+            The generated rows, in shard order.
+
+        Example:
+            >>> if __name__ == "__main__":
+            ...     rows = dm.generate_sharded(template, 10_000_000, shards=64, seed=7)
+        """
+        return self._generation.generate_sharded(
+            template,
+            quantity,
+            shards=shards,
+            seed=seed,
+            workers=workers,
+            columnar=columnar,
+        )
+
+    def iter_generate(
+        self,
+        template,
+        quantity: Optional[int] = None,
+        columnar: bool = False,
+        batch_size: int = COLUMNAR_BATCH_SIZE,
+    ):
+        """Generate data and yield rows as the response streams in.
+
+        Parses the response incrementally, so memory stays flat no matter how
+        many rows come back.
+
+        Args:
+            template: A Template or template dictionary.
+            quantity: Optional row count overriding the template's quantity.
+            columnar: Yield ColumnarResult batches of up to ``batch_size``
+                rows instead of row dicts.
+            batch_size: Rows per batch when ``columnar`` is set.
+
+        Returns:
+            An iterator over the generated row dictionaries.
+
+        Example:
+            >>> dm = DataMaker()
+            >>> for row in dm.iter_generate(template, 100_000):
+            ...     writer.writerow(row)
+        """
+        return self._generation.iter_generate(
+            template, quantity, columnar=columnar, batch_size=batch_size
+        )
+
+    def generate_bulk(
+        self,
+        template,
+        quantity: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_RETRIES,
+        columnar: bool = False,
+    ):
+        """Generate a large quantity of rows as concurrent chunks.
+
+        Args:
+            template: A Template or template dictionary.
+            quantity: Total number of rows to generate.
+            chunk_size: Maximum rows per request.
+            concurrency: Maximum number of chunk requests in flight.
+            retries: Extra attempts per chunk before giving up.
+            columnar: Return one ColumnarResult instead of row dicts.
+
+        Returns:
+            The generated rows, in order.
+
+        Example:
+            >>> dm = DataMaker(pool_maxsize=8)
+            >>> rows = dm.generate_bulk(template, 500_000, chunk_size=5000, concurrency=8)
+        """
+        return self._generation.generate_bulk(
+            template, quantity, chunk_size, concurrency, retries, columnar=columnar
+        )
+
+    def iter_generate_bulk(
+        self,
+        template,
+        quantity: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_RETRIES,
+        columnar: bool = False,
+    ):
+        """Generate rows in concurrent chunks, yielding them in order.
+
+        Same as generate_bulk, but only the chunks in flight are held in memory.
+        With ``columnar`` set, each chunk is yielded as a ColumnarResult.
+        """
+        return self._generation.iter_generate_bulk(
+            template, quantity, chunk_size, concurrency, retries, columnar=columnar
+        )
 
     def generate_from_template_id(self, template_id: str, quantity: int = 10):
         """Generate data from a template ID with specified quantity."""
@@ -455,20 +782,105 @@ class DataMaker:
         return self._scenario_files.download_scenario_file(file_id, scenario_id)
 
     def download_scenario_file_to_path(
-        self, file_id: str, destination_path: str, scenario_id: Optional[str] = None
+        self,
+        file_id: str,
+        destination_path: str,
+        scenario_id: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress=None,
+        timeout=DEFAULT_DOWNLOAD_TIMEOUT,
     ):
         """Download a file and save it to a local path.
 
+        The content is streamed to disk in chunks and renamed into place once
+        complete, so large files are never held in memory.
+
         Args:
             file_id: The unique identifier of the file.
             destination_path: Local file path to save the downloaded content.
             scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            chunk_size: Bytes read from the connection per write.
+            progress: Optional callback(bytes_written, total_or_None) per chunk.
+            timeout: (connect, read) timeouts in seconds.
 
         Returns:
             The destination path where the file was saved.
         """
         return self._scenario_files.download_scenario_file_to_path(
-            file_id, destination_path, scenario_id
+            file_id,
+            destination_path,
+            scenario_id,
+            chunk_size=chunk_size,
+            progress=progress,
+            timeout=timeout,
+        )
+
+    def download_scenario_file_ranged(
+        self,
+        file_id: str,
+        destination_path: str,
+        scenario_id: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        progress=None,
+        timeout=DEFAULT_DOWNLOAD_TIMEOUT,
+    ):
+        """Download a large file in parallel byte ranges, resuming after failures.
+
+        Re-running after an interruption only fetches the missing ranges, and
+        an expired presigned URL is refreshed automatically.
+
+        Args:
+            file_id: The unique identifier of the file.
+            destination_path: Local file path to save the downloaded content.
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            part_size: Bytes per ranged request (default 8 MiB).
+            concurrency: Maximum ranges in flight.
+            progress: Optional callback(bytes_on_disk, total).
+            timeout: (connect, read) timeouts in seconds.
+
+        Returns:
+            The destination path where the file was saved.
+        """
+        return self._scenario_files.download_scenario_file_ranged(
+            file_id,
+            destination_path,
+            scenario_id,
+            part_size=part_size,
+            concurrency=concurrency,
+            progress=progress,
+            timeout=timeout,
+        )
+
+    def download_file_by_path_ranged(
+        self,
+        file_path: str,
+        destination_path: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        progress=None,
+        timeout=DEFAULT_DOWNLOAD_TIMEOUT,
+    ):
+        """Download a file by its storage path in parallel, resumable ranges.
+
+        Args:
+            file_path: The file path (key) in storage.
+            destination_path: Local file path to save the downloaded content.
+            part_size: Bytes per ranged request (default 8 MiB).
+            concurrency: Maximum ranges in flight.
+            progress: Optional callback(bytes_on_disk, total).
+            timeout: (connect, read) timeouts in seconds.
+
+        Returns:
+            The destination path where the file was saved.
+        """
+        return self._scenario_files.download_file_by_path_ranged(
+            file_path,
+            destination_path,
+            part_size=part_size,
+            concurrency=concurrency,
+            progress=progress,
+            timeout=timeout,
         )
 
     def create_scenario_file(
@@ -481,9 +893,15 @@ class DataMaker:
         description: Optional[str] = None,
         mime_type: Optional[str] = None,
         folder_id: Optional[str] = None,
+        folder: str = "uploads",
     ):
         """Create/upload a new file in a scenario.
 
+        Content is streamed to the multipart upload endpoint in chunks, so
+        large file objects are not read into memory. When ``description`` or
+        ``folder_id`` is given, the file is created through the JSON endpoint
+        instead, which stores them but reads the content into memory.
+
         Args:
             name: The filename (e.g., 'data.json', 'config.yaml').
             content: The file content - can be a string, bytes, or file-like object.
@@ -493,6 +911,9 @@ class DataMaker:
             description: Optional description of the file.
             mime_type: Optional MIME type. If not provided, will be guessed from filename.
             folder_id: Optional folder ID to place the file in.
+            folder: Folder to upload to ("uploads" or "outputs", default:
+                "uploads"). Not used when ``description`` or ``folder_id``
+                is given.
 
         Returns:
             The created file metadata dictionary.
@@ -506,6 +927,7 @@ class DataMaker:
             description=description,
             mime_type=mime_type,
             folder_id=folder_id,
+            folder=folder,
         )
 
     def upload_scenario_file_from_path(
@@ -545,6 +967,40 @@ class DataMaker:
             folder=folder,
         )
 
+    def upload_scenario_file_multipart(
+        self,
+        file_path: str,
+        scenario_id: Optional[str] = None,
+        name: Optional[str] = None,
+        folder: str = "uploads",
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ):
+        """Upload a large local file in parallel parts with a final commit.
+
+        Parts are retried individually; servers without multipart support get
+        a single upload_scenario_file_from_path request instead.
+
+        Args:
+            file_path: Path to the local file to upload.
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            name: Optional filename. If not provided, uses the original filename.
+            folder: Folder to upload to ("uploads" or "outputs", default: "uploads").
+            part_size: Bytes per part (default 8 MiB).
+            concurrency: Maximum parts in flight.
+
+        Returns:
+            The created file metadata dictionary.
+        """
+        return self._scenario_files.upload_scenario_file_multipart(
+            file_path,
+            scenario_id,
+            name=name,
+            folder=folder,
+            part_size=part_size,
+            concurrency=concurrency,
+        )
+
     def delete_scenario_file(self, file_id: str, scenario_id: Optional[str] = None):
         """Delete a file by ID.
 
@@ -586,6 +1042,35 @@ class DataMaker:
         """
         return self._scenario_files.read_file_by_path(file_path, storage_base_url)
 
+    def map_file_by_path(
+        self,
+        file_path: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        timeout=DEFAULT_DOWNLOAD_TIMEOUT,
+    ) -> memoryview:
+        """Read a file by its storage path as a read-only memory map.
+
+        Requires ``file_cache_dir``. The file is downloaded into the cache
+        once and mapped from there; later calls revalidate it by ETag and
+        return a new zero-copy view, shared across processes using the same
+        cache directory.
+
+        Args:
+            file_path: The file path (key) in storage.
+            chunk_size: Bytes read from the connection per write.
+            timeout: (connect, read) timeouts in seconds.
+
+        Returns:
+            A read-only ``memoryview`` over the cached file.
+
+        Example:
+            >>> dm = DataMaker(file_cache_dir="/tmp/datamaker-cache")
+            >>> view = dm.map_file_by_path("scenarios/.../uploads/lookup.csv")
+        """
+        return self._scenario_files.map_file_by_path(
+            file_path, chunk_size=chunk_size, timeout=timeout
+        )
+
     def read_file_by_path_as_text(
         self,
         file_path: str,
@@ -670,6 +1155,79 @@ class DataMaker:
             folder=folder,
         )
 
+    def save_directory(
+        self,
+        local_dir: str,
+        folder: str = "outputs",
+        scenario_id: Optional[str] = None,
+        include: str = "*",
+        concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        skip_unchanged: bool = True,
+    ) -> Dict:
+        """Upload every matching file in a local directory concurrently.
+
+        Files already saved with the same name, size and MD5 checksum are
+        skipped; files listed without an MD5 are always uploaded.
+
+        Args:
+            local_dir: Local directory to upload from.
+            folder: Folder to upload to ("uploads" or "outputs", default: "outputs").
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            include: Glob pattern relative to local_dir (e.g. "*.csv", "**/*.json").
+            concurrency: Maximum uploads in flight.
+            skip_unchanged: Whether to skip files that already match remotely.
+
+        Returns:
+            Dictionary with the ``uploaded`` file metadata and ``skipped`` names.
+
+        Example:
+            >>> dm = DataMaker()
+            >>> result = dm.save_directory("out/run-42", include="*.csv")
+        """
+        return self._scenario_files.save_directory(
+            local_dir,
+            folder=folder,
+            scenario_id=scenario_id,
+            include=include,
+            concurrency=concurrency,
+            skip_unchanged=skip_unchanged,
+        )
+
+    def download_folder(
+        self,
+        dest_dir: str,
+        folder: str = "outputs",
+        scenario_id: Optional[str] = None,
+        concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        skip_unchanged: bool = True,
+    ) -> Dict:
+        """Download every file in a scenario folder into a local directory.
+
+        Local files with the same name, size and MD5 checksum are left as
+        they are; files listed without an MD5 are always downloaded.
+
+        Args:
+            dest_dir: Local directory to download into; created if missing.
+            folder: Folder to download ("uploads" or "outputs", default: "outputs").
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            concurrency: Maximum downloads in flight.
+            skip_unchanged: Whether to skip files that already match locally.
+
+        Returns:
+            Dictionary with the ``downloaded`` and ``skipped`` local paths.
+
+        Example:
+            >>> dm = DataMaker()
+            >>> result = dm.download_folder("fixtures/", folder="uploads")
+        """
+        return self._scenario_files.download_folder(
+            dest_dir,
+            folder=folder,
+            scenario_id=scenario_id,
+            concurrency=concurrency,
+            skip_unchanged=skip_unchanged,
+        )
+
     # =================== SET METHODS ===================
     def get_sets(self, project_id: Optional[str] = None):
         """Get all saved sets for the caller's project/team scope.
@@ -683,16 +1241,18 @@ class DataMaker:
         """
         return self._sets.get_sets(project_id)
 
-    def get_set(self, set_id: str):
+    def get_set(self, set_id: str, columnar: bool = False):
         """Get a single saved set by ID, including its full rows payload.
 
         Args:
             set_id: The unique identifier of the set.
+            columnar: Return ``data`` as a ColumnarResult instead of a list of
+                row dicts. Requires NumPy.
 
         Returns:
             The set dictionary (including its saved rows in ``data``).
         """
-        return self._sets.get_set(set_id)
+        return self._sets.get_set(set_id, columnar=columnar)
 
     def create_set(
         self,
@@ -795,6 +1355,130 @@ class DataMaker:
             project_id=project_id,
         )
 
+    def append_set_rows(self, set_id: str, rows):
+        """Append rows to a saved set, sending only the new rows.
+
+        Args:
+            set_id: The unique identifier of the set.
+            rows: The rows to append.
+
+        Returns:
+            The updated set dictionary, or {"id": set_id, "changed": False}
+            when there was nothing to append.
+
+        Example:
+            >>> dm = DataMaker()
+            >>> dm.append_set_rows("set-123", todays_rows)
+        """
+        return self._sets.append_set_rows(set_id, rows)
+
+    def patch_set_rows(
+        self,
+        set_id: str,
+        upserts=None,
+        deletes=None,
+        key: str = "id",
+    ):
+        """Insert, replace and delete rows of a saved set by key.
+
+        Only the changed rows are sent. On servers that only support full
+        replacement the change is diffed locally and no-op updates are skipped.
+
+        Args:
+            set_id: The unique identifier of the set.
+            upserts: Rows to insert or replace; each must contain key.
+            deletes: Key values of rows to remove.
+            key: The row field identifying a row (default "id").
+
+        Returns:
+            The updated set dictionary, or {"id": set_id, "changed": False}
+            when the patch changed nothing.
+
+        Example:
+            >>> dm = DataMaker()
+            >>> dm.patch_set_rows("set-123", upserts=[{"id": 7, "qty": 2}], deletes=[9])
+        """
+        return self._sets.patch_set_rows(
+            set_id, upserts=upserts, deletes=deletes, key=key
+        )
+
+    def get_set_rows(self, set_id: str, page: int = 1, page_size: int = SET_PAGE_SIZE):
+        """Fetch one page of a saved set's rows.
+
+        Args:
+            set_id: The unique identifier of the set.
+            page: 1-based page number.
+            page_size: Rows per page.
+
+        Returns:
+            A dictionary with rows, total, page and pageSize.
+        """
+        return self._sets.get_set_rows(set_id, page=page, page_size=page_size)
+
+    def iter_set_rows(
+        self,
+        set_id: str,
+        page_size: int = SET_PAGE_SIZE,
+        concurrency: int = DEFAULT_SET_CONCURRENCY,
+        columnar: bool = False,
+    ):
+        """Iterate over a saved set's rows, prefetching compressed pages.
+
+        Memory stays bounded by the prefetch window however large the set.
+
+        Args:
+            set_id: The unique identifier of the set.
+            page_size: Rows per page.
+            concurrency: Maximum pages in flight.
+            columnar: Yield each page as a ColumnarResult instead of row dicts.
+
+        Returns:
+            An iterator of row dictionaries.
+        """
+        return self._sets.iter_set_rows(
+            set_id, page_size=page_size, concurrency=concurrency, columnar=columnar
+        )
+
+    def save_set_stream(
+        self,
+        name: str,
+        rows,
+        description: Optional[str] = None,
+        project_id: Optional[str] = None,
+        page_size: int = SET_PAGE_SIZE,
+        concurrency: int = DEFAULT_SET_CONCURRENCY,
+    ):
+        """Save rows from any iterable as a named set in gzip-compressed pages.
+
+        Rows are consumed lazily and rowCount is counted as pages upload, so
+        memory stays bounded however many rows are saved.
+
+        Args:
+            name: A name for the saved set.
+            rows: The rows to save; may be a generator (or, on
+                AsyncDataMaker, an async iterable).
+            description: Optional short description of what the set captures.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+            page_size: Rows per uploaded page.
+            concurrency: Maximum pages in flight.
+
+        Returns:
+            The saved set dictionary.
+
+        Example:
+            >>> dm = DataMaker()
+            >>> rows = dm.iter_generate_bulk(template, 1_000_000)
+            >>> result = dm.save_set_stream("regression-1m", rows)
+        """
+        return self._sets.save_set_stream(
+            name=name,
+            rows=rows,
+            description=description,
+            project_id=project_id,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
     def get_keymaps(self, project_id: Optional[str] = None):
         """List key maps for a project: one row per (mapName, object).
 
@@ -846,6 +1530,53 @@ class DataMaker:
             project_id=project_id,
         )
 
+    def keymap_put_bulk(
+        self,
+        map_name: str,
+        object: str,
+        entries,
+        batch_size: int = KEYMAP_BATCH_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        run_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ):
+        """Record any number of old-to-new key mappings in parallel batches.
+
+        Splits entries into keymap_put calls of at most batch_size pairs and
+        sends up to concurrency of them at once. Failed batches are reported
+        rather than aborting the run.
+
+        Args:
+            map_name: Logical map name, e.g. "sap-material-migration".
+            object: The domain object type, e.g. "Material".
+            entries: A dict or any iterable/generator of (old_key, new_key) pairs
+                (or, on AsyncDataMaker, an async iterable of pairs).
+            batch_size: Pairs per request (server-capped at 5000).
+            concurrency: Maximum batches in flight.
+            run_id: Optional run/job id that minted these keys.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            A dictionary with mapName, object, upserted (total), batches and
+            failed (the batches that could not be written, with their entries).
+
+        Example:
+            >>> dm = DataMaker(pool_maxsize=8)
+            >>> pairs = ((row["old"], row["new"]) for row in rows)
+            >>> result = dm.keymap_put_bulk(
+            ...     "sap-material-migration", "Material", pairs, concurrency=8
+            ... )
+        """
+        return self._keymaps.keymap_put_bulk(
+            map_name=map_name,
+            object=object,
+            entries=entries,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            run_id=run_id,
+            project_id=project_id,
+        )
+
     def keymap_lookup(
         self,
         map_name: str,
@@ -880,6 +1611,65 @@ class DataMaker:
             project_id=project_id,
         )
 
+    def keymap_lookup_bulk(
+        self,
+        map_name: str,
+        object: str,
+        old_keys,
+        batch_size: int = KEYMAP_BATCH_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ):
+        """Translate any number of source-system keys in parallel batches.
+
+        Keys are de-duplicated, split into batches of at most batch_size and
+        looked up concurrently; the results are merged.
+
+        Args:
+            map_name: The key map to look up in.
+            object: The domain object type, e.g. "Material".
+            old_keys: Any iterable or generator of source-system keys (or,
+                on AsyncDataMaker, an async iterable).
+            batch_size: Keys per request (server-capped at 5000).
+            concurrency: Maximum batches in flight.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            A dictionary with mapName, object, mappings (all found keys) and
+            missing (unique keys with no mapping).
+        """
+        return self._keymaps.keymap_lookup_bulk(
+            map_name=map_name,
+            object=object,
+            old_keys=old_keys,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            project_id=project_id,
+        )
+
+    def iter_keymap_lookup(
+        self,
+        map_name: str,
+        object: str,
+        old_keys,
+        batch_size: int = KEYMAP_BATCH_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ):
+        """Like keymap_lookup_bulk, but yield each batch's result in order.
+
+        Returns:
+            An iterator of dictionaries with mappings and missing per batch.
+        """
+        return self._keymaps.iter_keymap_lookup(
+            map_name=map_name,
+            object=object,
+            old_keys=old_keys,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            project_id=project_id,
+        )
+
     def get_keymap_entries(
         self,
         map_name: str,
@@ -908,6 +1698,62 @@ class DataMaker:
             project_id=project_id,
         )
 
+    def iter_keymap_entries(
+        self,
+        map_name: str,
+        object: Optional[str] = None,
+        page_size: int = KEYMAP_PAGE_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ):
+        """Iterate over every entry of a key map, prefetching pages concurrently.
+
+        Args:
+            map_name: The key map to read.
+            object: Optional domain object type filter.
+            page_size: Entries per page (server-capped at 500).
+            concurrency: Maximum pages in flight.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            An iterator of entry dictionaries (object, oldKey, newKey).
+        """
+        return self._keymaps.iter_keymap_entries(
+            map_name=map_name,
+            object=object,
+            page_size=page_size,
+            concurrency=concurrency,
+            project_id=project_id,
+        )
+
+    def export_keymap(
+        self,
+        map_name: str,
+        path: str,
+        object: Optional[str] = None,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ):
+        """Stream a whole key map into a SQLite snapshot file at path.
+
+        Args:
+            map_name: The key map to export.
+            path: Destination file path; replaced atomically when complete.
+            object: Optional domain object type filter.
+            concurrency: Maximum pages in flight.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            A dictionary with mapName, path and entries (count).
+        """
+        return self._keymaps.export_keymap(
+            map_name=map_name,
+            path=path,
+            object=object,
+            concurrency=concurrency,
+            project_id=project_id,
+        )
+
     def delete_keymap(
         self,
         map_name: str,
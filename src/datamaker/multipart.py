@@ -0,0 +1,90 @@
+"""Streaming multipart/form-data request bodies."""
+
+import io
+import uuid
+from typing import AsyncIterator, BinaryIO, Dict, Optional
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartStream:
+    """A ``multipart/form-data`` body that reads its file part in chunks.
+
+    The body is a file-like object with a known length (``read()`` and
+    ``len()``), so ``requests`` streams it with a ``Content-Length`` header
+    instead of assembling the whole request in memory. It is also an async
+    iterable of chunks for ``httpx``. A body can only be sent once.
+
+    Args:
+        fields: Plain form fields sent before the file.
+        file_field: Form field name of the file part.
+        filename: Filename reported for the file part.
+        fileobj: Seekable binary file object, read from its current position.
+        content_type: MIME type of the file part.
+        chunk_size: Bytes per chunk when iterated.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        filename: str,
+        fileobj: BinaryIO,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+
+        head = b"".join(
+            self._part_header(f'name="{name}"') + str(value).encode("utf-8") + b"\r\n"
+            for name, value in fields.items()
+        )
+        head += self._part_header(
+            f'name="{file_field}"; filename="{filename}"', content_type
+        )
+        tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+        position = fileobj.tell()
+        file_size = fileobj.seek(0, io.SEEK_END) - position
+        fileobj.seek(position)
+
+        self._length = len(head) + file_size + len(tail)
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+        self._index = 0
+
+    def _part_header(self, disposition: str, content_type: Optional[str] = None) -> bytes:
+        header = f"--{self.boundary}\r\nContent-Disposition: form-data; {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    @property
+    def content_type(self) -> str:
+        """The request ``Content-Type`` header, including the boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes of the encoded body (all if negative)."""
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.chunk_size), b""))
+
+        chunks = []
+        while size > 0 and self._index < len(self._parts):
+            data = self._parts[self._index].read(size)
+            if not data:
+                self._index += 1
+                continue
+            chunks.append(data)
+            size -= len(data)
+        return b"".join(chunks)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def __len__(self) -> int:
+        return self._length
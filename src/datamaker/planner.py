@@ -0,0 +1,160 @@
+"""Split templates into fields generated locally and fields the API must generate.
+
+``Derived`` fields (``{"value": "{{first_name}}.{{last_name}}@x.com"}``) are
+plain substitutions of other fields, so they are evaluated locally once the
+fields they reference exist, wherever those come from. A ``Derived`` value
+with a placeholder that names no field (e.g. ``{{UUID}}``) is left to the
+API, together with every field it references.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Set
+from .error import DataMakerError
+
+PLACEHOLDER = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+
+
+def _field_dict(field) -> Dict:
+    return field.__dict__ if hasattr(field, "__dict__") else field
+
+
+def _template_dict(template) -> Dict:
+    if hasattr(template, "to_dict"):
+        return template.to_dict()
+    if isinstance(template, dict):
+        return template
+    # e.g. an AccountTemplate
+    return {"name": template.name, "fields": list(template.fields)}
+
+
+def derived_references(field: Dict) -> Optional[List[str]]:
+    """Return the placeholder names of a ``Derived`` field's value.
+
+    Returns:
+        The names in order of appearance, or None if ``field`` is not a
+        ``Derived`` field with a string value.
+    """
+    value = (field.get("options") or {}).get("value")
+    if field.get("type") != "Derived" or not isinstance(value, str):
+        return None
+    return PLACEHOLDER.findall(value)
+
+
+class TemplatePlan:
+    """How a template's fields are split between local and remote generation.
+
+    Attributes:
+        payload: The template dictionary the plan was made for.
+        fields: Every field dictionary, in template order.
+        local: Names of fields sampled locally.
+        derived: Names of ``Derived`` fields evaluated locally, ordered so
+            that each comes after the derived fields it references.
+        remote: Field dictionaries the API generates, in template order.
+    """
+
+    def __init__(
+        self,
+        payload: Dict,
+        fields: List[Dict],
+        local: List[str],
+        derived: List[str],
+        remote: List[Dict],
+    ):
+        self.payload = payload
+        self.fields = fields
+        self.local = local
+        self.derived = derived
+        self.remote = remote
+
+    def __repr__(self) -> str:
+        remote = [field.get("name") for field in self.remote]
+        return (
+            f"TemplatePlan(local={self.local}, derived={self.derived}, "
+            f"remote={remote})"
+        )
+
+    def remote_template(self, quantity: Optional[int]) -> Dict:
+        """Return the template to send to the API for the remote fields."""
+        payload = {**self.payload, "fields": self.remote}
+        if quantity is not None:
+            payload["quantity"] = quantity
+        return payload
+
+
+def plan_template(template, is_local: Callable[[Dict], bool]) -> TemplatePlan:
+    """Decide which fields of ``template`` need the API.
+
+    Args:
+        template: A ``Template``, ``AccountTemplate`` or template dictionary.
+        is_local: Returns whether a (non-derived) field can be generated
+            locally, e.g. ``LocalGenerator.supports``.
+
+    Returns:
+        The plan.
+
+    Raises:
+        DataMakerError: If locally evaluated ``Derived`` fields reference each
+            other in a cycle.
+    """
+    payload = _template_dict(template)
+    fields = [_field_dict(field) for field in payload.get("fields") or []]
+    names = {field.get("name") for field in fields}
+
+    references: Dict[str, List[str]] = {}
+    remote: Set[str] = set()
+    for field in fields:
+        refs = derived_references(field)
+        if refs is not None and all(ref in names for ref in refs):
+            references[field["name"]] = refs
+        elif not is_local(field):
+            remote.add(field.get("name"))
+            # The API needs the fields a remote Derived value substitutes
+            references[field.get("name")] = [ref for ref in refs or [] if ref in names]
+
+    pending = list(remote)
+    while pending:
+        for ref in references.get(pending.pop(), []):
+            if ref not in remote:
+                remote.add(ref)
+                pending.append(ref)
+
+    derivable = [
+        field["name"]
+        for field in fields
+        if field.get("name") in references and field.get("name") not in remote
+    ]
+    return TemplatePlan(
+        payload,
+        fields,
+        local=[
+            field["name"]
+            for field in fields
+            if field.get("name") not in remote and field.get("name") not in references
+        ],
+        derived=_dependency_order(derivable, references),
+        remote=[field for field in fields if field.get("name") in remote],
+    )
+
+
+def _dependency_order(names: List[str], references: Dict[str, List[str]]) -> List[str]:
+    """Order ``names`` so each follows the ones among them it references."""
+    members = set(names)
+    ordered: List[str] = []
+    state: Dict[str, str] = {}
+
+    def visit(name: str, path: List[str]) -> None:
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            cycle = " -> ".join(path[path.index(name) :] + [name])
+            raise DataMakerError(f"Derived fields reference each other: {cycle}")
+        state[name] = "visiting"
+        for ref in references[name]:
+            if ref in members:
+                visit(ref, path + [name])
+        state[name] = "done"
+        ordered.append(name)
+
+    for name in names:
+        visit(name, [])
+    return ordered
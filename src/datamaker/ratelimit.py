@@ -0,0 +1,165 @@
+"""Client-side rate limiting shared by every route client."""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+# How often ``aacquire`` retries a full concurrency cap
+SLOT_POLL_INTERVAL = 0.005
+
+
+class RateLimiter:
+    """Thread-safe token bucket with an optional concurrency cap.
+
+    Every API request takes one token; tokens refill at ``rate`` per second up
+    to ``burst``. When ``max_concurrent`` is set, at most that many requests
+    are in flight at once. Callers block until they may proceed, so a thread
+    pool fanning out ``generate`` or ``keymap_lookup`` calls stays under the
+    API's limits instead of triggering 429s.
+
+    Args:
+        rate: Sustained requests per second. ``None`` disables the bucket.
+        burst: Maximum tokens that can accumulate. Defaults to ``rate``
+            (at least 1).
+        max_concurrent: Maximum requests in flight. ``None`` for no cap.
+
+    Example:
+        >>> dm = DataMaker(rate_limiter=RateLimiter(rate=20, max_concurrent=8))
+        >>> dm.rate_limiter.stats()["current_wait"]
+        0.0
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.max_concurrent = max_concurrent
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = (
+            threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        )
+
+        self._requests = 0
+        self._waiting = 0
+        self._in_flight = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Block until a request may be sent, and hold its slot until done."""
+        started = self._start_waiting()
+        try:
+            if self.rate:
+                delay = self._reserve()
+                if delay > 0:
+                    time.sleep(delay)
+            if self._slots is not None:
+                self._slots.acquire()
+        finally:
+            self._stop_waiting()
+
+        self._admit(started)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def aacquire(self) -> AsyncIterator[None]:
+        """Like ``acquire``, but wait on the event loop instead of blocking.
+
+        The same limiter can be shared by sync and async clients; a full
+        concurrency cap is polled every ``SLOT_POLL_INTERVAL`` seconds.
+        """
+        started = self._start_waiting()
+        try:
+            if self.rate:
+                delay = self._reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if self._slots is not None:
+                while not self._slots.acquire(blocking=False):
+                    await asyncio.sleep(SLOT_POLL_INTERVAL)
+        finally:
+            self._stop_waiting()
+
+        self._admit(started)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _start_waiting(self) -> float:
+        with self._lock:
+            self._waiting += 1
+        return time.monotonic()
+
+    def _stop_waiting(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def _admit(self, started: float) -> None:
+        """Record a request that waited since ``started`` and is now sent."""
+        waited = time.monotonic() - started
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            self._last_wait = waited
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def current_wait(self) -> float:
+        """Seconds a request issued now would wait for a token."""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            return max(0.0, (1 - tokens) / self.rate)
+
+    def stats(self) -> Dict[str, float]:
+        """Return counters describing how much the limiter is throttling."""
+        current_wait = self.current_wait()
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "waiting": self._waiting,
+                "in_flight": self._in_flight,
+                "current_wait": current_wait,
+                "last_wait": self._last_wait,
+                "max_wait": self._max_wait,
+                "total_wait": self._total_wait,
+                "average_wait": (
+                    self._total_wait / self._requests if self._requests else 0.0
+                ),
+            }
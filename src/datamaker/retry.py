@@ -0,0 +1,114 @@
+"""Retry policy for throttled and transiently failing API requests."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+DEFAULT_RETRY_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Only idempotent requests are retried: the methods in ``retry_methods``,
+    plus any request the route client marks as idempotent (e.g. the
+    last-write-wins ``keymap_put``). Waits grow exponentially with full
+    jitter, a ``Retry-After`` header from the server takes precedence, and no
+    retry is attempted once ``max_elapsed`` seconds would be exceeded.
+
+    Args:
+        max_retries: Maximum retries per request. ``0`` disables retrying.
+        backoff_factor: Base wait in seconds; attempt ``n`` waits up to
+            ``backoff_factor * 2 ** n``.
+        max_backoff: Upper bound for a single computed wait.
+        max_elapsed: Upper bound for the total time spent on one request,
+            including waits. ``None`` means no cap.
+        retry_statuses: HTTP status codes worth retrying.
+        retry_methods: HTTP methods that are safe to retry.
+        jitter: Randomize waits to avoid synchronized retry storms.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_elapsed: Optional[float] = 60.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        jitter: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.jitter = jitter
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """Whether a request with this method may be retried at all."""
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.retry_methods
+
+    def is_transient(self, status_code: Optional[int]) -> bool:
+        """Whether a failure with this status may succeed if repeated.
+
+        ``None`` means no response was received, e.g. a dropped connection.
+        Server errors and ``retry_statuses`` are transient; other client
+        errors (4xx) would fail again.
+        """
+        return (
+            status_code is None
+            or status_code >= 500
+            or status_code in self.retry_statuses
+        )
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        delay = self.parse_retry_after(retry_after)
+        if delay is not None:
+            return delay
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        started: float,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Wait before the next attempt, or ``None`` if the budget is spent.
+
+        Args:
+            attempt: Number of retries already made.
+            started: ``time.monotonic()`` when the first attempt began.
+            retry_after: The response's ``Retry-After`` header, if any.
+        """
+        if attempt >= self.max_retries:
+            return None
+        delay = self.backoff(attempt, retry_after)
+        if self.max_elapsed is not None:
+            if time.monotonic() - started + delay > self.max_elapsed:
+                return None
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
@@ -0,0 +1,194 @@
+"""Asyncio support for the route clients.
+
+The async clients reuse the sync route clients' methods unchanged: payload
+building and validation run exactly as in the sync client, but
+``_make_request`` returns a ``PendingResponse`` instead of sending. The request
+is only sent when its ``json()`` coroutine is awaited, so a route method that
+ends in ``return response.json()`` becomes awaitable without being copied.
+
+Methods that take more than one step are written once as flows (see
+``base``); ``AsyncBaseClient`` drives them on the event loop by awaiting each
+step, and overrides the step helpers with their non-blocking counterparts.
+"""
+
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from ..concurrency import abatched, aenumerate, aimap_ordered, aunique
+from ..transport import AsyncTransport
+from .base import END, Emit, Flow
+
+
+class PendingResponse:
+    """An API request that is sent when awaited."""
+
+    def __init__(self, client: "AsyncBaseClient", method: str, endpoint: str, kwargs):
+        self._client = client
+        self._method = method
+        self._endpoint = endpoint
+        self._kwargs = kwargs
+
+    def send(self):
+        """Return a coroutine that sends the request and returns the response."""
+        return self._client._send(self._method, self._endpoint, **self._kwargs)
+
+    async def json(self) -> Any:
+        """Send the request and return the decoded JSON body."""
+        response = await self.send()
+        return response.json()
+
+    def __await__(self):
+        return self.send().__await__()
+
+
+async def _resolve(step) -> Tuple[Any, Optional[BaseException]]:
+    """Await a flow step, returning its value or the error it raised."""
+    try:
+        return (await step if inspect.isawaitable(step) else step), None
+    except BaseException as e:
+        return None, e
+
+
+def _advance(flow: Flow, value, error: Optional[BaseException]):
+    """Resume ``flow`` with a step's value, or raise its error at the ``yield``."""
+    return flow.throw(error) if error is not None else flow.send(value)
+
+
+class AsyncBaseClient:
+    """Mixin turning a route client into an asyncio client.
+
+    Must come before the sync client in the bases, e.g.
+    ``class AsyncSetsClient(AsyncBaseClient, SetsClient)``.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        default_headers: Dict[str, Optional[str]] = None,
+        base_url: Optional[str] = None,
+        verify: bool = True,
+        transport: Optional[AsyncTransport] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            api_key,
+            default_headers,
+            base_url,
+            verify,
+            transport or AsyncTransport(verify=verify),
+            **kwargs,
+        )
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> PendingResponse:
+        """Defer an HTTP request to the API until it is awaited."""
+        return PendingResponse(self, method, endpoint, kwargs)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ):
+        """Make an HTTP request to the API over the async transport."""
+        return await self._run(self._request_flow(method, endpoint, idempotent, kwargs))
+
+    def _request_kwargs(self, kwargs: Dict) -> Dict:
+        # TLS verification is configured once on the async transport
+        kwargs.pop("verify", None)
+        kwargs["headers"] = self._request_headers(kwargs)
+        data = kwargs.get("data")
+        if isinstance(data, bytes) or hasattr(data, "read"):
+            # httpx sends raw bodies passed as content, not data
+            kwargs["content"] = kwargs.pop("data")
+            if hasattr(data, "read"):
+                kwargs["headers"]["Content-Length"] = str(len(data))
+        return kwargs
+
+    async def _send_attempt(self, method: str, url: str, **kwargs):
+        limiter = self.transport.rate_limiter
+        if limiter is None:
+            return await self.transport.request(method, url, **kwargs)
+        async with limiter.aacquire():
+            return await self.transport.request(method, url, **kwargs)
+
+    # =================== FLOW DRIVERS ===================
+
+    async def _run(self, flow: Flow) -> Any:
+        """Run ``flow`` to completion on the event loop and return its result."""
+        value, error = None, None
+        while True:
+            try:
+                step = _advance(flow, value, error)
+            except StopIteration as stop:
+                return stop.value
+            value, error = await _resolve(step)
+
+    async def _iterate(self, flow: Flow) -> AsyncIterator:
+        """Run a streaming flow, yielding the values it ``Emit``s."""
+        value, error = None, None
+        try:
+            while True:
+                try:
+                    step = _advance(flow, value, error)
+                except StopIteration:
+                    return
+                if isinstance(step, Emit):
+                    value, error = None, None
+                    for item in step.values:
+                        yield item
+                else:
+                    value, error = await _resolve(step)
+        finally:
+            await self._close_flow(flow)
+
+    async def _close_flow(self, flow: Flow) -> None:
+        try:
+            step = flow.throw(GeneratorExit)
+            while True:
+                step = _advance(flow, *await _resolve(step))
+        except (GeneratorExit, StopIteration):
+            pass
+
+    # =================== FLOW STEPS ===================
+
+    async def _result(self, value: Any) -> Any:
+        return value
+
+    def _sleep(self, seconds: float):
+        return asyncio.sleep(seconds)
+
+    async def _map(self, fn: Callable, items: Iterable, concurrency: int) -> List:
+        return [result async for result in aimap_ordered(fn, items, concurrency)]
+
+    def _imap(self, fn: Callable, items: Iterable, concurrency: int) -> AsyncIterator:
+        return aimap_ordered(fn, items, concurrency)
+
+    def _next(self, iterator: AsyncIterator):
+        return anext(iterator, END)
+
+    async def _for_each(self, items: AsyncIterator, fn: Callable[[Any], None]) -> None:
+        async for item in items:
+            fn(item)
+
+    def _batches(self, items, size: int) -> AsyncIterator[List]:
+        return abatched(items, size)
+
+    def _enumerate(self, items, start: int = 0) -> AsyncIterator:
+        return aenumerate(items, start)
+
+    def _unique(self, items) -> AsyncIterator:
+        return aunique(items)
+
+    def _body(self, response, chunk_size: int) -> AsyncIterator[bytes]:
+        return response.aiter_bytes(chunk_size)
+
+    def _read(self, response):
+        return response.aread()
+
+    def _close(self, response):
+        return response.aclose()
+
+    def _call_blocking(self, fn: Callable, *args):
+        """Call a CPU- or thread-bound function on a worker thread."""
+        return asyncio.to_thread(fn, *args)
@@ -0,0 +1,126 @@
+"""Asyncio variants of the route clients.
+
+Each client inherits its sync counterpart's methods, so payloads are built and
+responses handled by the same code; multi-step methods run as shared flows
+driven by ``AsyncBaseClient``. Only steps with no shared form are overridden
+here.
+"""
+
+import asyncio
+from typing import Callable
+from .async_base import AsyncBaseClient
+from .base import Flow
+from .generation import GenerationClient
+from .templates import TemplatesClient
+from .api_keys import ApiKeysClient
+from .connections import ConnectionsClient
+from .projects import ProjectsClient
+from .users import UsersClient
+from .teams import TeamsClient, TeamMembersClient
+from .custom_types import CustomDataTypesClient, EndpointFoldersClient, EndpointsClient
+from .folders_and_utils import TemplateFoldersClient, ShortcutsClient, FeedbackClient
+from .export_and_validation import ExportClient, ValidationClient
+from .scenario_files import ScenarioFilesClient
+from .sets import SetsClient
+from .keymaps import KeyMapsClient
+from ..columnar import aiter_columnar
+from ..download import RangedDownload
+from ..transport import Transport
+
+
+class AsyncGenerationClient(AsyncBaseClient, GenerationClient):
+    """Async client for data generation operations."""
+
+    _columnar_batches = staticmethod(aiter_columnar)
+
+
+class AsyncTemplatesClient(AsyncBaseClient, TemplatesClient):
+    """Async client for template operations."""
+
+
+class AsyncApiKeysClient(AsyncBaseClient, ApiKeysClient):
+    """Async client for API key operations."""
+
+
+class AsyncConnectionsClient(AsyncBaseClient, ConnectionsClient):
+    """Async client for database connection operations."""
+
+
+class AsyncProjectsClient(AsyncBaseClient, ProjectsClient):
+    """Async client for project operations."""
+
+
+class AsyncUsersClient(AsyncBaseClient, UsersClient):
+    """Async client for user management operations."""
+
+
+class AsyncTeamsClient(AsyncBaseClient, TeamsClient):
+    """Async client for team operations."""
+
+
+class AsyncTeamMembersClient(AsyncBaseClient, TeamMembersClient):
+    """Async client for team member operations."""
+
+
+class AsyncCustomDataTypesClient(AsyncBaseClient, CustomDataTypesClient):
+    """Async client for custom data type operations."""
+
+
+class AsyncEndpointFoldersClient(AsyncBaseClient, EndpointFoldersClient):
+    """Async client for endpoint folder operations."""
+
+
+class AsyncEndpointsClient(AsyncBaseClient, EndpointsClient):
+    """Async client for endpoint operations."""
+
+
+class AsyncTemplateFoldersClient(AsyncBaseClient, TemplateFoldersClient):
+    """Async client for template folder operations."""
+
+
+class AsyncShortcutsClient(AsyncBaseClient, ShortcutsClient):
+    """Async client for shortcut operations."""
+
+
+class AsyncFeedbackClient(AsyncBaseClient, FeedbackClient):
+    """Async client for feedback operations."""
+
+
+class AsyncExportClient(AsyncBaseClient, ExportClient):
+    """Async client for export operations."""
+
+
+class AsyncValidationClient(AsyncBaseClient, ValidationClient):
+    """Async client for validation operations."""
+
+
+class AsyncScenarioFilesClient(AsyncBaseClient, ScenarioFilesClient):
+    """Async client for scenario file operations."""
+
+    async def _run_ranged(
+        self, url_flow: Callable[[], Flow], destination_path: str, **options
+    ) -> str:
+        """Run a ``RangedDownload`` on a worker thread.
+
+        The ranged engine writes parts from a thread pool, so it runs off the
+        event loop over its own pooled session; URL refreshes are sent back to
+        the loop through the async API client.
+        """
+        loop = asyncio.get_running_loop()
+
+        def refresh():
+            return asyncio.run_coroutine_threadsafe(
+                self._run(url_flow()), loop
+            ).result()
+
+        with Transport(retry=self.transport.retry) as transport:
+            download = RangedDownload(transport, refresh, destination_path, **options)
+            return await asyncio.to_thread(download.run)
+
+
+class AsyncSetsClient(AsyncBaseClient, SetsClient):
+    """Async client for set operations."""
+
+
+class AsyncKeyMapsClient(AsyncBaseClient, KeyMapsClient):
+    """Async client for key map operations."""
@@ -1,7 +1,45 @@
+"""Base client shared by every route client.
+
+Operations that take more than one step (retries, fallbacks, pagination,
+concurrent batches) are written once, as generator "flows" that ``yield``
+each call that talks to the network or waits, and receive its result back:
+
+    rows = yield self.get_set(set_id)
+
+In the sync client the call has already returned by the time it is
+yielded, so ``_run`` hands the value straight back. The async client's
+route methods return awaitables instead, and its ``_run`` awaits each one,
+throwing any error back into the flow at the ``yield``. The step helpers
+(``_sleep``, ``_map``, ``_imap``, ``_next``, ``_for_each``, ``_body``,
+``_read``, ``_close``, ``_call_blocking``) are the only places that block,
+and the only methods the async client overrides, together with the helpers
+that consume caller input (``_batches``, ``_enumerate``, ``_unique``), which
+in the async client also accept async iterables. Streaming flows hand values
+to their consumer by yielding ``Emit``; ``_iterate`` turns them into an
+iterator.
+"""
+
 import os
+import time
 import requests
-from typing import Optional, Dict
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional
+from ..concurrency import batched, imap_ordered, unique
 from ..error import DataMakerError
+from ..transport import Transport
+
+Flow = Generator[Any, Any, Any]
+
+# Returned by ``_next`` once an iterator is exhausted
+END = object()
+
+
+class Emit:
+    """Values a streaming flow hands to its consumer, in order."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable):
+        self.values = values
 
 
 class BaseClient:
@@ -13,6 +51,7 @@ class BaseClient:
         default_headers: Dict[str, Optional[str]] = None,
         base_url: Optional[str] = None,
         verify: bool = True,
+        transport: Optional[Transport] = None,
     ):
         if default_headers is None:
             default_headers = {"Content-Type": "application/json"}
@@ -25,16 +64,173 @@ class BaseClient:
         # Use DATAMAKER_API_URL environment variable if base_url is not provided
         self.base_url = base_url or os.getenv("DATAMAKER_API_URL") or "https://api.datamaker.automators.com"
         self.verify = verify
+        # Share the caller's pooled transport, or open a private one
+        self.transport = transport or Transport()
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Make an HTTP request to the API.
+
+        Throttled (429) and transiently unavailable responses are retried
+        according to the transport's ``RetryPolicy`` when the request is safe
+        to repeat. Pass ``idempotent=True`` for non-GET requests that are, e.g.
+        last-write-wins upserts. ``headers`` are merged over the client's
+        default headers.
+        """
+        return self._run(self._request_flow(method, endpoint, idempotent, kwargs))
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make an HTTP request to the API."""
+    def _request_flow(
+        self, method: str, endpoint: str, idempotent: Optional[bool], kwargs: Dict
+    ) -> Flow:
+        """Send a request, retrying it as the transport's policy allows."""
         url = f"{self.base_url}{endpoint}"
+        kwargs = self._request_kwargs(kwargs)
+
+        retry = self.transport.retry
+        retryable = retry.allows(method, idempotent)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                response = yield self._send_attempt(method, url, **kwargs)
+            except self.transport.transport_errors:
+                delay = retry.next_delay(attempt, started) if retryable else None
+                if delay is None:
+                    raise
+            else:
+                if response.status_code in [200, 201]:
+                    return response
+                delay = None
+                retry_after = response.headers.get("Retry-After")
+                if retryable and response.status_code in retry.retry_statuses:
+                    delay = retry.next_delay(attempt, started, retry_after)
+                if kwargs.get("stream"):
+                    # Load the body for the error message
+                    yield self._read(response)
+                yield self._close(response)
+                if delay is None:
+                    raise DataMakerError(
+                        f"API request failed: {response.text}",
+                        status_code=response.status_code,
+                        retry_after=retry_after,
+                    )
+
+            yield self._sleep(delay)
+            attempt += 1
+
+    def _request_kwargs(self, kwargs: Dict) -> Dict:
+        """Fill in the per-request options the transport needs."""
         # Ensure verify is passed to requests, but allow kwargs to override if needed
         if "verify" not in kwargs:
             kwargs["verify"] = self.verify
-        response = requests.request(method, url, headers=self.headers, **kwargs)
+        kwargs["headers"] = self._request_headers(kwargs)
+        return kwargs
+
+    def _request_headers(self, kwargs: Dict) -> Dict[str, Optional[str]]:
+        """Merge per-request ``headers`` from ``kwargs`` over the defaults."""
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        if "files" in kwargs:
+            # Let the HTTP library set the multipart boundary
+            headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+        return headers
+
+    def _send_attempt(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one attempt, waiting on the shared rate limiter if configured."""
+        limiter = self.transport.rate_limiter
+        if limiter is None:
+            return self.transport.request(method, url, **kwargs)
+        with limiter.acquire():
+            return self.transport.request(method, url, **kwargs)
+
+    # =================== FLOW DRIVERS ===================
+
+    def _run(self, flow: Flow) -> Any:
+        """Run ``flow`` to completion and return its result."""
+        try:
+            step = next(flow)
+            while True:
+                step = flow.send(step)
+        except StopIteration as stop:
+            return stop.value
+
+    def _iterate(self, flow: Flow) -> Iterator:
+        """Run a streaming flow, yielding the values it ``Emit``s."""
+        value = None
+        try:
+            while True:
+                try:
+                    step = flow.send(value)
+                except StopIteration:
+                    return
+                value = None
+                if isinstance(step, Emit):
+                    yield from step.values
+                else:
+                    value = step
+        finally:
+            self._close_flow(flow)
+
+    def _close_flow(self, flow: Flow) -> None:
+        """Let a flow the consumer stopped early run its cleanup steps."""
+        try:
+            step = flow.throw(GeneratorExit)
+            while True:
+                step = flow.send(step)
+        except (GeneratorExit, StopIteration):
+            pass
+
+    # =================== FLOW STEPS ===================
+
+    def _result(self, value: Any) -> Any:
+        """Return ``value`` the way this client returns API results."""
+        return value
+
+    def _sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def _map(self, fn: Callable, items: Iterable, concurrency: int) -> List:
+        """``fn`` applied to ``items`` with ``concurrency`` calls in flight."""
+        return list(imap_ordered(fn, items, concurrency))
+
+    def _imap(self, fn: Callable, items: Iterable, concurrency: int) -> Iterator:
+        """Lazy ``_map``, for consuming with ``_next`` or ``_for_each``."""
+        return imap_ordered(fn, items, concurrency)
+
+    def _next(self, iterator: Iterator) -> Any:
+        """The iterator's next item, or ``END``."""
+        return next(iterator, END)
+
+    def _for_each(self, items: Iterable, fn: Callable[[Any], None]) -> None:
+        """Call ``fn`` on each item of a (possibly streaming) iterable."""
+        for item in items:
+            fn(item)
+
+    def _batches(self, items: Iterable, size: int) -> Iterator[List]:
+        """Lazily split caller-supplied ``items`` into lists of ``size``."""
+        return batched(items, size)
+
+    def _enumerate(self, items: Iterable, start: int = 0) -> Iterator:
+        return enumerate(items, start)
+
+    def _unique(self, items: Iterable) -> Iterator:
+        """``items`` without repeats, in first-seen order."""
+        return unique(items)
+
+    def _body(self, response, chunk_size: int) -> Iterator[bytes]:
+        """An iterator over a streamed response body."""
+        return iter(response.iter_content(chunk_size))
+
+    def _read(self, response) -> bytes:
+        return response.content
 
-        if response.status_code not in [200, 201]:
-            raise DataMakerError(f"API request failed: {response.text}")
+    def _close(self, response) -> None:
+        response.close()
 
-        return response
+    def _call_blocking(self, fn: Callable, *args) -> Any:
+        """Call a CPU- or thread-bound function."""
+        return fn(*args)
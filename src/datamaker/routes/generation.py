@@ -1,14 +1,333 @@
-from .base import BaseClient
+from typing import Dict, Iterator, List, Optional, Union
+from .base import END, BaseClient, Emit, Flow
+from ..columnar import (
+    COLUMNAR_BATCH_SIZE,
+    ColumnBuilder,
+    ColumnarResult,
+    iter_columnar,
+    schema_from_template,
+)
+from ..error import DataMakerError
+from ..local_generator import LocalGenerator
+from ..planner import TemplatePlan, plan_template
+from ..sharding import DEFAULT_SHARDS, run_shards
+from ..streaming import JSONArrayParser
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CONCURRENCY = 4
+DEFAULT_CHUNK_RETRIES = 2
+STREAM_READ_SIZE = 64 * 1024
 
 
 class GenerationClient(BaseClient):
     """Client for data generation operations."""
 
-    def generate(self, template):
-        """Generate data using a template."""
+    def generate(self, template, columnar: bool = False):
+        """Generate data using a template.
+
+        Args:
+            template: A ``Template`` or template dictionary.
+            columnar: Return a ``ColumnarResult`` filled column by column as
+                the response streams in, instead of a list of row dicts.
+        """
+        if columnar:
+            return self._generate_columnar(template)
         response = self._make_request(
             "POST",
             "/datamaker",
             json=template.to_dict() if hasattr(template, "to_dict") else template,
         )
         return response.json()
+
+    def _generate_columnar(self, template) -> ColumnarResult:
+        return self._run(self._columnar_flow(template))
+
+    def _columnar_flow(self, template) -> Flow:
+        builder = ColumnBuilder(schema_from_template(template))
+        yield self._for_each(self.iter_generate(template), builder.append)
+        return builder.build()
+
+    def generate_hybrid(
+        self,
+        template,
+        quantity: Optional[int] = None,
+        columnar: bool = False,
+        seed: Optional[int] = None,
+    ) -> Union[List[Dict], ColumnarResult]:
+        """Generate cheap fields locally and only the rest through the API.
+
+        ``UUID``, ``Number``, ``Float``, ``Boolean``, ``Custom`` and ``Words``
+        fields are sampled locally with NumPy, and ``Derived`` fields whose
+        placeholders all name template fields are substituted locally after
+        the fields they reference. Only the remaining fields (plus any that
+        a server-side ``Derived`` value references) are sent to
+        ``/datamaker``, as one request, and the columns are joined back by
+        row index in template order. Requires NumPy.
+
+        Args:
+            template: A ``Template`` or template dictionary.
+            quantity: Optional row count overriding the template's quantity.
+            columnar: Return a ``ColumnarResult`` instead of row dicts.
+            seed: Seed for the locally generated fields.
+
+        Returns:
+            The generated rows, as ``generate`` returns them.
+
+        Raises:
+            DataMakerError: If local ``Derived`` fields reference each other
+                in a cycle, or the API returns rows that do not match.
+        """
+        generator = LocalGenerator(seed=seed)
+        plan = generator.plan(template)
+        if quantity is None:
+            quantity = plan.payload.get("quantity")
+        return self._run(self._hybrid_flow(plan, generator, quantity, columnar))
+
+    def _hybrid_flow(
+        self,
+        plan: TemplatePlan,
+        generator: LocalGenerator,
+        quantity: Optional[int],
+        columnar: bool,
+    ) -> Flow:
+        remote = None
+        if plan.remote:
+            remote = yield self.generate(plan.remote_template(quantity), columnar=True)
+        return generator.execute(plan, quantity, remote, columnar)
+
+    def generate_sharded(
+        self,
+        template,
+        quantity: Optional[int] = None,
+        shards: int = DEFAULT_SHARDS,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[List[Dict], ColumnarResult]:
+        """Generate a template locally in seeded shards on a process pool.
+
+        The rows are cut into ``shards`` contiguous shards, and shard ``i``
+        is sampled from a NumPy ``SeedSequence`` derived from ``(seed, i)``.
+        Because neither depends on ``workers``, the same template,
+        quantity, ``shards`` and ``seed`` give identical rows however many
+        processes run. Only locally generated field types are supported
+        (see ``generate_hybrid``); no API request is made. Requires NumPy.
+
+        Worker processes are started with ``spawn``, which re-imports the
+        main module in each worker. A script calling this with more than one
+        worker must do so under ``if __name__ == "__main__":``, or every
+        worker runs the script again and the pool breaks.
+
+        Args:
+            template: A ``Template``, ``AccountTemplate`` or template
+                dictionary.
+            quantity: Optional row count overriding the template's quantity.
+            shards: Number of shards. Changing it changes the rows.
+            seed: Base seed; defaults to the template's ``seed``, if any.
+            workers: Number of worker processes; defaults to the CPU count,
+                capped at ``shards``. ``1`` runs in this process.
+            columnar: Return a ``ColumnarResult`` instead of row dicts.
+
+        Returns:
+            The generated rows, in shard order.
+
+        Raises:
+            DataMakerError: If a field must be generated by the API, no
+                quantity is given, or a worker process dies.
+        """
+        plan = plan_template(template, LocalGenerator.supports)
+        if quantity is None:
+            quantity = plan.payload.get("quantity")
+        if quantity is None:
+            raise DataMakerError("quantity is required for sharded generation.")
+        if seed is None:
+            seed = getattr(template, "seed", None)
+            if seed is None and isinstance(template, dict):
+                seed = template.get("seed")
+        return self._call_blocking(
+            self._run_shards, plan, quantity, shards, seed, workers, columnar
+        )
+
+    def _run_shards(
+        self,
+        plan: TemplatePlan,
+        quantity: int,
+        shards: int,
+        seed: Optional[int],
+        workers: Optional[int],
+        columnar: bool,
+    ) -> Union[List[Dict], ColumnarResult]:
+        result = run_shards(plan, quantity, shards, seed, workers)
+        return result if columnar else result.to_rows()
+
+    def iter_generate(
+        self,
+        template,
+        quantity: Optional[int] = None,
+        read_size: int = STREAM_READ_SIZE,
+        columnar: bool = False,
+        batch_size: int = COLUMNAR_BATCH_SIZE,
+    ) -> Iterator[Union[Dict, ColumnarResult]]:
+        """Generate data and yield rows as the response body streams in.
+
+        The body is read in ``read_size`` pieces and parsed incrementally, so
+        peak memory stays flat regardless of how many rows come back. Useful
+        for piping rows straight into a file or database writer.
+
+        Args:
+            template: A ``Template`` or template dictionary.
+            quantity: Optional row count overriding the template's quantity.
+            read_size: Bytes to read from the response per step.
+            columnar: Yield ``ColumnarResult`` batches of up to ``batch_size``
+                rows instead of row dicts.
+            batch_size: Rows per batch when ``columnar`` is set.
+
+        Returns:
+            An iterator over the generated row dictionaries.
+
+        Example:
+            >>> for row in client.iter_generate(template, 100_000):
+            ...     writer.writerow(row)
+        """
+        payload = template.to_dict() if hasattr(template, "to_dict") else template
+        if quantity is not None:
+            payload = {**payload, "quantity": quantity}
+
+        rows = self._iterate(self._stream_flow(payload, read_size))
+        if columnar:
+            return self._columnar_batches(
+                rows, batch_size, schema_from_template(payload)
+            )
+        return rows
+
+    def _stream_flow(self, payload: Dict, read_size: int) -> Flow:
+        """POST ``payload`` and emit rows as the response body streams in."""
+        response = yield self._make_request(
+            "POST", "/datamaker", json=payload, stream=True
+        )
+        try:
+            parser = JSONArrayParser()
+            chunks = self._body(response, read_size)
+            while (chunk := (yield self._next(chunks))) is not END:
+                yield Emit(parser.feed(chunk))
+            yield Emit(parser.close())
+        finally:
+            yield self._close(response)
+
+    # The async client overrides this with an async generator
+    _columnar_batches = staticmethod(iter_columnar)
+
+    def generate_bulk(
+        self,
+        template,
+        quantity: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_RETRIES,
+        columnar: bool = False,
+    ) -> Union[List[Dict], ColumnarResult]:
+        """Generate a large quantity of rows as concurrent chunks.
+
+        Splits ``quantity`` into requests of at most ``chunk_size`` rows and
+        sends up to ``concurrency`` of them at once over the pooled transport.
+        Each chunk is retried on its own after a transient failure (dropped
+        connection, throttling or server error), so one failed request does
+        not lose the whole run.
+
+        Args:
+            template: A ``Template`` or template dictionary. Its own
+                ``quantity`` is ignored.
+            quantity: Total number of rows to generate.
+            chunk_size: Maximum rows per request.
+            concurrency: Maximum number of chunk requests in flight.
+            retries: Extra attempts per chunk before giving up.
+            columnar: Return one ``ColumnarResult`` instead of row dicts.
+                Each chunk is converted as it streams in.
+
+        Returns:
+            The generated rows, in chunk order.
+
+        Raises:
+            DataMakerError: If a chunk is rejected with a client error
+                (4xx), or still fails after its retries.
+        """
+        chunks = self.iter_generate_bulk(
+            template, quantity, chunk_size, concurrency, retries, columnar
+        )
+        return self._run(self._collect_flow(chunks, columnar))
+
+    def _collect_flow(self, chunks, columnar: bool) -> Flow:
+        collected = []
+        yield self._for_each(chunks, collected.append)
+        return ColumnarResult.concat(collected) if columnar else collected
+
+    def iter_generate_bulk(
+        self,
+        template,
+        quantity: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_RETRIES,
+        columnar: bool = False,
+    ) -> Iterator[Union[Dict, ColumnarResult]]:
+        """Like ``generate_bulk``, but yield rows in order as chunks complete.
+
+        Only ``concurrency`` chunks are held in memory at a time. With
+        ``columnar`` set, each chunk is yielded as one ``ColumnarResult``.
+        """
+        payloads = self._chunk_payloads(template, quantity, chunk_size)
+        return self._iterate(self._bulk_flow(payloads, concurrency, retries, columnar))
+
+    def _bulk_flow(
+        self, payloads: Iterator[Dict], concurrency: int, retries: int, columnar: bool
+    ) -> Flow:
+        chunks = self._imap(
+            lambda item: self._generate_chunk(*item, retries, columnar),
+            enumerate(payloads),
+            concurrency,
+        )
+        while (rows := (yield self._next(chunks))) is not END:
+            yield Emit([rows] if columnar else rows)
+
+    @staticmethod
+    def _chunk_payloads(template, quantity: int, chunk_size: int) -> Iterator[Dict]:
+        """Yield one template payload per chunk of ``quantity``."""
+        if chunk_size < 1:
+            raise DataMakerError("chunk_size must be at least 1.")
+
+        payload = template.to_dict() if hasattr(template, "to_dict") else template
+        for start in range(0, quantity, chunk_size):
+            yield {**payload, "quantity": min(chunk_size, quantity - start)}
+
+    def _generate_chunk(
+        self, index: int, payload: Dict, retries: int, columnar: bool = False
+    ) -> Union[List[Dict], ColumnarResult]:
+        """Generate one chunk, retrying transient failures with backoff.
+
+        Whether a failure is transient, and how long to wait before the next
+        attempt, is decided by the transport's ``RetryPolicy``, so a throttled
+        chunk honors the server's ``Retry-After``. Client errors (4xx) are
+        raised at once, since repeating the request cannot fix them.
+        """
+        return self._run(self._chunk_flow(index, payload, retries, columnar))
+
+    def _chunk_flow(
+        self, index: int, payload: Dict, retries: int, columnar: bool
+    ) -> Flow:
+        retry = self.transport.retry
+        transport_errors = self.transport.transport_errors
+        for attempt in range(retries + 1):
+            try:
+                return (yield self.generate(payload, columnar=columnar))
+            except (DataMakerError, *transport_errors) as e:
+                if isinstance(e, DataMakerError) and not retry.is_transient(
+                    e.status_code
+                ):
+                    raise
+                if attempt == retries:
+                    raise DataMakerError(
+                        f"Generation chunk {index} failed after "
+                        f"{retries + 1} attempts: {e}"
+                    ) from e
+                delay = retry.backoff(attempt, getattr(e, "retry_after", None))
+            yield self._sleep(delay)
@@ -8,14 +8,83 @@ concurrency-safe. Entries are unique per (project, map name, object, old key)
 and the last write wins for the new key.
 """
 
+import math
 import os
-from typing import Dict, List, Optional
-from .base import BaseClient
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .base import END, BaseClient, Emit, Flow
+from ..cache import TTLCache
 from ..error import DataMakerError
+from ..local_keymap import LocalKeyMap
+
+# Server-side caps per call
+KEYMAP_BATCH_LIMIT = 5000
+KEYMAP_PAGE_LIMIT = 500
+DEFAULT_KEYMAP_CONCURRENCY = 4
+
+# The lookup cache is opt-in: other workers may remap keys at any time
+DEFAULT_KEYMAP_CACHE_SIZE = 0
+DEFAULT_KEYMAP_CACHE_TTL = 300.0
+
+_MISSING = object()
+
+# Entries per write when exporting a snapshot
+SNAPSHOT_WRITE_BATCH = 5000
+
+
+class _KeyMapSnapshot:
+    """Builds a ``LocalKeyMap`` file next to ``path`` and moves it into place."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._tmp_path = f"{path}.partial"
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+        # A partial file is discarded on failure, so skip the journal
+        self._store = LocalKeyMap(self._tmp_path, bulk_load=True)
+
+    def add(self, entries: Iterable[Dict]) -> None:
+        self.count += self._store.add(entries)
+
+    def commit(self, meta: Dict[str, str]) -> None:
+        self._store.set_meta(entryCount=self.count, **meta)
+        self._store.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._store.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+KeyPairs = Union[Dict[str, str], Iterable[Tuple[str, str]]]
 
 
 class KeyMapsClient(BaseClient):
-    """Client for key map operations (old-to-new key mappings)."""
+    """Client for key map operations (old-to-new key mappings).
+
+    ``keymap_lookup`` can read through ``lookup_cache`` (LRU with TTL), keyed
+    by (project, map name, object, old key), so hot keys skip the round trip.
+    ``keymap_put`` writes through to it and ``delete_keymap`` clears it. Keys
+    reported as ``missing`` are cached for ``missing_ttl`` seconds when that
+    is positive. The cache is disabled unless a ``TTLCache`` with a positive
+    ``maxsize`` is passed.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lookup_cache: Optional[TTLCache] = None,
+        missing_ttl: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if lookup_cache is None:
+            lookup_cache = TTLCache(
+                maxsize=DEFAULT_KEYMAP_CACHE_SIZE, ttl=DEFAULT_KEYMAP_CACHE_TTL
+            )
+        self.lookup_cache = lookup_cache
+        self.missing_ttl = missing_ttl
 
     def get_keymaps(self, project_id: Optional[str] = None) -> List[Dict]:
         """List key maps for a project: one row per (mapName, object).
@@ -75,6 +144,26 @@ class KeyMapsClient(BaseClient):
             ...     {"MAT-001": "700001", "MAT-002": "700002"},
             ... )
         """
+        payload = self._put_payload(map_name, object, entries, run_id, project_id)
+        return self._run(self._put_flow(payload))
+
+    def _put_flow(self, payload: Dict) -> Flow:
+        # Last write wins, so a repeated upsert is safe to retry
+        result = yield self._make_request(
+            "POST", "/keymaps/entries", json=payload, idempotent=True
+        ).json()
+        self._cache_put(payload)
+        return result
+
+    @staticmethod
+    def _put_payload(
+        map_name: str,
+        object: str,
+        entries: Dict[str, str],
+        run_id: Optional[str],
+        project_id: Optional[str],
+    ) -> Dict:
+        """Validate keymap_put arguments and build the request body."""
         if not map_name:
             raise DataMakerError("map_name is required to put key map entries.")
         if not object:
@@ -96,9 +185,141 @@ class KeyMapsClient(BaseClient):
             payload["runId"] = run_id
         if project_id:
             payload["projectId"] = project_id
+        return payload
+
+    @staticmethod
+    def _cache_scope(payload: Dict) -> Tuple:
+        """The (project, map name, object) part of a lookup cache key."""
+        return (payload.get("projectId"), payload["mapName"], payload["object"])
+
+    def _cache_put(self, payload: Dict) -> None:
+        """Write the entries of a successful keymap_put through to the cache."""
+        if self.lookup_cache.maxsize <= 0:
+            return
+        scope = self._cache_scope(payload)
+        for entry in payload["entries"]:
+            self.lookup_cache.set(scope + (entry["oldKey"],), entry["newKey"])
+
+    def keymap_put_bulk(
+        self,
+        map_name: str,
+        object: str,
+        entries: KeyPairs,
+        batch_size: int = KEYMAP_BATCH_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        run_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> Dict:
+        """Record any number of old-to-new key mappings in parallel batches.
 
-        response = self._make_request("POST", "/keymaps/entries", json=payload)
-        return response.json()
+        ``entries`` is consumed lazily and split into ``keymap_put`` calls of
+        at most ``batch_size`` pairs, with up to ``concurrency`` batches in
+        flight (the server accepts concurrent writes). A failed batch does not
+        stop the run; it is reported in ``failed`` so it can be replayed.
+
+        Batches may complete in any order, so if the same old key appears in
+        more than one batch the surviving new key is undefined unless
+        ``concurrency`` is 1.
+
+        Args:
+            map_name: Logical map name grouping the entries.
+            object: The domain object type the keys belong to.
+            entries: A dict or any iterable/generator of ``(old_key, new_key)``
+                pairs (or, on ``AsyncDataMaker``, an async iterable of pairs).
+            batch_size: Pairs per request (server-capped at 5000).
+            concurrency: Maximum batches in flight.
+            run_id: Optional run/job id that minted these keys.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            A dictionary with ``mapName``, ``object``, ``upserted`` (total
+            count), ``batches`` (number sent) and ``failed`` - a list of
+            ``{"batch", "entries", "error"}`` for batches that failed after
+            retries.
+
+        Raises:
+            DataMakerError: If ``map_name`` or ``object`` is empty, or
+                ``batch_size`` is out of range.
+
+        Example:
+            >>> pairs = ((row.old, row.new) for row in read_rows())
+            >>> result = dm.keymap_put_bulk(
+            ...     "sap-material-migration", "Material", pairs, concurrency=8
+            ... )
+            >>> result["upserted"], len(result["failed"])
+        """
+        batches = self._put_batches(map_name, object, entries, batch_size)
+        return self._run(
+            self._put_bulk_flow(
+                map_name, object, batches, concurrency, run_id, project_id
+            )
+        )
+
+    def _put_bulk_flow(
+        self,
+        map_name: str,
+        object: str,
+        batches: Iterator[Tuple[int, List[Tuple[str, str]]]],
+        concurrency: int,
+        run_id: Optional[str],
+        project_id: Optional[str],
+    ) -> Flow:
+        def put_batch_flow(index, pairs):
+            batch = dict(pairs)
+            try:
+                result = yield self.keymap_put(
+                    map_name, object, batch, run_id=run_id, project_id=project_id
+                )
+            except (DataMakerError, *self.transport.request_errors) as e:
+                result = e
+            return index, batch, result
+
+        summary = self._put_summary(map_name, object)
+        yield self._for_each(
+            self._imap(
+                lambda item: self._run(put_batch_flow(*item)), batches, concurrency
+            ),
+            lambda done: self._add_put_result(summary, *done),
+        )
+        return summary
+
+    def _put_batches(
+        self, map_name: str, object: str, entries: KeyPairs, batch_size: int
+    ) -> Iterator[Tuple[int, List[Tuple[str, str]]]]:
+        """Validate bulk-put arguments and lazily split entries into batches."""
+        if not map_name:
+            raise DataMakerError("map_name is required to put key map entries.")
+        if not object:
+            raise DataMakerError("object is required to put key map entries.")
+        if not 1 <= batch_size <= KEYMAP_BATCH_LIMIT:
+            raise DataMakerError(
+                f"batch_size must be between 1 and {KEYMAP_BATCH_LIMIT}."
+            )
+
+        if isinstance(entries, dict):
+            entries = entries.items()
+        return self._enumerate(self._batches(entries, batch_size))
+
+    @staticmethod
+    def _put_summary(map_name: str, object: str) -> Dict:
+        return {
+            "mapName": map_name,
+            "object": object,
+            "upserted": 0,
+            "batches": 0,
+            "failed": [],
+        }
+
+    @staticmethod
+    def _add_put_result(summary: Dict, index: int, batch: Dict, result) -> None:
+        """Fold one batch's keymap_put result (or exception) into the summary."""
+        summary["batches"] += 1
+        if isinstance(result, Exception):
+            summary["failed"].append(
+                {"batch": index, "entries": batch, "error": str(result)}
+            )
+        else:
+            summary["upserted"] += result.get("upserted", len(batch))
 
     def keymap_lookup(
         self,
@@ -136,6 +357,32 @@ class KeyMapsClient(BaseClient):
             >>> result["missing"]
             ['MAT-999']
         """
+        payload = self._lookup_payload(map_name, object, old_keys, project_id)
+        if self.lookup_cache.maxsize <= 0:
+            # Read-only despite being a POST, so safe to retry
+            response = self._make_request(
+                "POST", "/keymaps/lookup", json=payload, idempotent=True
+            )
+            return response.json()
+        return self._run(self._cached_lookup_flow(payload))
+
+    def _cached_lookup_flow(self, payload: Dict) -> Flow:
+        result, payload["oldKeys"] = self._lookup_cached(payload)
+        if payload["oldKeys"]:
+            fetched = yield self._make_request(
+                "POST", "/keymaps/lookup", json=payload, idempotent=True
+            ).json()
+            self._cache_lookup(payload, fetched, result)
+        return result
+
+    @staticmethod
+    def _lookup_payload(
+        map_name: str,
+        object: str,
+        old_keys: List[str],
+        project_id: Optional[str],
+    ) -> Dict:
+        """Validate keymap_lookup arguments and build the request body."""
         if not map_name:
             raise DataMakerError("map_name is required to look up key mappings.")
         if not object:
@@ -152,9 +399,128 @@ class KeyMapsClient(BaseClient):
         }
         if project_id:
             payload["projectId"] = project_id
+        return payload
+
+    def _lookup_cached(self, payload: Dict) -> Tuple[Dict, List[str]]:
+        """Answer a lookup from the cache, returning the keys still to fetch."""
+        scope = self._cache_scope(payload)
+        result: Dict = {"mappings": {}, "missing": []}
+        uncached = []
+        for old_key in payload["oldKeys"]:
+            new_key = self.lookup_cache.get(scope + (old_key,), _MISSING)
+            if new_key is _MISSING:
+                uncached.append(old_key)
+            elif new_key is None:
+                result["missing"].append(old_key)
+            else:
+                result["mappings"][old_key] = new_key
+        return result, uncached
+
+    def _cache_lookup(self, payload: Dict, fetched: Dict, result: Dict) -> None:
+        """Cache a fetched lookup result and merge it into ``result``."""
+        scope = self._cache_scope(payload)
+        for old_key, new_key in fetched.get("mappings", {}).items():
+            self.lookup_cache.set(scope + (old_key,), new_key)
+        if self.missing_ttl > 0:
+            for old_key in fetched.get("missing", []):
+                self.lookup_cache.set(scope + (old_key,), None, ttl=self.missing_ttl)
+        self._merge_lookup(result, fetched)
+
+    def keymap_lookup_bulk(
+        self,
+        map_name: str,
+        object: str,
+        old_keys: Iterable[str],
+        batch_size: int = KEYMAP_BATCH_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ) -> Dict:
+        """Translate any number of source-system keys in parallel batches.
 
-        response = self._make_request("POST", "/keymaps/lookup", json=payload)
-        return response.json()
+        Keys are de-duplicated before sending, split into ``keymap_lookup``
+        calls of at most ``batch_size`` keys and looked up with up to
+        ``concurrency`` batches in flight. The per-batch results are merged.
+
+        Args:
+            map_name: The key map to look up in.
+            object: The domain object type, e.g. "Material".
+            old_keys: Source-system keys to translate; any iterable or
+                generator (or, on ``AsyncDataMaker``, an async iterable),
+                duplicates allowed.
+            batch_size: Keys per request (server-capped at 5000).
+            concurrency: Maximum batches in flight.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            A dictionary with ``mapName``, ``object``, ``mappings`` (old key to
+            new key for every key found) and ``missing`` (unique keys with no
+            mapping, in first-seen order).
+
+        Example:
+            >>> result = dm.keymap_lookup_bulk(
+            ...     "sap-material-migration",
+            ...     "Material",
+            ...     (order["material"] for order in orders),
+            ...     concurrency=8,
+            ... )
+        """
+        merged: Dict = {
+            "mapName": map_name,
+            "object": object,
+            "mappings": {},
+            "missing": [],
+        }
+        results = self.iter_keymap_lookup(
+            map_name, object, old_keys, batch_size, concurrency, project_id
+        )
+        return self._run(self._lookup_bulk_flow(merged, results))
+
+    def _lookup_bulk_flow(self, merged: Dict, results: Iterator[Dict]) -> Flow:
+        yield self._for_each(results, lambda result: self._merge_lookup(merged, result))
+        return merged
+
+    def iter_keymap_lookup(
+        self,
+        map_name: str,
+        object: str,
+        old_keys: Iterable[str],
+        batch_size: int = KEYMAP_BATCH_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Streaming variant of ``keymap_lookup_bulk``.
+
+        Yields each batch's ``keymap_lookup`` result (``mappings`` and
+        ``missing``) in input order as soon as it is available, so callers can
+        translate rows batch by batch without holding the merged mapping.
+        """
+        batches = self._lookup_batches(map_name, object, old_keys, batch_size)
+        return self._imap(
+            lambda keys: self.keymap_lookup(map_name, object, keys, project_id),
+            batches,
+            concurrency,
+        )
+
+    def _lookup_batches(
+        self, map_name: str, object: str, old_keys: Iterable[str], batch_size: int
+    ) -> Iterator[List[str]]:
+        """Validate bulk-lookup arguments and lazily batch the unique keys."""
+        if not map_name:
+            raise DataMakerError("map_name is required to look up key mappings.")
+        if not object:
+            raise DataMakerError("object is required to look up key mappings.")
+        if not 1 <= batch_size <= KEYMAP_BATCH_LIMIT:
+            raise DataMakerError(
+                f"batch_size must be between 1 and {KEYMAP_BATCH_LIMIT}."
+            )
+
+        return self._batches(self._unique(old_keys), batch_size)
+
+    @staticmethod
+    def _merge_lookup(merged: Dict, result: Dict) -> None:
+        """Fold one batch's keymap_lookup result into the merged result."""
+        merged["mappings"].update(result.get("mappings", {}))
+        merged["missing"].extend(result.get("missing", []))
 
     def get_keymap_entries(
         self,
@@ -188,6 +554,129 @@ class KeyMapsClient(BaseClient):
         response = self._make_request("GET", endpoint)
         return response.json()
 
+    def iter_keymap_entries(
+        self,
+        map_name: str,
+        object: Optional[str] = None,
+        page_size: int = KEYMAP_PAGE_LIMIT,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Iterate over every entry of a key map, prefetching pages.
+
+        The first page reports the total, after which up to ``concurrency``
+        further pages are fetched ahead of the caller while it consumes the
+        entries. Pages are yielded in order. Entries written while iterating
+        may be skipped or seen twice, as with any offset pagination.
+
+        Args:
+            map_name: The key map to read.
+            object: Optional domain object type filter.
+            page_size: Entries per page (server-capped at 500).
+            concurrency: Maximum pages in flight.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            An iterator of entry dictionaries (``object``, ``oldKey``,
+            ``newKey``).
+
+        Raises:
+            DataMakerError: If ``page_size`` is out of range.
+
+        Example:
+            >>> for entry in dm.iter_keymap_entries("sap-material-migration"):
+            ...     print(entry["oldKey"], entry["newKey"])
+        """
+        if not 1 <= page_size <= KEYMAP_PAGE_LIMIT:
+            raise DataMakerError(
+                f"page_size must be between 1 and {KEYMAP_PAGE_LIMIT}."
+            )
+
+        return self._iterate(
+            self._entries_flow(map_name, object, page_size, concurrency, project_id)
+        )
+
+    def _entries_flow(
+        self,
+        map_name: str,
+        object: Optional[str],
+        page_size: int,
+        concurrency: int,
+        project_id: Optional[str],
+    ) -> Flow:
+        first = yield self.get_keymap_entries(
+            map_name, object, 1, page_size, project_id
+        )
+        yield Emit(first.get("entries", []))
+        pages = self._imap(
+            lambda number: self.get_keymap_entries(
+                map_name, object, number, page_size, project_id
+            ),
+            self._remaining_pages(first, page_size),
+            concurrency,
+        )
+        while (page := (yield self._next(pages))) is not END:
+            yield Emit(page.get("entries", []))
+
+    @staticmethod
+    def _remaining_pages(first: Dict, page_size: int) -> range:
+        """Page numbers still to fetch after the first page."""
+        page_size = first.get("pageSize") or page_size
+        return range(2, math.ceil(first.get("total", 0) / page_size) + 1)
+
+    def export_keymap(
+        self,
+        map_name: str,
+        path: str,
+        object: Optional[str] = None,
+        concurrency: int = DEFAULT_KEYMAP_CONCURRENCY,
+        project_id: Optional[str] = None,
+    ) -> Dict:
+        """Stream a whole key map into a SQLite snapshot file.
+
+        Entries are written as they arrive, so memory stays bounded by the
+        prefetch window. The snapshot is built next to ``path`` and moved into
+        place only once complete; an existing file at ``path`` is replaced.
+        Open it with ``LocalKeyMap(path)`` to serve lookups offline.
+
+        Args:
+            map_name: The key map to export.
+            path: Destination file path.
+            object: Optional domain object type filter.
+            concurrency: Maximum pages in flight.
+            project_id: Optional project ID. Falls back to DATAMAKER_PROJECT_ID.
+
+        Returns:
+            A dictionary with ``mapName``, ``path`` and ``entries`` (count).
+
+        Example:
+            >>> dm.export_keymap("sap-material-migration", "materials.sqlite")
+            {'mapName': 'sap-material-migration', 'path': 'materials.sqlite', 'entries': 3000000}
+        """
+        entries = self.iter_keymap_entries(
+            map_name, object, concurrency=concurrency, project_id=project_id
+        )
+        return self._run(self._export_flow(map_name, path, entries))
+
+    def _export_flow(self, map_name: str, path: str, entries: Iterator[Dict]) -> Flow:
+        snapshot = _KeyMapSnapshot(path)
+        batch = []
+
+        def write(entry: Dict) -> None:
+            batch.append(entry)
+            if len(batch) >= SNAPSHOT_WRITE_BATCH:
+                snapshot.add(batch)
+                batch.clear()
+
+        try:
+            yield self._for_each(entries, write)
+            snapshot.add(batch)
+            snapshot.commit({"mapName": map_name})
+        except BaseException:
+            snapshot.abort()
+            raise
+        return {"mapName": map_name, "path": path, "entries": snapshot.count}
+
     def delete_keymap(
         self,
         map_name: str,
@@ -205,6 +694,7 @@ class KeyMapsClient(BaseClient):
         Returns:
             Confirmation response with the deleted entry count.
         """
+        self.lookup_cache.clear()
         project_id = project_id or os.environ.get("DATAMAKER_PROJECT_ID")
 
         params = []
@@ -1,12 +1,43 @@
 """Client for scenario file operations - CRUD functionality for file persistence in scenarios."""
 
-import os
 import base64
+import glob
+import hashlib
+import io
+import os
 import mimetypes
-import requests
-from typing import Dict, List, Optional, Union, BinaryIO
-from .base import BaseClient
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union, BinaryIO
+from .base import END, BaseClient, Flow
+from ..cache import TTLCache
+from ..download import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_DOWNLOAD_TIMEOUT,
+    DEFAULT_PART_SIZE,
+    DOWNLOAD_CHUNK_SIZE,
+    EXPIRED_URL_STATUSES,
+    URL_EXPIRY_MARGIN,
+    PartialFile,
+    ProgressCallback,
+    RangedDownload,
+    check_complete,
+    presigned_url_expiry,
+)
 from ..error import DataMakerError
+from ..file_cache import FileCache
+from ..multipart import MultipartStream
+
+DEFAULT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_UPLOAD_CONCURRENCY = 4
+# Statuses meaning the server has no multipart upload endpoints
+MULTIPART_UNSUPPORTED_STATUSES = (404, 405, 501)
+DEFAULT_TRANSFER_CONCURRENCY = 8
+# File metadata keys that may carry an MD5 of the stored content
+CHECKSUM_FIELDS = ("md5", "checksum", "etag")
+# Multipart S3 ETags ("<hex>-<parts>") are not MD5s of the content
+MD5_PATTERN = re.compile(r"[0-9a-f]{32}")
+DEFAULT_URL_CACHE_SIZE = 256
 
 
 class ScenarioFilesClient(BaseClient):
@@ -15,8 +46,28 @@ class ScenarioFilesClient(BaseClient):
     Provides CRUD functionality for persisting and managing files within scenarios.
     Files stored through this client will appear in the 'Recently Added Files' folder
     on the DataMaker scenarios page.
+
+    Presigned download URLs are kept in ``url_cache`` until shortly before
+    the expiry encoded in the URL, so repeated downloads of the same file
+    skip the API round trip; URLs without a recognisable expiry are not
+    cached. With a ``file_cache``, ``download_scenario_file`` and
+    ``read_file_by_path`` also keep the content on disk and revalidate it
+    with its ETag, so unchanged files are not transferred again.
     """
 
+    def __init__(
+        self,
+        *args,
+        url_cache: Optional[TTLCache] = None,
+        file_cache: Optional[FileCache] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if url_cache is None:
+            url_cache = TTLCache(maxsize=DEFAULT_URL_CACHE_SIZE, ttl=None)
+        self.url_cache = url_cache
+        self.file_cache = file_cache
+
     def get_scenario_files(
         self, scenario_id: Optional[str] = None, folder: Optional[str] = None
     ) -> List[Dict]:
@@ -91,46 +142,296 @@ class ScenarioFilesClient(BaseClient):
         Raises:
             DataMakerError: If scenario_id is not provided and not available in environment.
         """
-        # Get file metadata with presigned URL first
-        file_metadata = self.get_scenario_file(file_id, scenario_id)
+        scenario_id = self._require_scenario_id(scenario_id)
+        return self._run(
+            self._read_presigned_flow(
+                ("file", scenario_id, file_id),
+                self._scenario_file_url(file_id, scenario_id),
+                f"File not found: {file_id}",
+            )
+        )
 
-        if not file_metadata.get("presignedUrl"):
-            raise DataMakerError(f"No presigned URL available for file: {file_id}")
+    def _scenario_file_url(self, file_id: str, scenario_id: str) -> Callable[[], Flow]:
+        """A flow fetching a fresh presigned URL for a scenario file."""
+
+        def fetch_url():
+            metadata = yield self.get_scenario_file(file_id, scenario_id)
+            return self._presigned_url(metadata, file_id)
+
+        return fetch_url
+
+    def _file_path_url(self, file_path: str) -> Callable[[], Flow]:
+        """A flow fetching a fresh presigned URL for a storage path."""
 
-        # Download file using presigned URL
-        presigned_url = file_metadata["presignedUrl"]
-        download_response = requests.get(presigned_url, timeout=30)
+        def fetch_url():
+            metadata = yield self._make_request(
+                "GET", f"/workspace-files/by-key?key={file_path}"
+            ).json()
+            return self._presigned_url(metadata, file_path)
+
+        return fetch_url
+
+    def _remember_url(self, cache_key: Tuple, url: str) -> None:
+        """Cache a presigned URL until shortly before it expires."""
+        expires_at = presigned_url_expiry(url)
+        if expires_at is not None:
+            ttl = expires_at - time.time() - URL_EXPIRY_MARGIN
+            if ttl > 0:
+                self.url_cache.set(cache_key, url, ttl=ttl)
+
+    def _fresh_url_flow(self, cache_key: Tuple, fetch_url: Callable[[], Flow]) -> Flow:
+        url = yield from fetch_url()
+        self._remember_url(cache_key, url)
+        return url
+
+    def _open_download_flow(
+        self, cache_key: Tuple, fetch_url: Callable[[], Flow], **kwargs
+    ) -> Flow:
+        """GET a presigned URL, trying the cached one first.
+
+        A cached URL that storage rejects as expired is dropped and the
+        request repeated once with a fresh URL.
+        """
+        url = self.url_cache.get(cache_key)
+        if url is not None:
+            response = yield self.transport.request("GET", url, **kwargs)
+            if response.status_code not in EXPIRED_URL_STATUSES:
+                return response
+            yield self._close(response)
+            self.url_cache.pop(cache_key)
+        url = yield from self._fresh_url_flow(cache_key, fetch_url)
+        return (yield self.transport.request("GET", url, **kwargs))
+
+    def _revalidation(self, cache_key: Tuple) -> Tuple[Optional[Dict], Dict]:
+        """The cached file entry, if any, and the headers to revalidate it."""
+        if not self.file_cache:
+            return None, {}
+        entry = self.file_cache.lookup("/".join(cache_key))
+        if not entry or not entry["etag"]:
+            return None, {}
+        return entry, {"If-None-Match": entry["etag"]}
+
+    def _downloaded_content(
+        self, cache_key: Tuple, entry: Optional[Dict], response, not_found_message: str
+    ) -> bytes:
+        """Return the body of a (possibly 304) download, caching it on disk."""
+        if entry and response.status_code == 304:
+            return self.file_cache.read(entry)
+        self._check_download(response, not_found_message)
+        etag = response.headers.get("ETag")
+        if self.file_cache and etag:
+            self.file_cache.store("/".join(cache_key), response.content, etag)
+        return response.content
+
+    def _read_presigned_flow(
+        self, cache_key: Tuple, fetch_url: Callable[[], Flow], not_found_message: str
+    ) -> Flow:
+        """Download a presigned URL into memory through the URL and file caches."""
+        entry, headers = self._revalidation(cache_key)
+        response = yield from self._open_download_flow(
+            cache_key, fetch_url, headers=headers, timeout=30
+        )
+        return self._downloaded_content(cache_key, entry, response, not_found_message)
 
+    @staticmethod
+    def _presigned_url(file_metadata: Dict, file_ref: str) -> str:
+        """Return the presigned download URL from file metadata."""
+        if not file_metadata.get("presignedUrl"):
+            raise DataMakerError(f"No presigned URL available for file: {file_ref}")
+        return file_metadata["presignedUrl"]
+
+    @staticmethod
+    def _check_download(download_response, not_found_message: str) -> None:
+        """Raise if a presigned-URL download did not succeed."""
         if download_response.status_code == 404:
-            raise DataMakerError(f"File not found: {file_id}")
+            raise DataMakerError(not_found_message)
         elif download_response.status_code != 200:
             raise DataMakerError(
                 f"Failed to download file: HTTP {download_response.status_code}"
             )
 
-        return download_response.content
-
     def download_scenario_file_to_path(
-        self, file_id: str, destination_path: str, scenario_id: Optional[str] = None
+        self,
+        file_id: str,
+        destination_path: str,
+        scenario_id: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        timeout: Tuple[float, float] = DEFAULT_DOWNLOAD_TIMEOUT,
     ) -> str:
         """Download a file and save it to a local path.
 
+        The content is streamed to disk in chunks, so files of any size are
+        downloaded without being held in memory. It is written to
+        ``destination_path + ".part"`` and renamed into place once complete;
+        an interrupted download never leaves a truncated file at
+        ``destination_path``.
+
         Args:
             file_id: The unique identifier of the file.
             destination_path: Local file path to save the downloaded content.
             scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            chunk_size: Bytes read from the connection per write.
+            progress: Optional callback called after each chunk with the bytes
+                written so far and the total size (``None`` if unknown).
+            timeout: ``(connect, read)`` timeouts in seconds. The read timeout
+                applies between chunks, not to the whole download.
 
         Returns:
             The destination path where the file was saved.
 
         Raises:
-            DataMakerError: If scenario_id is not provided and not available in environment.
+            DataMakerError: If scenario_id is not provided and not available in
+                environment, or the download fails or is truncated.
+
+        Example:
+            >>> dm.download_scenario_file_to_path(
+            ...     "file-123",
+            ...     "outputs/orders.csv",
+            ...     progress=lambda done, total: print(f"{done}/{total}"),
+            ... )
         """
-        content = self.download_scenario_file(file_id, scenario_id)
-        with open(destination_path, "wb") as f:
-            f.write(content)
+        scenario_id = self._require_scenario_id(scenario_id)
+        return self._run(
+            self._download_to_path_flow(
+                file_id, destination_path, scenario_id, chunk_size, progress, timeout
+            )
+        )
+
+    def _download_to_path_flow(
+        self,
+        file_id: str,
+        destination_path: str,
+        scenario_id: str,
+        chunk_size: int,
+        progress: Optional[ProgressCallback],
+        timeout: Tuple[float, float],
+    ) -> Flow:
+        response = yield from self._open_download_flow(
+            ("file", scenario_id, file_id),
+            self._scenario_file_url(file_id, scenario_id),
+            stream=True,
+            timeout=timeout,
+        )
+        try:
+            self._check_download(response, f"File not found: {file_id}")
+            total = self._content_length(response.headers)
+            with PartialFile(destination_path) as f:
+                chunks = self._body(response, chunk_size)
+                while (chunk := (yield self._next(chunks))) is not END:
+                    f.write(chunk)
+                    if progress:
+                        progress(f.written, total)
+                check_complete(f.written, total)
+        finally:
+            yield self._close(response)
         return destination_path
 
+    @staticmethod
+    def _content_length(headers) -> Optional[int]:
+        """The response size from its Content-Length header, if given."""
+        length = headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
+
+    def download_scenario_file_ranged(
+        self,
+        file_id: str,
+        destination_path: str,
+        scenario_id: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+        timeout: Tuple[float, float] = DEFAULT_DOWNLOAD_TIMEOUT,
+    ) -> str:
+        """Download a large file in parallel byte ranges, resuming after failures.
+
+        The file is split into ``part_size`` ranges fetched concurrently into
+        a preallocated ``destination_path + ".part"`` file. Progress is
+        recorded in ``destination_path + ".part.json"``; calling this again
+        after an interruption only fetches the missing parts. An expired
+        presigned URL is refreshed through ``get_scenario_file``. If storage
+        does not support ranges the file is streamed in one request.
+
+        Args:
+            file_id: The unique identifier of the file.
+            destination_path: Local file path to save the downloaded content.
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            part_size: Bytes per ranged request.
+            concurrency: Maximum ranges in flight.
+            progress: Optional callback called with the bytes on disk so far
+                and the total size.
+            timeout: ``(connect, read)`` timeouts in seconds.
+
+        Returns:
+            The destination path where the file was saved.
+
+        Raises:
+            DataMakerError: If the file cannot be found or the download fails
+                after retries.
+
+        Example:
+            >>> dm.download_scenario_file_ranged(
+            ...     "file-123", "outputs/big.parquet", concurrency=8
+            ... )
+        """
+        scenario_id = self._require_scenario_id(scenario_id)
+        cache_key = ("file", scenario_id, file_id)
+        fetch_url = self._scenario_file_url(file_id, scenario_id)
+        return self._run_ranged(
+            lambda: self._fresh_url_flow(cache_key, fetch_url),
+            destination_path,
+            part_size=part_size,
+            concurrency=concurrency,
+            progress=progress,
+            timeout=timeout,
+            not_found_message=f"File not found: {file_id}",
+        )
+
+    def download_file_by_path_ranged(
+        self,
+        file_path: str,
+        destination_path: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+        timeout: Tuple[float, float] = DEFAULT_DOWNLOAD_TIMEOUT,
+    ) -> str:
+        """Download a file by its storage path in parallel, resumable ranges.
+
+        The ranged counterpart of ``read_file_by_path`` for files too large
+        to hold in memory; see ``download_scenario_file_ranged``.
+
+        Args:
+            file_path: The file path (key) in storage.
+            destination_path: Local file path to save the downloaded content.
+            part_size: Bytes per ranged request.
+            concurrency: Maximum ranges in flight.
+            progress: Optional callback called with the bytes on disk so far
+                and the total size.
+            timeout: ``(connect, read)`` timeouts in seconds.
+
+        Returns:
+            The destination path where the file was saved.
+        """
+        fetch_url = self._file_path_url(file_path)
+        return self._run_ranged(
+            lambda: self._fresh_url_flow(("path", file_path), fetch_url),
+            destination_path,
+            part_size=part_size,
+            concurrency=concurrency,
+            progress=progress,
+            timeout=timeout,
+            not_found_message=f"File not found at path: {file_path}",
+        )
+
+    def _run_ranged(
+        self, url_flow: Callable[[], Flow], destination_path: str, **options
+    ) -> str:
+        """Run a ``RangedDownload`` that refreshes its URL with ``url_flow``."""
+        return RangedDownload(
+            self.transport, lambda: self._run(url_flow()), destination_path, **options
+        ).run()
+
     def create_scenario_file(
         self,
         name: str,
@@ -141,9 +442,18 @@ class ScenarioFilesClient(BaseClient):
         description: Optional[str] = None,
         mime_type: Optional[str] = None,
         folder_id: Optional[str] = None,
+        folder: str = "uploads",
     ) -> Dict:
         """Create/upload a new file in a scenario.
 
+        The content is streamed to the multipart upload endpoint in chunks, so
+        file objects of any size are sent without being read into memory.
+        Non-seekable streams, including objects with only ``read()``, are
+        buffered once before sending. The upload endpoint does not store
+        ``description`` or ``folder_id``, so when either is given the file is
+        created through the JSON endpoint instead, with the content read into
+        memory and base64-encoded.
+
         Args:
             name: The filename (e.g., 'data.json', 'config.yaml').
             content: The file content - can be a string, bytes, or file-like object.
@@ -153,64 +463,124 @@ class ScenarioFilesClient(BaseClient):
             description: Optional description of the file.
             mime_type: Optional MIME type. If not provided, will be guessed from filename.
             folder_id: Optional folder ID to place the file in.
+            folder: Folder to upload to ("uploads" or "outputs", default:
+                "uploads"). Not used when ``description`` or ``folder_id``
+                is given.
 
         Returns:
             The created file metadata dictionary.
 
         Raises:
-            DataMakerError: If required IDs are not provided and not available in environment.
+            DataMakerError: If scenario_id is not provided and not available
+                in environment, or ``description`` or ``folder_id`` is given
+                without a team_id.
         """
-        # Get required IDs from environment if not provided
-        scenario_id = scenario_id or os.environ.get("DATAMAKER_SCENARIO_ID")
+        # Get IDs from environment if not provided
+        scenario_id = self._require_scenario_id(scenario_id)
         team_id = team_id or os.environ.get("DATAMAKER_TEAM_ID")
         project_id = project_id or os.environ.get("DATAMAKER_PROJECT_ID")
 
-        if not scenario_id:
-            raise DataMakerError(
-                "scenario_id is required. Either pass it as a parameter or set "
-                "DATAMAKER_SCENARIO_ID environment variable."
+        # Guess MIME type if not provided
+        if not mime_type:
+            mime_type, _ = mimetypes.guess_type(name)
+            if not mime_type:
+                mime_type = "application/octet-stream"
+
+        if description or folder_id:
+            file_data = self._create_file_json(
+                name,
+                content,
+                scenario_id,
+                team_id,
+                project_id,
+                description,
+                mime_type,
+                folder_id,
             )
+            response = self._make_request("POST", "/scenario-files", json=file_data)
+            return response.json()
 
+        # Handle different content types
+        if isinstance(content, str):
+            fileobj = io.BytesIO(content.encode("utf-8"))
+        elif isinstance(content, (bytes, bytearray, memoryview)):
+            fileobj = io.BytesIO(content)
+        elif getattr(content, "seekable", lambda: False)():
+            fileobj = content
+        else:
+            fileobj = io.BytesIO(content.read())
+
+        fields = {"folder": folder}
+        if team_id:
+            fields["teamId"] = team_id
+        if project_id:
+            fields["projectId"] = project_id
+        body = MultipartStream(fields, "file", name, fileobj, mime_type)
+        return self._run(self._upload_flow(scenario_id, body))
+
+    @staticmethod
+    def _create_file_json(
+        name: str,
+        content: Union[str, bytes, BinaryIO],
+        scenario_id: str,
+        team_id: Optional[str],
+        project_id: Optional[str],
+        description: Optional[str],
+        mime_type: str,
+        folder_id: Optional[str],
+    ) -> Dict:
+        """Build the JSON create body, with the content base64-encoded."""
         if not team_id:
             raise DataMakerError(
-                "team_id is required. Either pass it as a parameter or set "
-                "DATAMAKER_TEAM_ID environment variable."
+                "team_id is required with description or folder_id. Either pass "
+                "it as a parameter or set DATAMAKER_TEAM_ID environment variable."
             )
-        # Handle different content types
+
         if isinstance(content, str):
             content_bytes = content.encode("utf-8")
         elif hasattr(content, "read"):
             content_bytes = content.read()
         else:
-            content_bytes = content
-
-        # Encode content as base64 for API transmission
-        content_base64 = base64.b64encode(content_bytes).decode("utf-8")
-
-        # Guess MIME type if not provided
-        if not mime_type:
-            mime_type, _ = mimetypes.guess_type(name)
-            if not mime_type:
-                mime_type = "application/octet-stream"
+            content_bytes = bytes(content)
 
         file_data = {
             "name": name,
-            "content": content_base64,
+            "content": base64.b64encode(content_bytes).decode("utf-8"),
             "scenarioId": scenario_id,
             "teamId": team_id,
             "mimeType": mime_type,
             "size": len(content_bytes),
         }
-
         if project_id:
             file_data["projectId"] = project_id
         if description:
             file_data["description"] = description
         if folder_id:
             file_data["folderId"] = folder_id
+        return file_data
 
-        response = self._make_request("POST", "/scenario-files", json=file_data)
-        return response.json()
+    @staticmethod
+    def _require_scenario_id(scenario_id: Optional[str]) -> str:
+        """Return the scenario ID, falling back to DATAMAKER_SCENARIO_ID."""
+        scenario_id = scenario_id or os.environ.get("DATAMAKER_SCENARIO_ID")
+        if not scenario_id:
+            raise DataMakerError(
+                "scenario_id is required. Either pass it as a parameter or set "
+                "DATAMAKER_SCENARIO_ID environment variable."
+            )
+        return scenario_id
+
+    def _upload_flow(self, scenario_id: str, body: MultipartStream) -> Flow:
+        """Send a streaming multipart body to the scenario upload endpoint."""
+        # The body is consumed as it is sent, so it cannot be replayed
+        result = yield self._make_request(
+            "POST",
+            f"/scenarios/{scenario_id}/files/upload",
+            data=body,
+            headers={"Content-Type": body.content_type},
+            idempotent=False,
+        ).json()
+        return result.get("file", result)
 
     def upload_scenario_file_from_path(
         self,
@@ -225,6 +595,8 @@ class ScenarioFilesClient(BaseClient):
     ) -> Dict:
         """Upload a file from a local path to a scenario using multipart upload.
 
+        The file is streamed from disk in chunks rather than read into memory.
+
         Args:
             file_path: Path to the local file to upload.
             scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
@@ -241,35 +613,178 @@ class ScenarioFilesClient(BaseClient):
         Raises:
             DataMakerError: If file not found or required IDs are not provided and not available in environment.
         """
-        # Get required IDs from environment if not provided
-        scenario_id = scenario_id or os.environ.get("DATAMAKER_SCENARIO_ID")
-
-        if not scenario_id:
-            raise DataMakerError(
-                "scenario_id is required. Either pass it as a parameter or set "
-                "DATAMAKER_SCENARIO_ID environment variable."
-            )
+        scenario_id = self._require_scenario_id(scenario_id)
 
         if not os.path.exists(file_path):
             raise DataMakerError(f"File not found: {file_path}")
 
         filename = name or os.path.basename(file_path)
+        return self._run(
+            self._upload_path_flow(file_path, scenario_id, filename, folder)
+        )
 
-        # Use multipart upload endpoint for better performance
+    def _upload_path_flow(
+        self, file_path: str, scenario_id: str, filename: str, folder: str
+    ) -> Flow:
         with open(file_path, "rb") as f:
-            files = {"file": (filename, f)}
-            data = {"folder": folder}
-
-            response = self._make_request(
-                "POST",
-                f"/scenarios/{scenario_id}/files/upload",
-                files=files,
-                data=data,
+            body = MultipartStream({"folder": folder}, "file", filename, f)
+            return (yield from self._upload_flow(scenario_id, body))
+
+    def upload_scenario_file_multipart(
+        self,
+        file_path: str,
+        scenario_id: Optional[str] = None,
+        name: Optional[str] = None,
+        folder: str = "uploads",
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> Dict:
+        """Upload a large local file in parallel parts.
+
+        The upload is initiated, its ``part_size`` parts are sent with up to
+        ``concurrency`` requests in flight, and a final commit assembles the
+        file. Parts are PUTs, so throttled or dropped parts are retried on
+        their own by the transport's ``RetryPolicy`` instead of restarting the
+        upload. If a part still fails, the upload is aborted and the error
+        raised. Servers without multipart upload support get a single
+        ``upload_scenario_file_from_path`` request instead.
+
+        Args:
+            file_path: Path to the local file to upload.
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            name: Optional filename. If not provided, uses the original filename.
+            folder: Folder to upload to ("uploads" or "outputs", default: "uploads").
+            part_size: Bytes per part (default 8 MiB). At most
+                ``concurrency`` parts are held in memory at once.
+            concurrency: Maximum parts in flight.
+
+        Returns:
+            The created file metadata dictionary.
+
+        Raises:
+            DataMakerError: If the file is not found, scenario_id is missing or
+                a part fails after retries.
+
+        Example:
+            >>> dm.upload_scenario_file_multipart(
+            ...     "out/orders.parquet", folder="outputs", concurrency=8
+            ... )
+        """
+        scenario_id, filename, initiate = self._initiate_multipart(
+            file_path, scenario_id, name, folder, part_size
+        )
+        return self._run(
+            self._multipart_flow(
+                file_path, scenario_id, filename, folder, initiate, concurrency
+            )
+        )
+
+    def _multipart_flow(
+        self,
+        file_path: str,
+        scenario_id: str,
+        filename: str,
+        folder: str,
+        initiate: Dict,
+        concurrency: int,
+    ) -> Flow:
+        try:
+            upload = yield self._make_request(
+                "POST", f"/scenarios/{scenario_id}/files/uploads", json=initiate
+            ).json()
+        except DataMakerError as e:
+            if e.status_code not in MULTIPART_UNSUPPORTED_STATUSES:
+                raise
+            return (
+                yield self.upload_scenario_file_from_path(
+                    file_path, scenario_id, name=filename, folder=folder
+                )
             )
 
-        result = response.json()
+        endpoint = f"/scenarios/{scenario_id}/files/uploads/{upload['uploadId']}"
+        part_size = upload.get("partSize", initiate["partSize"])
+        try:
+            parts = yield self._map(
+                lambda part: self._upload_part(endpoint, file_path, *part),
+                self._multipart_parts(initiate["size"], part_size),
+                concurrency,
+            )
+            result = yield self._make_request(
+                "POST", f"{endpoint}/complete", json={"parts": parts}
+            ).json()
+        except BaseException:
+            yield from self._abort_multipart_flow(endpoint)
+            raise
         return result.get("file", result)
 
+    def _initiate_multipart(
+        self,
+        file_path: str,
+        scenario_id: Optional[str],
+        name: Optional[str],
+        folder: str,
+        part_size: int,
+    ) -> Tuple[str, str, Dict]:
+        """Validate multipart upload arguments and build the initiate body."""
+        scenario_id = self._require_scenario_id(scenario_id)
+        if not os.path.exists(file_path):
+            raise DataMakerError(f"File not found: {file_path}")
+        if part_size < 1:
+            raise DataMakerError("part_size must be at least 1.")
+
+        filename = name or os.path.basename(file_path)
+        mime_type, _ = mimetypes.guess_type(filename)
+        initiate = {
+            "name": filename,
+            "folder": folder,
+            "size": os.path.getsize(file_path),
+            "mimeType": mime_type or "application/octet-stream",
+            "partSize": part_size,
+        }
+        return scenario_id, filename, initiate
+
+    @staticmethod
+    def _multipart_parts(size: int, part_size: int) -> List[Tuple[int, int, int]]:
+        """``(part number, offset, length)`` for each part; at least one."""
+        offsets = range(0, size, part_size) if size else [0]
+        return [
+            (number, offset, min(part_size, size - offset))
+            for number, offset in enumerate(offsets, start=1)
+        ]
+
+    @staticmethod
+    def _read_part(file_path: str, offset: int, length: int) -> bytes:
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _upload_part(
+        self, endpoint: str, file_path: str, number: int, offset: int, length: int
+    ) -> Dict:
+        """PUT one part, returning its ``{partNumber, etag}`` for the commit."""
+        return self._run(
+            self._upload_part_flow(endpoint, file_path, number, offset, length)
+        )
+
+    def _upload_part_flow(
+        self, endpoint: str, file_path: str, number: int, offset: int, length: int
+    ) -> Flow:
+        result = yield self._make_request(
+            "PUT",
+            f"{endpoint}/parts/{number}",
+            data=self._read_part(file_path, offset, length),
+            headers={"Content-Type": "application/octet-stream"},
+            idempotent=True,
+        ).json()
+        return {"partNumber": number, "etag": result.get("etag")}
+
+    def _abort_multipart_flow(self, endpoint: str) -> Flow:
+        """Best-effort cleanup of a failed multipart upload."""
+        try:
+            yield self._make_request("DELETE", endpoint)
+        except (DataMakerError, *self.transport.request_errors):
+            pass
+
     def delete_scenario_file(
         self, file_id: str, scenario_id: Optional[str] = None
     ) -> Dict:
@@ -311,7 +826,9 @@ class ScenarioFilesClient(BaseClient):
         files uploaded to scenarios from within Python scripts.
 
         The method first queries the API to get a presigned URL for the file,
-        then downloads the file content using that URL.
+        then downloads the file content using that URL. The URL is reused
+        until shortly before it expires, and with a file cache configured an
+        unchanged file is served from disk.
 
         Args:
             file_path: The file path (key) in storage. This is typically copied from
@@ -332,38 +849,99 @@ class ScenarioFilesClient(BaseClient):
             >>> content = client.read_file_by_path("scenarios/.../workspace/uploads/data.json")
             >>> data = json.loads(content.decode('utf-8'))
         """
-        try:
-            # Get file metadata with presigned URL from API
-            response = self._make_request(
-                "GET", f"/workspace-files/by-key?key={file_path}"
-            )
-            file_data = response.json()
-
-            if not file_data.get("presignedUrl"):
-                raise DataMakerError(
-                    f"No presigned URL available for file: {file_path}"
-                )
-
-            # Download file using presigned URL
-            presigned_url = file_data["presignedUrl"]
-            download_response = requests.get(presigned_url, timeout=30)
+        return self._run(self._read_path_flow(file_path))
 
-            if download_response.status_code == 404:
-                raise DataMakerError(f"File not found at path: {file_path}")
-            elif download_response.status_code != 200:
-                raise DataMakerError(
-                    f"Failed to download file: HTTP {download_response.status_code}"
+    def _read_path_flow(self, file_path: str) -> Flow:
+        try:
+            return (
+                yield from self._read_presigned_flow(
+                    ("path", file_path),
+                    self._file_path_url(file_path),
+                    f"File not found at path: {file_path}",
                 )
-
-            return download_response.content
-
+            )
         except DataMakerError:
             raise
-        except requests.RequestException as e:
+        except self.transport.request_errors as e:
             raise DataMakerError(f"Failed to read file from storage: {str(e)}")
         except Exception as e:
             raise DataMakerError(f"Failed to read file: {str(e)}")
 
+    def map_file_by_path(
+        self,
+        file_path: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        timeout: Tuple[float, float] = DEFAULT_DOWNLOAD_TIMEOUT,
+    ) -> memoryview:
+        """Read a file by its storage path as a read-only memory map.
+
+        The file is streamed into the client's file cache (see
+        ``file_cache_dir``) and mapped from there. Later calls revalidate the
+        cached copy with its ETag and map it again without downloading, so
+        repeated reads of a large reference file cost no copies. Processes
+        sharing the cache directory share the mapped pages.
+
+        Args:
+            file_path: The file path (key) in storage.
+            chunk_size: Bytes read from the connection per write.
+            timeout: ``(connect, read)`` timeouts in seconds.
+
+        Returns:
+            A read-only ``memoryview`` over the cached file. Slice it, or pass
+            it to ``bytes()``, ``codecs.decode()``, ``numpy.frombuffer()`` etc.
+
+        Raises:
+            DataMakerError: If no file cache is configured, or the file cannot
+                be read or doesn't exist.
+
+        Example:
+            >>> dm = DataMaker(file_cache_dir="/tmp/datamaker-cache")
+            >>> view = dm.map_file_by_path("scenarios/.../uploads/lookup.csv")
+            >>> header = bytes(view[:200])
+        """
+        cache_key = self._mapped_cache_key(file_path)
+        return self._run(self._map_file_flow(file_path, cache_key, chunk_size, timeout))
+
+    def _map_file_flow(
+        self,
+        file_path: str,
+        cache_key: Tuple,
+        chunk_size: int,
+        timeout: Tuple[float, float],
+    ) -> Flow:
+        entry, headers = self._revalidation(cache_key)
+        response = yield from self._open_download_flow(
+            cache_key,
+            self._file_path_url(file_path),
+            headers=headers,
+            stream=True,
+            timeout=timeout,
+        )
+        try:
+            if not (entry and response.status_code == 304):
+                self._check_download(response, f"File not found at path: {file_path}")
+                total = self._content_length(response.headers)
+                with self.file_cache.writer(
+                    "/".join(cache_key), response.headers.get("ETag")
+                ) as writer:
+                    chunks = self._body(response, chunk_size)
+                    while (chunk := (yield self._next(chunks))) is not END:
+                        writer.write(chunk)
+                    check_complete(writer.written, total)
+                entry = writer.entry
+        finally:
+            yield self._close(response)
+        return self.file_cache.open_mmap(entry)
+
+    def _mapped_cache_key(self, file_path: str) -> Tuple:
+        """The cache key of ``map_file_by_path``, which needs a file cache."""
+        if not self.file_cache:
+            raise DataMakerError(
+                "map_file_by_path requires a file cache. Pass file_cache_dir "
+                "to DataMaker."
+            )
+        return ("path", file_path)
+
     def read_file_by_path_as_text(
         self,
         file_path: str,
@@ -388,7 +966,10 @@ class ScenarioFilesClient(BaseClient):
             >>> print(content)
         """
         content = self.read_file_by_path(file_path, storage_base_url)
-        return content.decode(encoding)
+        return self._run(self._decode_flow(content, encoding))
+
+    def _decode_flow(self, content: bytes, encoding: str) -> Flow:
+        return (yield content).decode(encoding)
 
     def save_file(
         self,
@@ -451,3 +1032,205 @@ class ScenarioFilesClient(BaseClient):
             name=name,
             folder=folder,
         )
+
+    def save_directory(
+        self,
+        local_dir: str,
+        folder: str = "outputs",
+        scenario_id: Optional[str] = None,
+        include: str = "*",
+        concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        skip_unchanged: bool = True,
+    ) -> Dict:
+        """Upload every matching file in a local directory concurrently.
+
+        Files are uploaded with up to ``concurrency`` requests in flight over
+        the pooled transport. Files already in ``folder`` with the same name,
+        size and MD5 checksum are skipped. Files the listing reports no MD5
+        for (e.g. multipart ETags like ``"<hex>-3"``) are always uploaded.
+
+        Args:
+            local_dir: Local directory to upload from.
+            folder: Folder to upload to ("uploads" or "outputs", default: "outputs").
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            include: Glob pattern relative to ``local_dir``; ``**`` matches
+                subdirectories, whose files are named by their relative path.
+            concurrency: Maximum uploads in flight.
+            skip_unchanged: Whether to skip files that already match remotely.
+
+        Returns:
+            Dictionary with the ``uploaded`` file metadata and the names of
+            ``skipped`` files.
+
+        Raises:
+            DataMakerError: If local_dir does not exist or scenario_id is not
+                provided and not available in environment.
+
+        Example:
+            >>> result = dm.save_directory("out/run-42", include="*.csv")
+            >>> print(len(result["uploaded"]), "uploaded")
+        """
+        scenario_id = self._require_scenario_id(scenario_id)
+        local_files = self._directory_files(local_dir, include)
+        return self._run(
+            self._save_directory_flow(
+                local_files, folder, scenario_id, concurrency, skip_unchanged
+            )
+        )
+
+    def _save_directory_flow(
+        self,
+        local_files: List[Tuple[str, str]],
+        folder: str,
+        scenario_id: str,
+        concurrency: int,
+        skip_unchanged: bool,
+    ) -> Flow:
+        remote = {}
+        if skip_unchanged and local_files:
+            listing = yield self.get_scenario_files(scenario_id, folder)
+            remote = self._files_by_name(listing)
+
+        pending, skipped = self._partition_uploads(local_files, remote)
+        uploaded = yield self._map(
+            lambda item: self.upload_scenario_file_from_path(
+                item[0], scenario_id, name=item[1], folder=folder
+            ),
+            pending,
+            concurrency,
+        )
+        return {"uploaded": uploaded, "skipped": skipped}
+
+    def download_folder(
+        self,
+        dest_dir: str,
+        folder: str = "outputs",
+        scenario_id: Optional[str] = None,
+        concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        skip_unchanged: bool = True,
+    ) -> Dict:
+        """Download every file in a scenario folder into a local directory.
+
+        Files are streamed to disk with up to ``concurrency`` downloads in
+        flight. Local files with the same name, size and MD5 checksum are
+        left as they are. Files the listing reports no MD5 for (e.g.
+        multipart ETags like ``"<hex>-3"``) are always downloaded.
+
+        Args:
+            dest_dir: Local directory to download into; created if missing.
+            folder: Folder to download ("uploads" or "outputs", default: "outputs").
+            scenario_id: Optional scenario ID. Falls back to DATAMAKER_SCENARIO_ID env var.
+            concurrency: Maximum downloads in flight.
+            skip_unchanged: Whether to skip files that already match locally.
+
+        Returns:
+            Dictionary with the ``downloaded`` and ``skipped`` local paths.
+
+        Raises:
+            DataMakerError: If scenario_id is not provided and not available in
+                environment, or a file name would land outside dest_dir.
+
+        Example:
+            >>> result = dm.download_folder("fixtures/", folder="uploads")
+            >>> print(result["downloaded"])
+        """
+        scenario_id = self._require_scenario_id(scenario_id)
+        return self._run(
+            self._download_folder_flow(
+                dest_dir, folder, scenario_id, concurrency, skip_unchanged
+            )
+        )
+
+    def _download_folder_flow(
+        self,
+        dest_dir: str,
+        folder: str,
+        scenario_id: str,
+        concurrency: int,
+        skip_unchanged: bool,
+    ) -> Flow:
+        listing = yield self.get_scenario_files(scenario_id, folder)
+        files = self._files_by_name(listing)
+        pending, skipped = self._partition_downloads(files, dest_dir, skip_unchanged)
+        downloaded = yield self._map(
+            lambda item: self.download_scenario_file_to_path(
+                item[0]["id"], item[1], scenario_id
+            ),
+            pending,
+            concurrency,
+        )
+        return {"downloaded": downloaded, "skipped": skipped}
+
+    @staticmethod
+    def _directory_files(local_dir: str, include: str) -> List[Tuple[str, str]]:
+        """``(path, remote name)`` for each file matching ``include``."""
+        if not os.path.isdir(local_dir):
+            raise DataMakerError(f"Directory not found: {local_dir}")
+        paths = glob.glob(os.path.join(glob.escape(local_dir), include), recursive=True)
+        return [
+            (path, os.path.relpath(path, local_dir).replace(os.sep, "/"))
+            for path in sorted(paths)
+            if os.path.isfile(path)
+        ]
+
+    @staticmethod
+    def _files_by_name(listing: Union[Dict, List[Dict]]) -> Dict[str, Dict]:
+        """Index a ``get_scenario_files`` response by file name."""
+        files = listing.get("files", []) if isinstance(listing, dict) else listing
+        return {file["name"]: file for file in files}
+
+    @staticmethod
+    def _file_md5(path: str) -> str:
+        digest = hashlib.md5()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _listed_md5(metadata: Dict) -> Optional[str]:
+        """The MD5 a listing reports for a file, if it reports a real one."""
+        for field in CHECKSUM_FIELDS:
+            value = str(metadata.get(field) or "").strip('"').lower()
+            if MD5_PATTERN.fullmatch(value):
+                return value
+        return None
+
+    def _matches(self, path: str, metadata: Dict) -> bool:
+        """Whether a local file has the size and MD5 listed for a remote one.
+
+        Without a listed MD5 the files are never taken to match, since a
+        changed file can keep its size.
+        """
+        if not os.path.isfile(path) or metadata.get("size") != os.path.getsize(path):
+            return False
+        md5 = self._listed_md5(metadata)
+        return md5 is not None and md5 == self._file_md5(path)
+
+    def _partition_uploads(
+        self, local_files: List[Tuple[str, str]], remote: Dict[str, Dict]
+    ) -> Tuple[List[Tuple[str, str]], List[str]]:
+        pending, skipped = [], []
+        for path, name in local_files:
+            if name in remote and self._matches(path, remote[name]):
+                skipped.append(name)
+            else:
+                pending.append((path, name))
+        return pending, skipped
+
+    def _partition_downloads(
+        self, files: Dict[str, Dict], dest_dir: str, skip_unchanged: bool
+    ) -> Tuple[List[Tuple[Dict, str]], List[str]]:
+        root = os.path.abspath(dest_dir)
+        os.makedirs(root, exist_ok=True)
+        pending, skipped = [], []
+        for name, metadata in files.items():
+            path = os.path.abspath(os.path.join(root, name))
+            if os.path.commonpath([root, path]) != root:
+                raise DataMakerError(f"Refusing to write outside {dest_dir}: {name}")
+            if skip_unchanged and self._matches(path, metadata):
+                skipped.append(path)
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            pending.append((metadata, path))
+        return pending, skipped
@@ -1,10 +1,37 @@
-from .base import BaseClient
+import copy
+from .base import BaseClient, Flow
+from ..cache import TTLCache
 from ..error import DataMakerError
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+DEFAULT_TEMPLATE_CACHE_SIZE = 128
+DEFAULT_TEMPLATE_CACHE_TTL = 300.0
 
 
 class TemplatesClient(BaseClient):
-    """Client for template operations."""
+    """Client for template operations.
+
+    ``get_template_by_id`` reads through ``template_cache`` (LRU with TTL), so
+    repeated generations from the same template ID skip the extra GET. The
+    cache is invalidated by ``update_template`` and ``delete_template``, both
+    before the request and once it succeeds, and a read that overlapped a
+    write does not cache what it fetched. Pass ``TTLCache(maxsize=0)`` to
+    disable it.
+    """
+
+    def __init__(self, *args, template_cache: Optional[TTLCache] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if template_cache is None:
+            template_cache = TTLCache(
+                maxsize=DEFAULT_TEMPLATE_CACHE_SIZE, ttl=DEFAULT_TEMPLATE_CACHE_TTL
+            )
+        self.template_cache = template_cache
+        # ID-indexed copy of the last full listing, used by the legacy fallback
+        self._template_index = TTLCache(
+            maxsize=1 if template_cache.maxsize > 0 else 0, ttl=template_cache.ttl
+        )
+        # Bumped on every invalidation, so reads that overlap one don't cache
+        self._template_generation = 0
 
     def get_templates(self) -> List[Dict]:
         """Fetch all templates from the API."""
@@ -25,8 +52,9 @@ class TemplatesClient(BaseClient):
                 if "active" not in field:
                     field["active"] = True
 
-        response = self._make_request("POST", "/templates", json=template_data)
-        return response.json()
+        return self._run(
+            self._write_flow(None, "POST", "/templates", json=template_data)
+        )
 
     def get_template(self, template_id: str) -> Dict:
         """Get a specific template by ID."""
@@ -35,35 +63,94 @@ class TemplatesClient(BaseClient):
 
     def update_template(self, template_id: str, template_data: Dict) -> Dict:
         """Update a template."""
-        response = self._make_request(
-            "PUT", f"/templates/{template_id}", json=template_data
+        return self._run(
+            self._write_flow(
+                template_id, "PUT", f"/templates/{template_id}", json=template_data
+            )
         )
-        return response.json()
 
     def delete_template(self, template_id: str) -> Dict:
         """Delete a template."""
-        response = self._make_request("DELETE", f"/templates/{template_id}")
-        return response.json()
+        return self._run(
+            self._write_flow(template_id, "DELETE", f"/templates/{template_id}")
+        )
+
+    def _write_flow(
+        self, template_id: Optional[str], method: str, endpoint: str, **kwargs
+    ) -> Flow:
+        """Send a template write, dropping cached copies before and after it.
+
+        The second invalidation removes anything a read cached while the
+        write was in flight.
+        """
+        self._forget_template(template_id)
+        result = yield self._make_request(method, endpoint, **kwargs).json()
+        self._forget_template(template_id)
+        return result
+
+    def invalidate_template(self, template_id: Optional[str] = None) -> None:
+        """Drop a template (or, without an ID, every template) from the cache."""
+        if template_id is None:
+            self.template_cache.clear()
+        self._forget_template(template_id)
+
+    def _forget_template(self, template_id: Optional[str]) -> None:
+        """Drop a cached template and the listing index, outdating reads."""
+        if template_id is not None:
+            self.template_cache.pop(template_id)
+        self._template_index.clear()
+        self._template_generation += 1
 
     def get_template_by_id(self, template_id: str) -> Dict:
-        """Get a specific template by ID (legacy method for backward compatibility)."""
-        try:
-            # Try direct API call first (more efficient)
-            return self.get_template(template_id)
-        except:
-            # Fallback to searching through all templates (legacy behavior)
-            templates = self.get_templates()
-
-            if not templates:
-                raise DataMakerError("No templates found in your account.")
-
-            template = next(
-                (temp for temp in templates if temp["id"] == template_id), None
-            )
+        """Get a specific template by ID (legacy method for backward compatibility).
+
+        Served from ``template_cache`` when possible. The returned dictionary
+        is a copy, so callers may modify it freely.
+        """
+        return self._run(self._template_by_id_flow(template_id))
+
+    def _template_by_id_flow(self, template_id: str) -> Flow:
+        template = self.template_cache.get(template_id)
+        if template is None:
+            generation = self._template_generation
+            try:
+                # Try direct API call first (more efficient)
+                template = yield self.get_template(template_id)
+            except Exception:
+                # Fallback to searching through all templates (legacy behavior)
+                index = self._template_index.get("all")
+                if index is None:
+                    listing = yield self.get_templates()
+                    index = self._index_templates(listing, generation)
+                template = self._find_template(index, template_id)
+            if generation == self._template_generation:
+                self.template_cache.set(template_id, template)
+        return copy.deepcopy(template)
 
-            if not template:
-                raise DataMakerError(
-                    "You must provide ID of a template from your account."
-                )
+    def _index_templates(
+        self, templates: List[Dict], generation: int
+    ) -> Dict[str, Dict]:
+        """Index a full template listing by ID and remember it for the TTL.
+
+        The index is not remembered if the cache was invalidated after
+        ``generation`` was read, since the listing may predate the change.
+        """
+        if not templates:
+            raise DataMakerError("No templates found in your account.")
+
+        index = {temp["id"]: temp for temp in templates}
+        if generation == self._template_generation:
+            self._template_index.set("all", index)
+        return index
+
+    @staticmethod
+    def _find_template(index: Dict[str, Dict], template_id: str) -> Dict:
+        """Pick a template out of an ID-indexed listing."""
+        template = index.get(template_id)
+
+        if not template:
+            raise DataMakerError(
+                "You must provide ID of a template from your account."
+            )
 
-            return template
+        return template
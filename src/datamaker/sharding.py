@@ -0,0 +1,104 @@
+"""Reproducible generation split into shards across worker processes.
+
+A quantity is cut into a fixed number of shards, and each shard is
+generated by its own ``LocalGenerator`` seeded from ``(seed, shard index)``.
+Shard boundaries and seeds depend only on the quantity, the shard count and
+the seed, never on how many processes run them, so the joined result is the
+same for any number of workers. Requires NumPy.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+from .columnar import ColumnarResult, _numpy
+from .error import DataMakerError
+from .local_generator import LocalGenerator
+from .planner import TemplatePlan
+
+# Part of the output's identity: changing it changes the generated rows
+DEFAULT_SHARDS = 16
+
+
+def shard_sizes(quantity: int, shards: int) -> List[int]:
+    """Split ``quantity`` rows into ``shards`` sizes differing by at most one."""
+    if shards < 1:
+        raise DataMakerError("shards must be at least 1.")
+    if quantity < 0:
+        raise DataMakerError("quantity must not be negative.")
+    size, extra = divmod(quantity, shards)
+    return [size + 1 if shard < extra else size for shard in range(shards)]
+
+
+def shard_seeds(seed: Optional[int], shards: int) -> list:
+    """Return one independent NumPy ``SeedSequence`` per shard.
+
+    Shard ``i`` gets ``SeedSequence(seed, spawn_key=(i,))``, the same
+    sequence ``SeedSequence(seed).spawn(shards)[i]`` would give. Without a
+    seed, fresh entropy is drawn once and shared by every shard.
+    """
+    np = _numpy()
+    entropy = np.random.SeedSequence(seed).entropy
+    return [
+        np.random.SeedSequence(entropy, spawn_key=(shard,)) for shard in range(shards)
+    ]
+
+
+def _generate_shard(plan: TemplatePlan, size: int, seed) -> ColumnarResult:
+    return LocalGenerator(seed=seed).execute(plan, size, columnar=True)
+
+
+def run_shards(
+    plan: TemplatePlan,
+    quantity: int,
+    shards: int = DEFAULT_SHARDS,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> ColumnarResult:
+    """Generate a fully local plan in shards and join them in shard order.
+
+    Args:
+        plan: A plan without remote fields.
+        quantity: Total number of rows.
+        shards: Number of shards; with ``seed``, this fixes the output.
+        seed: Seed the shard seeds are derived from.
+        workers: Number of processes; defaults to the CPU count, capped at
+            ``shards``. With one worker the shards run in this process.
+            Workers are started with ``spawn`` and import the calling
+            script's ``__main__`` module, so a script must only run this
+            under ``if __name__ == "__main__":``.
+
+    Raises:
+        DataMakerError: If the plan has remote fields, an argument is out
+            of range, or a worker process dies (e.g. because the calling
+            script has no ``__main__`` guard).
+    """
+    if plan.remote:
+        names = [field.get("name") for field in plan.remote]
+        raise DataMakerError(
+            f"Fields {names} are generated by the API and cannot be seeded; "
+            "sharded generation needs a template that is generated locally."
+        )
+    sizes = shard_sizes(quantity, shards)
+    seeds = shard_seeds(seed, shards)
+    workers = min(workers or os.cpu_count() or 1, shards)
+    if workers < 1:
+        raise DataMakerError("workers must be at least 1.")
+    if workers == 1:
+        results = map(_generate_shard, [plan] * shards, sizes, seeds)
+        return ColumnarResult.concat(results)
+    # Forking is unsafe in threaded callers, such as the async client
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return ColumnarResult.concat(
+                executor.map(_generate_shard, [plan] * shards, sizes, seeds)
+            )
+    except BrokenProcessPool as e:
+        raise DataMakerError(
+            "A sharded generation worker process died. Scripts that use "
+            "workers > 1 must call generate_sharded under "
+            "'if __name__ == \"__main__\":', since each worker re-imports the "
+            "main module; otherwise pass workers=1."
+        ) from e
@@ -0,0 +1,97 @@
+"""Incremental parsing of streamed JSON responses."""
+
+import codecs
+import json
+import re
+from typing import Any, List
+from .error import DataMakerError
+
+_WHITESPACE = " \t\n\r"
+# Matches when nothing but characters that could extend a number remain
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+
+class JSONArrayParser:
+    """Incrementally parse a top-level JSON array from streamed chunks.
+
+    Feed raw response chunks as they arrive; each call returns the array items
+    completed so far. Only the unparsed tail of the stream is buffered, so
+    memory stays proportional to one item rather than the whole body.
+
+    Example:
+        >>> parser = JSONArrayParser()
+        >>> parser.feed(b'[{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> parser.feed(b': 2}]')
+        [{'a': 2}]
+        >>> parser.close()
+        []
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk) -> List[Any]:
+        """Add a chunk of the body and return the newly completed items."""
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body and return any remaining items.
+
+        Raises:
+            DataMakerError: If the body was not a complete JSON array.
+        """
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if not self._done:
+            raise DataMakerError("Response ended before the JSON array was complete.")
+        return items
+
+    def _skip(self, chars: str) -> None:
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in chars:
+            self._pos += 1
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        if not self._started:
+            self._skip(_WHITESPACE)
+            if self._pos == len(self._buffer):
+                return items
+            if self._buffer[self._pos] != "[":
+                raise DataMakerError("Expected the response to be a JSON array.")
+            self._pos += 1
+            self._started = True
+
+        while not self._done:
+            self._skip(_WHITESPACE + ",")
+            if self._pos == len(self._buffer):
+                break
+            if self._buffer[self._pos] == "]":
+                self._pos += 1
+                self._done = True
+                break
+            try:
+                item, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise DataMakerError(f"Invalid JSON in response: {e}")
+                break
+            # A number may still be growing while only number characters
+            # follow it, e.g. "1" or "1." at the end of a chunk
+            growing = isinstance(item, (int, float)) and not isinstance(item, bool)
+            if growing and not final and _NUMBER_TAIL.match(self._buffer, end):
+                break
+            items.append(item)
+            self._pos = end
+
+        return items
@@ -0,0 +1,156 @@
+"""HTTP transport shared by the route clients.
+
+A ``Transport`` owns one ``requests.Session`` with keep-alive connection
+pooling, so repeated API calls reuse open TCP/TLS connections instead of
+paying a fresh handshake per request. ``DataMaker`` creates a single transport
+and hands it to every route client; standalone clients create their own unless
+one is passed in.
+
+``AsyncTransport`` is the asyncio counterpart used by ``AsyncDataMaker``. It
+is backed by an ``httpx.AsyncClient`` (install with
+``pip install "datamaker-py[async]"``) so many requests can be in flight from a
+single event loop over one connection pool.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from .error import DataMakerError
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class Transport:
+    """Pooled HTTP transport backed by a ``requests.Session``.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept open per host. Raise
+            this when fanning requests out across many threads.
+        session: Optional pre-configured session to use instead of creating
+            one (e.g. with custom proxies or certificates).
+        retry: Retry policy applied by every client sharing this transport.
+            Defaults to ``RetryPolicy()``; pass ``NO_RETRY`` to disable.
+        rate_limiter: Optional limiter every API request must pass through,
+            shared by all clients (and threads) using this transport.
+    """
+
+    # Connection-level failures that are worth retrying
+    transport_errors = (requests.ConnectionError, requests.Timeout)
+    # Every failure the HTTP library raises for a request
+    request_errors = (requests.RequestException,)
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        session: requests.Session = None,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.session = session or requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request over the pooled session."""
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncTransport:
+    """Pooled asyncio HTTP transport backed by an ``httpx.AsyncClient``.
+
+    Args:
+        max_connections: Maximum number of concurrent connections in the pool.
+            Requests beyond this wait for a free connection.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        verify: Whether to verify TLS certificates.
+        client: Optional pre-configured ``httpx.AsyncClient`` to use instead
+            of creating one.
+        retry: Retry policy applied by every client sharing this transport.
+        rate_limiter: Optional limiter every API request must pass through,
+            shared by all clients using this transport.
+
+    Raises:
+        DataMakerError: If ``httpx`` is not installed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        verify: bool = True,
+        client=None,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise DataMakerError(
+                "AsyncTransport requires httpx. Install it with "
+                "'pip install \"datamaker-py[async]\"'."
+            )
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        # Connection-level failures that are worth retrying
+        self.transport_errors = (httpx.TransportError,)
+        self.request_errors = (httpx.HTTPError,)
+        self._timeout = httpx.Timeout
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            verify=verify,
+        )
+
+    async def request(self, method: str, url: str, stream: bool = False, **kwargs):
+        """Send a request over the pooled async client.
+
+        With ``stream=True`` the body is not read up front; iterate it with
+        ``response.aiter_bytes()`` and close it with ``response.aclose()``.
+        """
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, tuple) and len(timeout) == 2:
+            # Accept requests-style (connect, read) timeouts
+            connect, read = timeout
+            kwargs["timeout"] = self._timeout(read, connect=connect)
+        request = self.client.build_request(method, url, **kwargs)
+        return await self.client.send(request, stream=stream)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -0,0 +1,763 @@
+"""Tests for the asyncio DataMaker client."""
+
+import asyncio
+import gzip
+import json
+import time
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.datamaker.async_main import AsyncDataMaker
+from src.datamaker.error import DataMakerError
+from src.datamaker.ratelimit import RateLimiter
+from src.datamaker.routes.generation import GenerationClient
+from src.datamaker.transport import AsyncTransport
+
+
+def make_client(api_key, handler, **kwargs):
+    """Build an AsyncDataMaker whose transport is served by ``handler``."""
+    transport = AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return AsyncDataMaker(api_key=api_key, transport=transport, **kwargs)
+
+
+class TestAsyncDataMaker:
+    """Test cases for the AsyncDataMaker class."""
+
+    def test_route_clients_share_transport(self, api_key):
+        """Test all async route clients reuse one transport."""
+        dm = make_client(api_key, lambda request: httpx.Response(200, json={}))
+        assert dm.generation.transport is dm.transport
+        assert dm.keymaps.transport is dm.transport
+        asyncio.run(dm.close())
+
+    def test_generate(self, api_key, sample_template):
+        """Test generate is awaitable and posts the template."""
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["path"] = request.url.path
+            seen["api_key"] = request.headers["X-API-Key"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json=[{"firstName": "Ada"}])
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.generate(sample_template)
+
+        result = asyncio.run(run())
+
+        assert result == [{"firstName": "Ada"}]
+        assert seen["method"] == "POST"
+        assert seen["path"] == "/datamaker"
+        assert seen["api_key"] == api_key
+        assert seen["body"] == sample_template
+
+    def test_keymap_put_shares_payload_building(self, api_key):
+        """Test async keymap_put sends the same payload as the sync client."""
+        seen = {}
+
+        def handler(request):
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(201, json={"upserted": 1})
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.keymap_put(
+                    "sap-material-migration",
+                    "Material",
+                    {"MAT-001": "700001"},
+                    project_id="proj-1",
+                )
+
+        result = asyncio.run(run())
+
+        assert result == {"upserted": 1}
+        assert seen["body"] == {
+            "mapName": "sap-material-migration",
+            "object": "Material",
+            "entries": [{"oldKey": "MAT-001", "newKey": "700001"}],
+            "projectId": "proj-1",
+        }
+
+    def test_validation_errors_raise_eagerly(self, api_key):
+        """Test argument validation still raises before any request is sent."""
+        dm = make_client(api_key, lambda request: httpx.Response(200, json={}))
+        with pytest.raises(DataMakerError):
+            dm.keymap_lookup("sap-material-migration", "Material", [])
+        asyncio.run(dm.close())
+
+    def test_api_error(self, api_key):
+        """Test non-2xx responses raise DataMakerError when awaited."""
+
+        async def run():
+            async with make_client(
+                api_key, lambda request: httpx.Response(400, text="Bad Request")
+            ) as dm:
+                await dm.get_sets()
+
+        with pytest.raises(DataMakerError, match="Bad Request"):
+            asyncio.run(run())
+
+    def test_generate_from_template_id(self, api_key, sample_template):
+        """Test the template is fetched and generated with the new quantity."""
+        bodies = []
+
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json=dict(sample_template))
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=[])
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.generate_from_template_id("test-template-123", 3)
+
+        asyncio.run(run())
+
+        assert bodies[0]["quantity"] == 3
+
+    def test_template_read_during_update_is_not_cached(self, api_key):
+        """Test a read that overlaps an update does not cache the old template."""
+        current = {"template": {"id": "1", "name": "Old"}}
+
+        async def handler(request):
+            if request.method == "PUT":
+                # Let the concurrent read finish before the update lands
+                await asyncio.sleep(0.01)
+                current["template"] = {"id": "1", "name": "New"}
+            return httpx.Response(200, json=current["template"])
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                update = asyncio.ensure_future(
+                    dm.update_template("1", {"name": "New"})
+                )
+                await asyncio.sleep(0)
+                during = await dm.templates.get_template_by_id("1")
+                await update
+                return during, await dm.templates.get_template_by_id("1")
+
+        during, after = asyncio.run(run())
+
+        assert during["name"] == "Old"
+        assert after["name"] == "New"
+
+    def test_concurrent_requests(self, api_key):
+        """Test many requests can be in flight from one event loop."""
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, json={"mappings": {}, "missing": []})
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await asyncio.gather(
+                    *(
+                        dm.keymap_lookup("map", "Material", [f"K{i}"])
+                        for i in range(20)
+                    )
+                )
+
+        results = asyncio.run(run())
+
+        assert len(results) == 20
+        assert in_flight["peak"] > 1
+
+    def test_rate_limiter(self, api_key):
+        """Test async requests pass through the shared rate limiter."""
+        limiter = RateLimiter(max_concurrent=2)
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, json={"mappings": {}, "missing": []})
+
+        transport = AsyncTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            rate_limiter=limiter,
+        )
+
+        async def run():
+            async with AsyncDataMaker(api_key=api_key, transport=transport) as dm:
+                assert dm.rate_limiter is limiter
+                await asyncio.gather(
+                    *(
+                        dm.keymap_lookup("map", "Material", [f"K{i}"])
+                        for i in range(6)
+                    )
+                )
+
+        asyncio.run(run())
+
+        assert in_flight["peak"] == 2
+        stats = limiter.stats()
+        assert stats["requests"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["waiting"] == 0
+
+    def test_rate_limiter_argument(self, api_key):
+        """Test AsyncDataMaker passes rate_limiter to the transport it builds."""
+        limiter = RateLimiter(rate=10)
+        dm = AsyncDataMaker(api_key=api_key, rate_limiter=limiter)
+        assert dm.rate_limiter is limiter
+        assert AsyncDataMaker(api_key=api_key).rate_limiter is None
+        asyncio.run(dm.close())
+
+    def test_transport_options_rejected_with_transport(self, api_key):
+        """Test pool and limiter options are not silently dropped."""
+        with pytest.raises(ValueError, match="max_connections"):
+            make_client(api_key, None, max_connections=5)
+        with pytest.raises(ValueError, match="rate_limiter"):
+            make_client(api_key, None, rate_limiter=RateLimiter(rate=10))
+        with pytest.raises(ValueError, match="pool_maxsize"):
+            AsyncDataMaker(api_key=api_key, pool_maxsize=50)
+        dm = AsyncDataMaker(api_key=api_key, max_connections=5)
+        assert dm.transport.max_connections == 5
+        asyncio.run(dm.close())
+
+    def test_read_file_by_path(self, api_key):
+        """Test presigned file reads are awaited end to end."""
+
+        def handler(request):
+            if request.url.path == "/workspace-files/by-key":
+                return httpx.Response(
+                    200, json={"presignedUrl": "https://storage.test/file.txt"}
+                )
+            return httpx.Response(200, content=b"hello")
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.read_file_by_path_as_text("scenarios/x/file.txt")
+
+        assert asyncio.run(run()) == "hello"
+
+    def test_read_file_by_path_reuses_presigned_url(self, api_key):
+        """Test repeated async reads fetch the presigned URL once."""
+        signed_at = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        url = (
+            f"https://storage.test/file.txt?X-Amz-Date={signed_at}"
+            "&X-Amz-Expires=3600&X-Amz-Signature=x"
+        )
+        api_calls = []
+
+        def handler(request):
+            if request.url.path == "/workspace-files/by-key":
+                api_calls.append(request)
+                return httpx.Response(200, json={"presignedUrl": url})
+            return httpx.Response(200, content=b"hello")
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return [
+                    await dm.read_file_by_path("scenarios/x/file.txt")
+                    for _ in range(3)
+                ]
+
+        assert asyncio.run(run()) == [b"hello"] * 3
+        assert len(api_calls) == 1
+
+    def test_save_set_stream_and_iter_set_rows(self, api_key):
+        """Test async paged set upload and download round-trip the rows."""
+        stored = {}
+
+        def handler(request):
+            path = request.url.path
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": "set-1"})
+            if request.method == "PUT":
+                assert request.headers["Content-Encoding"] == "gzip"
+                page = int(path.rsplit("/", 1)[1])
+                stored[page] = json.loads(gzip.decompress(request.content))["rows"]
+                return httpx.Response(200, json={})
+            if request.method == "PATCH":
+                return httpx.Response(200, json=json.loads(request.content))
+            rows = [row for page in sorted(stored) for row in stored[page]]
+            page = int(request.url.params["page"])
+            size = int(request.url.params["pageSize"])
+            body = {
+                "rows": rows[(page - 1) * size : page * size],
+                "total": len(rows),
+                "pageSize": size,
+            }
+            return httpx.Response(200, json=body)
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                saved = await dm.save_set_stream(
+                    "big", ({"n": i} for i in range(23)), page_size=10
+                )
+                rows = [
+                    row async for row in dm.iter_set_rows("set-1", page_size=7)
+                ]
+                return saved, rows
+
+        saved, rows = asyncio.run(run())
+
+        assert saved == {"rowCount": 23}
+        assert sorted(stored) == [1, 2, 3]
+        assert [row["n"] for row in rows] == list(range(23))
+
+    def test_save_set_stream_from_iter_generate_bulk(self, api_key):
+        """Test generated rows stream from iter_generate_bulk into a set."""
+        stored = {}
+
+        def handler(request):
+            path = request.url.path
+            if path == "/datamaker":
+                quantity = json.loads(request.content)["quantity"]
+                return httpx.Response(200, json=[{"n": i} for i in range(quantity)])
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": "set-1"})
+            if request.method == "PUT":
+                page = int(path.rsplit("/", 1)[1])
+                stored[page] = json.loads(gzip.decompress(request.content))["rows"]
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json=json.loads(request.content))
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                rows = dm.iter_generate_bulk({"fields": []}, 25, chunk_size=10)
+                return await dm.save_set_stream("generated", rows, page_size=8)
+
+        saved = asyncio.run(run())
+
+        assert saved == {"rowCount": 25}
+        assert [len(stored[page]) for page in sorted(stored)] == [8, 8, 8, 1]
+
+    def test_patch_set_rows_local_diff(self, api_key):
+        """Test async patches fall back to a diffed replacement, skipping no-ops."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append((request.method, request.url.path))
+            if request.url.path.endswith("/rows"):
+                return httpx.Response(404, text="Not found")
+            if request.method == "GET":
+                return httpx.Response(200, json={"data": [{"id": 1, "v": "a"}]})
+            return httpx.Response(200, json=json.loads(request.content))
+
+        async def run():
+            async with make_client(api_key, handler, set_cache_size=2) as dm:
+                unchanged = await dm.patch_set_rows("s1", upserts=[{"id": 1, "v": "a"}])
+                changed = await dm.patch_set_rows("s1", upserts=[{"id": 1, "v": "b"}])
+                return unchanged, changed
+
+        unchanged, changed = asyncio.run(run())
+
+        assert unchanged == {"id": "s1", "changed": False}
+        assert changed["data"] == [{"id": 1, "v": "b"}]
+        assert requests_seen == [
+            ("PATCH", "/sets/s1/rows"),
+            ("GET", "/sets/s1"),
+            ("PATCH", "/sets/s1"),
+        ]
+
+    def test_map_file_by_path(self, api_key, tmp_path):
+        """Test async mapping streams into the file cache and revalidates."""
+        requests_seen = []
+
+        def handler(request):
+            if request.url.path == "/workspace-files/by-key":
+                return httpx.Response(
+                    200, json={"presignedUrl": "https://storage.test/big.csv"}
+                )
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"a,b\n1,2\n", headers={"ETag": '"v1"'})
+
+        async def run():
+            async with make_client(
+                api_key, handler, file_cache_dir=str(tmp_path)
+            ) as dm:
+                first = await dm.map_file_by_path("scenarios/x/big.csv")
+                second = await dm.map_file_by_path("scenarios/x/big.csv")
+                return bytes(first), bytes(second)
+
+        assert asyncio.run(run()) == (b"a,b\n1,2\n",) * 2
+        assert requests_seen == [None, '"v1"']
+
+    def test_generate_bulk(self, api_key):
+        """Test async bulk generation returns chunk rows in order."""
+
+        async def handler(request):
+            quantity = json.loads(request.content)["quantity"]
+            await asyncio.sleep(0.01 if quantity == 10 else 0)
+            return httpx.Response(200, json=[{"q": quantity}] * quantity)
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.generate_bulk(
+                    {"fields": []}, 23, chunk_size=10, concurrency=3
+                )
+
+        rows = asyncio.run(run())
+
+        assert rows == [{"q": 10}] * 20 + [{"q": 3}] * 3
+
+    def test_iter_generate(self, api_key):
+        """Test async iter_generate yields rows from the streamed body."""
+        rows = [{"id": i} for i in range(100)]
+
+        async def run():
+            async with make_client(
+                api_key, lambda request: httpx.Response(200, json=rows)
+            ) as dm:
+                return [row async for row in dm.iter_generate({"fields": []}, 100)]
+
+        assert asyncio.run(run()) == rows
+
+    def test_generate_hybrid(self, api_key):
+        """Test async hybrid generation awaits the remote fields only."""
+        pytest.importorskip("numpy")
+        payloads = []
+
+        def handler(request):
+            payloads.append(json.loads(request.content))
+            return httpx.Response(200, json=[{"bio": "a"}, {"bio": "b"}])
+
+        template = {
+            "fields": [
+                {"name": "n", "type": "Number", "options": {"min": 1, "max": 1}},
+                {"name": "bio", "type": "AI", "options": {"prompt": "x"}},
+            ]
+        }
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.generate_hybrid(template, 2)
+
+        rows = asyncio.run(run())
+
+        assert rows == [{"n": 1, "bio": "a"}, {"n": 1, "bio": "b"}]
+        assert [field["name"] for field in payloads[0]["fields"]] == ["bio"]
+
+    def test_generate_sharded(self, api_key):
+        """Test async sharded generation matches the sync client."""
+        pytest.importorskip("numpy")
+        template = {"fields": [{"name": "n", "type": "Number"}]}
+
+        def handler(request):
+            raise AssertionError("sharded generation made a request")
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.generate_sharded(template, 9, shards=2, seed=5)
+
+        rows = asyncio.run(run())
+
+        assert rows == GenerationClient(api_key=api_key).generate_sharded(
+            template, 9, shards=2, seed=5, workers=1
+        )
+
+    def test_columnar_generation(self, api_key):
+        """Test async columnar generate, batches and bulk results."""
+        pytest.importorskip("numpy")
+
+        def handler(request):
+            quantity = json.loads(request.content).get("quantity") or 3
+            return httpx.Response(200, json=[{"n": i} for i in range(quantity)])
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                whole = await dm.generate({"fields": []}, columnar=True)
+                batches = [
+                    batch
+                    async for batch in dm.iter_generate(
+                        {"fields": []}, 5, columnar=True, batch_size=2
+                    )
+                ]
+                bulk = await dm.generate_bulk(
+                    {"fields": []}, 7, chunk_size=3, columnar=True
+                )
+                return whole, batches, bulk
+
+        whole, batches, bulk = asyncio.run(run())
+
+        assert whole["n"].tolist() == [0, 1, 2]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert bulk["n"].tolist() == [0, 1, 2, 0, 1, 2, 0]
+
+    def test_throttled_requests_are_retried(self, api_key, monkeypatch):
+        """Test async requests honor the transport retry policy."""
+        statuses = iter([429, 200])
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("src.datamaker.routes.async_base.asyncio.sleep", fake_sleep)
+
+        def handler(request):
+            status = next(statuses)
+            return httpx.Response(
+                status, json=[], headers={"Retry-After": "1"} if status == 429 else {}
+            )
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.get_sets()
+
+        assert asyncio.run(run()) == []
+        assert sleeps == [1.0]
+
+    def test_keymap_put_bulk(self, api_key):
+        """Test async bulk put sends every batch and sums the counts."""
+
+        def handler(request):
+            entries = json.loads(request.content)["entries"]
+            return httpx.Response(201, json={"upserted": len(entries)})
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                pairs = ((f"O{i}", f"N{i}") for i in range(11))
+                return await dm.keymap_put_bulk(
+                    "m1", "Material", pairs, batch_size=4, concurrency=2
+                )
+
+        result = asyncio.run(run())
+
+        assert result["upserted"] == 11
+        assert result["batches"] == 3
+        assert result["failed"] == []
+
+    def test_keymap_put_bulk_from_async_iterable(self, api_key):
+        """Test async bulk put copies entries streamed from another map."""
+        puts = []
+
+        def handler(request):
+            if request.method == "GET":
+                page = int(request.url.params["page"])
+                entries = [
+                    {"object": "M", "oldKey": str(i), "newKey": f"N{i}"}
+                    for i in range((page - 1) * 3, min(page * 3, 7))
+                ]
+                return httpx.Response(
+                    200, json={"pageSize": 3, "total": 7, "entries": entries}
+                )
+            entries = json.loads(request.content)["entries"]
+            puts.append([entry["oldKey"] for entry in entries])
+            return httpx.Response(201, json={"upserted": len(entries)})
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                pairs = (
+                    (entry["oldKey"], entry["newKey"])
+                    async for entry in dm.iter_keymap_entries("m1", page_size=3)
+                )
+                return await dm.keymap_put_bulk(
+                    "m2", "M", pairs, batch_size=4, concurrency=1
+                )
+
+        result = asyncio.run(run())
+
+        assert result["upserted"] == 7
+        assert result["failed"] == []
+        assert puts == [["0", "1", "2", "3"], ["4", "5", "6"]]
+
+    def test_keymap_lookup_bulk(self, api_key):
+        """Test async bulk lookup merges batch results."""
+
+        def handler(request):
+            keys = json.loads(request.content)["oldKeys"]
+            return httpx.Response(
+                200, json={"mappings": {k: k.lower() for k in keys}, "missing": []}
+            )
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.keymap_lookup_bulk(
+                    "m1", "Material", ["A", "B", "A", "C"], batch_size=2
+                )
+
+        result = asyncio.run(run())
+
+        assert result["mappings"] == {"A": "a", "B": "b", "C": "c"}
+
+    def test_keymap_lookup_bulk_from_async_iterable(self, api_key):
+        """Test async bulk lookup de-duplicates keys from an async iterable."""
+        sent = []
+
+        def handler(request):
+            keys = json.loads(request.content)["oldKeys"]
+            sent.append(keys)
+            return httpx.Response(
+                200, json={"mappings": {k: k.lower() for k in keys}, "missing": []}
+            )
+
+        async def keys():
+            for key in ["A", "B", "A", "C", "B"]:
+                yield key
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.keymap_lookup_bulk(
+                    "m1", "Material", keys(), batch_size=2, concurrency=1
+                )
+
+        result = asyncio.run(run())
+
+        assert result["mappings"] == {"A": "a", "B": "b", "C": "c"}
+        assert sent == [["A", "B"], ["C"]]
+
+    def test_keymap_lookup_cache(self, api_key):
+        """Test the async lookup reads through the cache after a put."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request.url.path.rsplit("/keymaps", 1)[-1])
+            return httpx.Response(200, json={"upserted": 1})
+
+        async def run():
+            async with make_client(api_key, handler, keymap_cache_size=10) as dm:
+                await dm.keymap_put("m1", "Material", {"A": "1"})
+                return await dm.keymap_lookup("m1", "Material", ["A"])
+
+        result = asyncio.run(run())
+
+        assert result == {"mappings": {"A": "1"}, "missing": []}
+        assert requests_seen == ["/entries"]
+
+    def test_iter_keymap_entries(self, api_key):
+        """Test async iteration walks every page in order."""
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            size = int(request.url.params["pageSize"])
+            start = (page - 1) * size
+            entries = [
+                {"object": "M", "oldKey": str(i), "newKey": str(i)}
+                for i in range(start, min(start + size, 7))
+            ]
+            return httpx.Response(
+                200, json={"pageSize": size, "total": 7, "entries": entries}
+            )
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return [e async for e in dm.iter_keymap_entries("m1", page_size=3)]
+
+        entries = asyncio.run(run())
+
+        assert [e["oldKey"] for e in entries] == [str(i) for i in range(7)]
+
+    def test_create_scenario_file_streams_multipart(self, api_key):
+        """Test async uploads stream the multipart body with its length."""
+        seen = {}
+
+        def handler(request):
+            seen["content_type"] = request.headers["Content-Type"]
+            seen["length"] = int(request.headers["Content-Length"])
+            seen["body"] = request.read()
+            return httpx.Response(201, json={"file": {"id": "file-1"}})
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.create_scenario_file(
+                    "a.txt", b"hello", scenario_id="scn-1", team_id="t-1"
+                )
+
+        result = asyncio.run(run())
+
+        assert result == {"id": "file-1"}
+        assert seen["content_type"].startswith("multipart/form-data; boundary=")
+        assert seen["length"] == len(seen["body"])
+        assert b"hello" in seen["body"]
+
+    def test_create_scenario_file_with_folder_id(self, api_key):
+        """Test async creates with a folder_id post JSON to /scenario-files."""
+        seen = {}
+
+        def handler(request):
+            seen["path"] = request.url.path
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(201, json={"id": "file-1"})
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.create_scenario_file(
+                    "a.txt",
+                    b"hello",
+                    scenario_id="scn-1",
+                    team_id="t-1",
+                    folder_id="folder-1",
+                )
+
+        assert asyncio.run(run()) == {"id": "file-1"}
+        assert seen["path"] == "/scenario-files"
+        assert seen["body"]["folderId"] == "folder-1"
+        assert seen["body"]["size"] == 5
+
+    def test_download_scenario_file_to_path(self, api_key, tmp_path):
+        """Test async downloads stream the presigned URL to disk."""
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                return httpx.Response(200, content=b"x" * 10000)
+            return httpx.Response(
+                200, json={"presignedUrl": "https://storage.example.com/f1"}
+            )
+
+        destination = tmp_path / "out.bin"
+        progress = []
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                await dm.download_scenario_file_to_path(
+                    "f1",
+                    str(destination),
+                    scenario_id="scn-1",
+                    chunk_size=4096,
+                    progress=lambda done, total: progress.append(done),
+                )
+
+        asyncio.run(run())
+
+        assert destination.read_bytes() == b"x" * 10000
+        assert progress[-1] == 10000
+
+    def test_download_folder(self, api_key, tmp_path):
+        """Test a folder listing is downloaded file by file into a directory."""
+        listing = {
+            "files": [
+                {"id": "f1", "name": "a.csv", "size": 3},
+                {"id": "f2", "name": "b.csv", "size": 3},
+            ]
+        }
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                content = request.url.path[-2:].encode() + b"!"
+                return httpx.Response(200, content=content)
+            if request.url.path.endswith("/files"):
+                return httpx.Response(200, json=listing)
+            file_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(
+                200, json={"presignedUrl": f"https://storage.example.com/{file_id}"}
+            )
+
+        async def run():
+            async with make_client(api_key, handler) as dm:
+                return await dm.download_folder(
+                    str(tmp_path), scenario_id="scn-1", concurrency=2
+                )
+
+        result = asyncio.run(run())
+
+        assert result["downloaded"] == [
+            str(tmp_path / "a.csv"),
+            str(tmp_path / "b.csv"),
+        ]
+        assert (tmp_path / "a.csv").read_bytes() == b"f1!"
+        assert (tmp_path / "b.csv").read_bytes() == b"f2!"
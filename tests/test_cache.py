@@ -0,0 +1,51 @@
+"""Tests for the in-process TTL/LRU cache."""
+
+from unittest.mock import patch
+from src.datamaker.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for the TTLCache class."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL has passed."""
+        with patch("src.datamaker.cache.time.monotonic") as mock_now:
+            mock_now.return_value = 100.0
+            cache = TTLCache(ttl=10)
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=1)
+
+            mock_now.return_value = 105.0
+            assert cache.get("a") == 1
+            assert cache.get("b") is None
+
+            mock_now.return_value = 111.0
+            assert cache.get("a") is None
+
+    def test_stats(self):
+        """Test hit and miss counters."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 128}
+
+    def test_zero_size_disables(self):
+        """Test a zero-size cache stores nothing."""
+        cache = TTLCache(maxsize=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
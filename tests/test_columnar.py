@@ -0,0 +1,135 @@
+"""Tests for column-oriented results."""
+
+import pytest
+from unittest.mock import patch
+from src.datamaker.columnar import (
+    ColumnBuilder,
+    ColumnarResult,
+    iter_columnar,
+    schema_from_template,
+)
+from src.datamaker.error import DataMakerError
+from src.datamaker.template import (
+    BooleanField,
+    FloatField,
+    NumberField,
+    Template,
+    WordsField,
+)
+
+np = pytest.importorskip("numpy")
+
+TEMPLATE = Template(
+    [
+        NumberField("qty"),
+        FloatField("price"),
+        BooleanField("active"),
+        WordsField("note"),
+    ]
+)
+ROWS = [
+    {"qty": 1, "price": 2, "active": True, "note": "a b"},
+    {"qty": 3, "price": 4.5, "active": False, "note": "c"},
+]
+
+
+class TestColumnarResult:
+    """Test cases for ColumnarResult and ColumnBuilder."""
+
+    def test_template_types_give_numpy_dtypes(self):
+        """Test Number, Float and Boolean fields become typed arrays."""
+        result = ColumnarResult.from_rows(ROWS, schema_from_template(TEMPLATE))
+
+        assert len(result) == 2
+        assert result.column_names == ["qty", "price", "active", "note"]
+        assert result["qty"].dtype == np.int64
+        assert result["price"].dtype == np.float64
+        assert result["price"].tolist() == [2.0, 4.5]
+        assert result["active"].dtype == np.bool_
+        assert result["note"].dtype == object
+        assert result.to_rows() == [
+            {"qty": 1, "price": 2.0, "active": True, "note": "a b"},
+            {"qty": 3, "price": 4.5, "active": False, "note": "c"},
+        ]
+
+    def test_types_inferred_without_schema(self):
+        """Test columns are typed from their first value and widened as needed."""
+        result = ColumnarResult.from_rows(
+            [
+                {"n": 1, "f": 1.5, "b": True, "s": "x", "mixed": 1},
+                {"n": 2, "f": 2.5, "b": False, "s": "y", "mixed": 2.5},
+                {"n": None, "f": 3.5, "b": True, "s": "z", "mixed": 3},
+            ]
+        )
+
+        assert result["n"].dtype == object
+        assert result["n"].tolist() == [1, 2, None]
+        assert result["f"].dtype == np.float64
+        assert result["b"].dtype == np.bool_
+        assert result["mixed"].dtype == np.float64
+        assert result["mixed"].tolist() == [1.0, 2.5, 3.0]
+
+    def test_ragged_rows_are_padded(self):
+        """Test missing keys become None and late columns are backfilled."""
+        result = ColumnarResult.from_rows([{"a": 1}, {"b": "x"}, {"a": 3, "b": "y"}])
+
+        assert result["a"].tolist() == [1, None, 3]
+        assert result["b"].tolist() == [None, "x", "y"]
+
+    def test_object_columns_keep_nested_values(self):
+        """Test list and dict values stay as single cells."""
+        result = ColumnarResult.from_rows([{"tags": [1, 2]}, {"tags": [3, 4]}])
+
+        assert result["tags"].shape == (2,)
+        assert result["tags"][1] == [3, 4]
+
+    def test_concat(self):
+        """Test batches are joined with dtype promotion and None fill."""
+        first = ColumnarResult.from_rows([{"a": 1, "b": "x"}])
+        second = ColumnarResult.from_rows([{"a": 2.5}])
+
+        result = ColumnarResult.concat([first, second])
+
+        assert len(result) == 2
+        assert result["a"].dtype == np.float64
+        assert result["b"].tolist() == ["x", None]
+
+    def test_iter_columnar_batches(self):
+        """Test rows are grouped into batches and the builder is reused."""
+        rows = ({"i": i} for i in range(5))
+
+        batches = list(iter_columnar(rows, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[2]["i"].tolist() == [4]
+        with pytest.raises(DataMakerError, match="batch_size"):
+            list(iter_columnar([], batch_size=0))
+
+    def test_to_pandas_shares_memory(self):
+        """Test typed columns are not copied into the DataFrame."""
+        pytest.importorskip("pandas")
+        result = ColumnarResult.from_rows(ROWS, schema_from_template(TEMPLATE))
+
+        df = result.to_pandas()
+
+        assert list(df.columns) == result.column_names
+        assert np.shares_memory(df["qty"].to_numpy(), result["qty"])
+        assert df["note"].tolist() == ["a b", "c"]
+
+    def test_to_arrow(self):
+        """Test the Arrow table keeps the column types."""
+        pyarrow = pytest.importorskip("pyarrow")
+        result = ColumnarResult.from_rows(ROWS, schema_from_template(TEMPLATE))
+
+        table = result.to_arrow()
+
+        assert table.num_rows == 2
+        assert table.schema.field("qty").type == pyarrow.int64()
+        assert table.schema.field("active").type == pyarrow.bool_()
+        assert table.column("note").to_pylist() == ["a b", "c"]
+
+    def test_missing_numpy_raises(self):
+        """Test a helpful error is raised when NumPy is not installed."""
+        with patch.dict("sys.modules", {"numpy": None}):
+            with pytest.raises(DataMakerError, match="datamaker-py\\[columnar\\]"):
+                ColumnBuilder()
@@ -0,0 +1,275 @@
+"""Tests for ranged, parallel and resumable downloads against a local server."""
+
+import asyncio
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+import pytest
+import requests
+from src.datamaker.download import RangedDownload, presigned_url_expiry
+from src.datamaker.error import DataMakerError
+from src.datamaker.retry import RetryPolicy
+from src.datamaker.routes.scenario_files import ScenarioFilesClient
+from src.datamaker.transport import Transport
+
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+
+
+class StorageHandler(BaseHTTPRequestHandler):
+    """Serves ``server.content`` like a presigned object store."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        signature = parse_qs(urlparse(self.path).query).get("sig", [""])[0]
+        with server.lock:
+            server.uses[signature] = server.uses.get(signature, 0) + 1
+            expired = server.uses[signature] > server.url_uses.get(signature, 1_000)
+            server.requests.append(self.headers.get("Range"))
+
+        if expired:
+            self.send_response(403)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range") or "")
+        if not server.ranges or not match:
+            self._send(200, server.content, {})
+            return
+
+        start, end = int(match.group(1)), int(match.group(2))
+        body = server.content[start : end + 1]
+        with server.lock:
+            fail = start in server.fail_starts
+            if fail and start in server.fail_once:
+                server.fail_starts.discard(start)
+        headers = {
+            "Content-Range": f"bytes {start}-{end}/{len(server.content)}",
+            "ETag": '"v1"',
+        }
+        self._send(206, body, headers, truncate=fail)
+
+    def _send(self, status, body, headers, truncate=False):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body[: len(body) // 2] if truncate else body)
+        if truncate:
+            self.close_connection = True
+
+
+@pytest.fixture
+def storage():
+    """A local HTTP server standing in for presigned object storage."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StorageHandler)
+    server.daemon_threads = True
+    server.content = CONTENT
+    server.ranges = True
+    server.lock = threading.Lock()
+    server.uses = {}
+    server.url_uses = {}
+    server.requests = []
+    server.fail_starts = set()
+    server.fail_once = set()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    server.url = lambda sig="a": f"http://127.0.0.1:{server.server_port}/obj?sig={sig}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport():
+    with Transport(retry=RetryPolicy(backoff_factor=0)) as transport:
+        yield transport
+
+
+class TestRangedDownload:
+    """Test cases for the RangedDownload class."""
+
+    def test_parallel_ranges_assemble_file(self, storage, transport, tmp_path):
+        """Test parts are fetched as ranges and written in place."""
+        path = tmp_path / "out.bin"
+        progress = []
+
+        RangedDownload(
+            transport,
+            storage.url,
+            str(path),
+            part_size=1000,
+            concurrency=4,
+            progress=lambda done, total: progress.append((done, total)),
+        ).run()
+
+        assert path.read_bytes() == CONTENT
+        # One probe plus eleven parts
+        assert len(storage.requests) == 12
+        assert "bytes=10000-10239" in storage.requests
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+        assert sorted(os.listdir(tmp_path)) == ["out.bin"]
+
+    def test_falls_back_without_range_support(self, storage, transport, tmp_path):
+        """Test a server ignoring Range gets one streamed download."""
+        storage.ranges = False
+        path = tmp_path / "out.bin"
+
+        RangedDownload(transport, storage.url, str(path), part_size=1000).run()
+
+        assert path.read_bytes() == CONTENT
+        assert len(storage.requests) == 1
+
+    def test_refreshes_expired_url(self, storage, transport, tmp_path):
+        """Test an expired presigned URL is replaced mid-transfer."""
+        signatures = iter(["first", "second"])
+        storage.url_uses = {"first": 3}
+        path = tmp_path / "out.bin"
+
+        RangedDownload(
+            transport,
+            lambda: storage.url(next(signatures)),
+            str(path),
+            part_size=1000,
+            concurrency=1,
+        ).run()
+
+        assert path.read_bytes() == CONTENT
+        assert storage.uses["second"] > 0
+
+    def test_retries_truncated_part(self, storage, transport, tmp_path):
+        """Test a dropped connection mid-part is retried."""
+        storage.fail_starts = {3000}
+        storage.fail_once = {3000}
+        path = tmp_path / "out.bin"
+
+        RangedDownload(transport, storage.url, str(path), part_size=1000).run()
+
+        assert path.read_bytes() == CONTENT
+        assert storage.requests.count("bytes=3000-3999") == 2
+
+    def test_resumes_from_completed_parts(self, storage, transport, tmp_path):
+        """Test a failed run leaves state that the next run resumes from."""
+        storage.fail_starts = {5000}
+        path = tmp_path / "out.bin"
+
+        with pytest.raises((requests.RequestException, DataMakerError)):
+            RangedDownload(
+                transport,
+                storage.url,
+                str(path),
+                part_size=1000,
+                concurrency=1,
+                part_retries=0,
+            ).run()
+
+        assert not path.exists()
+        state = json.loads((tmp_path / "out.bin.part.json").read_text())
+        assert state["done"] == [0, 1, 2, 3, 4]
+
+        storage.fail_starts = set()
+        storage.requests.clear()
+        RangedDownload(
+            transport, storage.url, str(path), part_size=1000, concurrency=2
+        ).run()
+
+        assert path.read_bytes() == CONTENT
+        assert "bytes=0-999" not in storage.requests
+        assert "bytes=5000-5999" in storage.requests
+        assert sorted(os.listdir(tmp_path)) == ["out.bin"]
+
+    def test_missing_file_raises(self, storage, transport, tmp_path):
+        """Test a 404 from storage raises with the configured message."""
+        with patch.object(StorageHandler, "do_GET", lambda self: self.send_error(404)):
+            with pytest.raises(DataMakerError, match="File not found: f1"):
+                RangedDownload(
+                    transport,
+                    storage.url,
+                    str(tmp_path / "out.bin"),
+                    not_found_message="File not found: f1",
+                ).run()
+
+
+class TestPresignedUrlExpiry:
+    """Test cases for presigned_url_expiry."""
+
+    def test_s3_sigv4(self):
+        """Test X-Amz-Date plus X-Amz-Expires gives the expiry."""
+        url = (
+            "https://bucket.s3.amazonaws.com/key?X-Amz-Algorithm=AWS4-HMAC-SHA256"
+            "&X-Amz-Date=20260101T000000Z&X-Amz-Expires=3600&X-Amz-Signature=abc"
+        )
+        assert presigned_url_expiry(url) == 1767225600 + 3600
+
+    def test_gcs(self):
+        """Test Google Cloud Storage V4 signed URLs."""
+        url = (
+            "https://storage.googleapis.com/b/k?X-Goog-Date=20260101T000000Z"
+            "&X-Goog-Expires=900&X-Goog-Signature=abc"
+        )
+        assert presigned_url_expiry(url) == 1767225600 + 900
+
+    def test_sigv2_and_azure(self):
+        """Test epoch ``Expires`` and Azure SAS ``se`` parameters."""
+        assert presigned_url_expiry("https://s/k?Expires=1767229200") == 1767229200
+        azure = "https://a.blob.core.windows.net/c/k?se=2026-01-01T01:00:00Z&sig=x"
+        assert presigned_url_expiry(azure) == 1767229200
+
+    def test_unknown(self):
+        """Test URLs without an expiry give None."""
+        assert presigned_url_expiry("https://storage/f1?sig=x") is None
+        bad_date = "https://s/k?X-Amz-Date=bad&X-Amz-Expires=60"
+        assert presigned_url_expiry(bad_date) is None
+
+
+class TestScenarioFilesRangedDownload:
+    """Test the ScenarioFilesClient entry points."""
+
+    def test_download_scenario_file_ranged(self, storage, api_key, tmp_path):
+        """Test presigned URLs are fetched through get_scenario_file."""
+        client = ScenarioFilesClient(api_key=api_key)
+        path = tmp_path / "out.bin"
+
+        with patch.object(
+            client, "get_scenario_file", return_value={"presignedUrl": storage.url()}
+        ) as get_file:
+            client.download_scenario_file_ranged(
+                "f1", str(path), scenario_id="scn-1", part_size=4096
+            )
+
+        get_file.assert_called_once_with("f1", "scn-1")
+        assert path.read_bytes() == CONTENT
+
+    def test_async_download_scenario_file_ranged(self, storage, api_key, tmp_path):
+        """Test the async client runs the ranged download off the event loop."""
+        httpx = pytest.importorskip("httpx")
+        from src.datamaker.async_main import AsyncDataMaker
+        from src.datamaker.transport import AsyncTransport
+
+        def handler(request):
+            return httpx.Response(200, json={"presignedUrl": storage.url()})
+
+        path = tmp_path / "out.bin"
+
+        async def run():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDataMaker(api_key=api_key, transport=transport) as dm:
+                await dm.download_scenario_file_ranged(
+                    "f1", str(path), scenario_id="scn-1", part_size=4096
+                )
+
+        asyncio.run(run())
+
+        assert path.read_bytes() == CONTENT
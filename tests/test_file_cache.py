@@ -0,0 +1,109 @@
+"""Tests for the on-disk file content cache."""
+
+import os
+import pytest
+from src.datamaker.file_cache import FileCache
+
+
+class TestFileCache:
+    """Test cases for the FileCache class."""
+
+    def test_store_and_lookup(self, tmp_path):
+        """Test stored content is found again with its ETag and size."""
+        cache = FileCache(str(tmp_path / "cache"))
+
+        entry = cache.store("scenarios/a.csv", b"a,b\n", '"v1"')
+
+        assert cache.lookup("scenarios/a.csv") == entry
+        assert entry["etag"] == '"v1"'
+        assert entry["size"] == 4
+        assert cache.read(entry) == b"a,b\n"
+        assert cache.lookup("scenarios/b.csv") is None
+
+    def test_home_directory_is_expanded(self, tmp_path, monkeypatch):
+        """Test a ``~`` directory is created under the home directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        cache = FileCache("~/datamaker-cache")
+
+        entry = cache.store("scenarios/a.csv", b"a,b\n", '"v1"')
+
+        assert cache.directory == str(tmp_path / "datamaker-cache")
+        assert os.path.dirname(entry["path"]) == cache.directory
+        assert not os.path.exists("~")
+
+    def test_new_version_replaces_old(self, tmp_path):
+        """Test storing a new ETag removes the previous content file."""
+        cache = FileCache(str(tmp_path))
+        old = cache.store("k", b"old", '"v1"')
+
+        new = cache.store("k", b"newer", '"v2"')
+
+        assert cache.lookup("k") == new
+        assert not os.path.exists(old["path"])
+        assert sorted(name.rsplit(".", 1)[1] for name in os.listdir(tmp_path)) == [
+            "bin",
+            "json",
+        ]
+
+    def test_truncated_content_is_ignored(self, tmp_path):
+        """Test an entry whose content file does not match its size is unused."""
+        cache = FileCache(str(tmp_path))
+        entry = cache.store("k", b"content", '"v1"')
+        with open(entry["path"], "wb") as f:
+            f.write(b"cont")
+
+        assert cache.lookup("k") is None
+
+    def test_pop_and_clear(self, tmp_path):
+        """Test entries can be dropped one at a time or all at once."""
+        cache = FileCache(str(tmp_path))
+        cache.store("a", b"1", "e1")
+        cache.store("b", b"2", "e2")
+
+        cache.pop("a")
+        assert cache.lookup("a") is None
+        assert cache.lookup("b") is not None
+
+        cache.clear()
+        assert os.listdir(tmp_path) == []
+
+    def test_open_mmap_is_read_only_view(self, tmp_path):
+        """Test a mapped entry exposes the content without copying it."""
+        cache = FileCache(str(tmp_path))
+        entry = cache.store("k", b"0123456789", '"v1"')
+
+        view = cache.open_mmap(entry)
+
+        assert view.readonly
+        assert bytes(view[2:5]) == b"234"
+        assert len(view) == 10
+
+    def test_open_mmap_empty_file(self, tmp_path):
+        """Test empty files map to an empty view."""
+        cache = FileCache(str(tmp_path))
+        entry = cache.store("k", b"", None)
+
+        assert len(cache.open_mmap(entry)) == 0
+
+    def test_mapping_survives_replacement(self, tmp_path):
+        """Test an open mapping keeps its content when a new version lands."""
+        cache = FileCache(str(tmp_path))
+        view = cache.open_mmap(cache.store("k", b"old content", '"v1"'))
+
+        cache.store("k", b"new", '"v2"')
+
+        assert bytes(view) == b"old content"
+        assert cache.read(cache.lookup("k")) == b"new"
+
+    def test_failed_writer_publishes_nothing(self, tmp_path):
+        """Test an exception inside a writer leaves the old entry in place."""
+        cache = FileCache(str(tmp_path))
+        cache.store("k", b"old", '"v1"')
+
+        with pytest.raises(RuntimeError):
+            with cache.writer("k", '"v2"') as writer:
+                writer.write(b"partial")
+                raise RuntimeError("connection lost")
+
+        assert cache.lookup("k")["etag"] == '"v1"'
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
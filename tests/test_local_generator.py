@@ -0,0 +1,141 @@
+"""Tests for offline vectorized generation."""
+
+import re
+import pytest
+from unittest.mock import Mock
+from src.datamaker.error import DataMakerError
+from src.datamaker.local_generator import LocalGenerator
+from src.datamaker.template import (
+    AIField,
+    BooleanField,
+    CustomField,
+    FloatField,
+    NumberField,
+    Template,
+    UUIDField,
+    WordsField,
+)
+
+np = pytest.importorskip("numpy")
+
+UUID4 = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+)
+
+TEMPLATE = Template(
+    [
+        UUIDField("id"),
+        NumberField("qty", {"min": 5, "max": 7}),
+        FloatField("price", {"min": 1.0, "max": 2.0, "precision": 1}),
+        BooleanField("active"),
+        CustomField("category", ["Books", "Food"]),
+        WordsField("title", {"count": 3}),
+    ],
+    quantity=500,
+)
+
+
+class TestLocalGenerator:
+    """Test cases for the LocalGenerator class."""
+
+    def test_fields_honor_options(self):
+        """Test every supported type is sampled within its options."""
+        result = LocalGenerator(seed=1).generate(TEMPLATE, columnar=True)
+
+        assert len(result) == 500
+        assert all(UUID4.match(value) for value in result["id"])
+        assert len(set(result["id"])) == 500
+        assert result["qty"].dtype == np.int64
+        assert set(result["qty"].tolist()) == {5, 6, 7}
+        assert result["price"].min() >= 1.0 and result["price"].max() <= 2.0
+        assert np.array_equal(result["price"], np.round(result["price"], 1))
+        assert result["active"].dtype == np.bool_
+        assert set(result["category"]) == {"Books", "Food"}
+        assert {len(title.split()) for title in result["title"]} == {3}
+
+    def test_rows_match_api_shape(self):
+        """Test row output is plain dictionaries of Python values."""
+        rows = LocalGenerator(seed=1).generate(TEMPLATE, quantity=2)
+
+        assert len(rows) == 2
+        assert set(rows[0]) == {"id", "qty", "price", "active", "category", "title"}
+        assert type(rows[0]["qty"]) is int
+        assert type(rows[0]["active"]) is bool
+
+    def test_seed_is_reproducible(self):
+        """Test the same seed gives the same rows and another seed does not."""
+        first = LocalGenerator(seed=7).generate(TEMPLATE, quantity=50)
+
+        assert LocalGenerator(seed=7).generate(TEMPLATE, quantity=50) == first
+        assert LocalGenerator(seed=8).generate(TEMPLATE, quantity=50) != first
+
+    def test_uuid_uppercase_and_long_word_counts(self):
+        """Test uppercase UUIDs and word counts beyond one phrase."""
+        generator = LocalGenerator(seed=3)
+
+        ids = generator.sample(UUIDField("id", {"uppercase": True}), 10)
+        words = generator.sample(WordsField("w", {"count": 5}), 10)
+
+        assert all(UUID4.match(value.lower()) and value.isupper() for value in ids)
+        assert {len(text.split()) for text in words} == {5}
+
+    def test_unsupported_fields_use_the_api(self):
+        """Test only fields of other types are generated by the client."""
+        client = Mock()
+        client.generate.return_value = [{"bio": "text"}, {"bio": "more"}]
+        template = Template([UUIDField("id"), AIField("bio", "Write a bio")])
+
+        rows = LocalGenerator(client=client).generate(template, quantity=2)
+
+        assert [row["bio"] for row in rows] == ["text", "more"]
+        assert all(UUID4.match(row["id"]) for row in rows)
+        payload = client.generate.call_args.args[0]
+        assert payload["quantity"] == 2
+        assert [field["name"] for field in payload["fields"]] == ["bio"]
+        assert client.generate.call_args.kwargs == {"columnar": True}
+
+    def test_derived_fields_are_substituted(self):
+        """Test Derived values are filled in from local and remote columns."""
+        client = Mock()
+        client.generate.return_value = [{"first": "Ada"}, {"first": None}]
+        template = {
+            "fields": [
+                {
+                    "name": "email",
+                    "type": "Derived",
+                    "options": {"value": "{{ first }}.{{n}}@x.com ({{ok}})"},
+                },
+                {"name": "first", "type": "First Name"},
+                {"name": "n", "type": "Number", "options": {"min": 4, "max": 4}},
+                {"name": "ok", "type": "Boolean"},
+            ],
+            "quantity": 2,
+        }
+
+        rows = LocalGenerator(client=client, seed=1).generate(template)
+
+        assert list(rows[0]) == ["email", "first", "n", "ok"]
+        ok = ["true" if row["ok"] else "false" for row in rows]
+        assert rows[0]["email"] == f"Ada.4@x.com ({ok[0]})"
+        assert rows[1]["email"] == f".4@x.com ({ok[1]})"
+
+    def test_remote_row_count_must_match(self):
+        """Test a remote result of the wrong length raises."""
+        client = Mock()
+        client.generate.return_value = [{"bio": "text"}]
+        template = Template([UUIDField("id"), AIField("bio", "x")], quantity=3)
+
+        with pytest.raises(DataMakerError, match="returned 1 rows"):
+            LocalGenerator(client=client).generate(template)
+
+    def test_errors(self):
+        """Test missing clients, quantities and invalid options raise."""
+        generator = LocalGenerator()
+        with pytest.raises(DataMakerError, match="bio"):
+            generator.generate(Template([AIField("bio", "x")], quantity=1))
+        with pytest.raises(DataMakerError, match="quantity"):
+            generator.generate(Template([UUIDField("id")]))
+        with pytest.raises(DataMakerError, match="greater than max"):
+            generator.sample(NumberField("n", {"min": 3, "max": 1}), 1)
+        with pytest.raises(DataMakerError, match="at least one value"):
+            generator.sample(CustomField("c", []), 1)
@@ -0,0 +1,124 @@
+"""Tests for the offline LocalKeyMap store."""
+
+import json
+import pytest
+from src.datamaker.error import DataMakerError
+from src.datamaker.local_keymap import LocalKeyMap
+
+
+ENTRIES = [
+    {"object": "Material", "oldKey": "MAT-001", "newKey": "700001"},
+    {"object": "Material", "oldKey": "MAT-002", "newKey": "700002"},
+    {"object": "Customer", "oldKey": "MAT-001", "newKey": "C-1"},
+]
+
+
+class TestLocalKeyMap:
+    """Test cases for LocalKeyMap."""
+
+    def test_lookup_matches_keymap_lookup_shape(self):
+        """Test lookups return mappings and missing like the API."""
+        with LocalKeyMap() as keymap:
+            keymap.add(ENTRIES)
+            result = keymap.lookup(
+                ["MAT-001", "MAT-999", "MAT-002", "MAT-001"], object="Material"
+            )
+
+        assert result == {
+            "mappings": {"MAT-001": "700001", "MAT-002": "700002"},
+            "missing": ["MAT-999"],
+        }
+
+    def test_lookup_batches_large_key_lists(self):
+        """Test lookups beyond one IN (...) batch are answered completely."""
+        with LocalKeyMap() as keymap:
+            keymap.add(((f"K{i}", f"N{i}") for i in range(2000)), object="M")
+            result = keymap.lookup([f"K{i}" for i in range(0, 2400, 2)], object="M")
+
+        assert len(result["mappings"]) == 1000
+        assert result["missing"] == [f"K{i}" for i in range(2000, 2400, 2)]
+
+    def test_lookup_uses_an_index(self):
+        """Test lookups with or without an object never scan the table."""
+        with LocalKeyMap() as keymap:
+            keymap.add(ENTRIES)
+            for by_object in (False, True):
+                query = keymap._lookup_query(2, by_object)
+                params = ["MAT-001", "MAT-002"] + (["Material"] if by_object else [])
+                plan = keymap._conn.execute(f"EXPLAIN QUERY PLAN {query}", params)
+                details = [row[-1] for row in plan.fetchall()]
+
+                assert details
+                assert all(detail.startswith("SEARCH") for detail in details)
+
+    def test_lookup_without_object(self):
+        """Test object=None matches entries of any object."""
+        with LocalKeyMap() as keymap:
+            keymap.add(ENTRIES[1:])
+            result = keymap.lookup(["MAT-001", "MAT-002", "MAT-999"])
+
+        assert result == {
+            "mappings": {"MAT-001": "C-1", "MAT-002": "700002"},
+            "missing": ["MAT-999"],
+        }
+
+    def test_last_write_wins(self):
+        """Test re-adding an old key overwrites its new key."""
+        with LocalKeyMap() as keymap:
+            keymap.add({"A": "1"}, object="M")
+            keymap.add({"A": "2"}, object="M")
+
+            assert keymap.get("A", object="M") == "2"
+            assert len(keymap) == 1
+
+    def test_load_pages(self):
+        """Test loading get_keymap_entries page responses."""
+        pages = [{"entries": ENTRIES[:2]}, {"entries": ENTRIES[2:]}]
+        with LocalKeyMap() as keymap:
+            assert keymap.load_pages(pages) == 3
+            assert keymap.get("MAT-001", object="Customer") == "C-1"
+
+    def test_load_csv_and_jsonl(self, tmp_path):
+        """Test loading entries from CSV and JSON Lines files."""
+        csv_path = tmp_path / "map.csv"
+        csv_path.write_text("old_key,new_key\nA,1\nB,2\n")
+        jsonl_path = tmp_path / "map.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps(e) for e in ENTRIES) + "\n")
+
+        with LocalKeyMap() as keymap:
+            assert keymap.load_file(str(csv_path), object="Letter") == 2
+            assert keymap.load_file(str(jsonl_path)) == 3
+            assert keymap.lookup(["A", "B"], object="Letter")["missing"] == []
+            assert keymap.get("MAT-002", object="Material") == "700002"
+
+    def test_load_sqlite_snapshot(self, tmp_path):
+        """Test loading another LocalKeyMap file."""
+        path = tmp_path / "snapshot.sqlite"
+        with LocalKeyMap(str(path)) as source:
+            source.add(ENTRIES)
+
+        with LocalKeyMap() as keymap:
+            assert keymap.load_file(str(path)) == 3
+            assert len(keymap) == 3
+
+    def test_load_file_rejects_unknown_types(self, tmp_path):
+        """Test unsupported file types and CSVs without key columns raise."""
+        bad_csv = tmp_path / "map.csv"
+        bad_csv.write_text("a,b\n1,2\n")
+
+        with LocalKeyMap() as keymap:
+            with pytest.raises(DataMakerError):
+                keymap.load_file(str(tmp_path / "map.parquet"))
+            with pytest.raises(DataMakerError):
+                keymap.load_file(str(bad_csv))
+
+    def test_persists_to_disk(self, tmp_path):
+        """Test entries and metadata survive reopening the file."""
+        path = str(tmp_path / "map.sqlite")
+        with LocalKeyMap(path) as keymap:
+            keymap.add(ENTRIES)
+            keymap.set_meta(mapName="m1")
+
+        with LocalKeyMap(path) as keymap:
+            assert keymap.meta == {"mapName": "m1"}
+            assert keymap.get("MAT-002", object="Material") == "700002"
@@ -4,6 +4,9 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from src.datamaker.main import DataMaker
 from src.datamaker.error import DataMakerError
+from src.datamaker.ratelimit import RateLimiter
+from src.datamaker.retry import RetryPolicy
+from src.datamaker.transport import Transport
 
 
 class TestDataMaker:
@@ -30,6 +33,30 @@ class TestDataMaker:
         assert "Custom-Header" in client.headers
         assert client.headers["Custom-Header"] == "test-value"
 
+    def test_route_clients_share_transport(self, api_key):
+        """Test all route clients reuse the DataMaker transport."""
+        client = DataMaker(api_key=api_key, pool_maxsize=50)
+        assert client.transport.pool_maxsize == 50
+        assert client.generation.transport is client.transport
+        assert client.keymaps.transport is client.transport
+        assert client.scenario_files.transport is client.transport
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            {"pool_maxsize": 50},
+            {"retry": RetryPolicy(max_retries=1)},
+            {"rate_limiter": RateLimiter(rate=10)},
+        ],
+    )
+    def test_transport_options_rejected_with_transport(self, api_key, option):
+        """Test transport options are not silently dropped for a given transport."""
+        with Transport() as transport:
+            with pytest.raises(ValueError, match=next(iter(option))):
+                DataMaker(api_key=api_key, transport=transport, **option)
+            client = DataMaker(api_key=api_key, transport=transport)
+            assert client.transport is transport
+
     @patch("src.datamaker.routes.generation.GenerationClient.generate")
     def test_generate(self, mock_generate, datamaker_client, sample_template):
         """Test data generation."""
@@ -37,7 +64,7 @@ class TestDataMaker:
 
         result = datamaker_client.generate(sample_template)
 
-        mock_generate.assert_called_once_with(sample_template)
+        mock_generate.assert_called_once_with(sample_template, columnar=False)
         assert result == {"generated_data": "test"}
 
     @patch("src.datamaker.routes.templates.TemplatesClient.get_template")
@@ -59,6 +86,22 @@ class TestDataMaker:
         assert mock_generate.call_args[0][0]["quantity"] == quantity
         assert result == {"generated_data": "test"}
 
+    @patch("src.datamaker.routes.templates.TemplatesClient.get_template")
+    @patch("src.datamaker.routes.generation.GenerationClient.generate")
+    def test_generate_from_template_id_uses_cache(
+        self, mock_generate, mock_get_template, datamaker_client, sample_template
+    ):
+        """Test repeated generations fetch the template once."""
+        mock_get_template.return_value = sample_template
+        mock_generate.return_value = []
+
+        datamaker_client.generate_from_template_id("test-template-123", 5)
+        datamaker_client.generate_from_template_id("test-template-123", 7)
+
+        mock_get_template.assert_called_once_with("test-template-123")
+        assert mock_generate.call_args[0][0]["quantity"] == 7
+        assert sample_template["quantity"] == 10
+
     # Template methods tests
     @patch("src.datamaker.routes.templates.TemplatesClient.get_templates")
     def test_get_templates(self, mock_get_templates, datamaker_client):
@@ -0,0 +1,84 @@
+"""Tests for streaming multipart/form-data bodies."""
+
+import asyncio
+import io
+from email import message_from_bytes
+import requests
+from src.datamaker.multipart import MultipartStream
+
+
+def parse_form(body: MultipartStream, data: bytes):
+    """Parse an encoded body into ``{field: (filename, content_type, bytes)}``."""
+    message = message_from_bytes(
+        f"Content-Type: {body.content_type}\r\n\r\n".encode() + data
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    }
+
+
+class TestMultipartStream:
+    """Test cases for the MultipartStream class."""
+
+    def test_encodes_fields_and_file(self):
+        """Test the body is valid multipart with the declared length."""
+        content = bytes(range(256)) * 100
+        body = MultipartStream(
+            {"folder": "outputs"}, "file", "data.bin", io.BytesIO(content)
+        )
+
+        data = body.read()
+
+        assert len(data) == len(body)
+        form = parse_form(body, data)
+        assert form["folder"][2] == b"outputs"
+        assert form["file"] == ("data.bin", "application/octet-stream", content)
+
+    def test_reads_in_bounded_chunks(self):
+        """Test small reads return at most the requested size."""
+        body = MultipartStream({}, "file", "a.txt", io.BytesIO(b"x" * 1000), "text/plain")
+
+        chunks = list(iter(lambda: body.read(64), b""))
+
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        assert sum(map(len, chunks)) == len(body)
+
+    def test_starts_at_current_file_position(self):
+        """Test only the unread remainder of the file object is sent."""
+        fileobj = io.BytesIO(b"headerPAYLOAD")
+        fileobj.read(6)
+        body = MultipartStream({}, "file", "a.txt", fileobj)
+
+        assert parse_form(body, body.read())["file"][2] == b"PAYLOAD"
+
+    def test_requests_streams_with_content_length(self):
+        """Test requests sends the body as a stream with a Content-Length."""
+        body = MultipartStream({}, "file", "a.txt", io.BytesIO(b"abc"))
+        prepared = requests.Request(
+            "POST",
+            "https://example.com/upload",
+            data=body,
+            headers={"Content-Type": body.content_type},
+        ).prepare()
+
+        assert prepared.body is body
+        assert prepared.headers["Content-Length"] == str(len(body))
+        assert prepared.headers["Content-Type"] == body.content_type
+
+    def test_async_iteration(self):
+        """Test the body can be consumed as an async iterable."""
+        body = MultipartStream({}, "file", "a.txt", io.BytesIO(b"z" * 5000))
+        body.chunk_size = 1024
+
+        async def collect():
+            return [chunk async for chunk in body]
+
+        chunks = asyncio.run(collect())
+
+        assert max(map(len, chunks)) == 1024
+        assert sum(map(len, chunks)) == len(body)
@@ -0,0 +1,218 @@
+"""Tests for parallel multipart uploads against a local stand-in API server.
+
+The stand-in implements the upload endpoints the client expects:
+``POST /scenarios/{id}/files/uploads`` to initiate, ``PUT .../parts/{n}`` per
+part, ``POST .../complete`` to commit and ``DELETE`` to abort, plus the single
+``POST /scenarios/{id}/files/upload`` fallback.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+from email import message_from_bytes
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from src.datamaker.error import DataMakerError
+from src.datamaker.retry import RetryPolicy
+from src.datamaker.routes.scenario_files import ScenarioFilesClient
+from src.datamaker.transport import Transport
+
+CONTENT = bytes(range(256)) * 100  # 25600 bytes
+
+
+class UploadAPIHandler(BaseHTTPRequestHandler):
+    """Stand-in for the DataMaker scenario file upload endpoints."""
+
+    def log_message(self, *args):
+        pass
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        body = self._body()
+        if self.path.endswith("/files/uploads"):
+            if not server.multipart:
+                return self._json(404, {"error": "Not found"})
+            request = json.loads(body)
+            server.initiated.append(request)
+            return self._json(
+                201, {"uploadId": "up-1", "partSize": request["partSize"]}
+            )
+
+        if self.path.endswith("/complete"):
+            parts = json.loads(body)["parts"]
+            numbers = [part["partNumber"] for part in parts]
+            assert numbers == sorted(server.parts)
+            for part in parts:
+                expected = hashlib.md5(server.parts[part["partNumber"]]).hexdigest()
+                assert part["etag"] == expected
+            content = b"".join(server.parts[n] for n in numbers)
+            server.files["multipart"] = content
+            return self._json(200, {"file": {"id": "file-1", "size": len(content)}})
+
+        if self.path.endswith("/files/upload"):
+            message = message_from_bytes(
+                f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body
+            )
+            for part in message.get_payload():
+                if part.get_filename():
+                    server.files["single"] = part.get_payload(decode=True)
+            return self._json(201, {"file": {"id": "file-2"}})
+
+        self._json(404, {"error": "Not found"})
+
+    def do_PUT(self):
+        server = self.server
+        number = int(re.search(r"/parts/(\d+)$", self.path).group(1))
+        body = self._body()
+        with server.lock:
+            server.part_requests.append(number)
+            failures = server.fail_parts.get(number, 0)
+            if failures:
+                server.fail_parts[number] = failures - 1
+        if failures:
+            return self._json(server.fail_status, {"error": "unavailable"})
+        with server.lock:
+            server.parts[number] = body
+        self._json(200, {"etag": hashlib.md5(body).hexdigest()})
+
+    def do_DELETE(self):
+        self.server.aborted = True
+        self._json(200, {"message": "aborted"})
+
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UploadAPIHandler)
+    server.daemon_threads = True
+    server.multipart = True
+    server.lock = threading.Lock()
+    server.initiated = []
+    server.parts = {}
+    server.part_requests = []
+    server.fail_parts = {}
+    server.fail_status = 503
+    server.files = {}
+    server.aborted = False
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_port}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def upload_file(tmp_path):
+    path = tmp_path / "orders.csv"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+def make_client(api_key, api_server):
+    transport = Transport(retry=RetryPolicy(backoff_factor=0))
+    return ScenarioFilesClient(
+        api_key=api_key, base_url=api_server.base_url, transport=transport
+    )
+
+
+class TestMultipartUpload:
+    """Test cases for upload_scenario_file_multipart."""
+
+    def test_uploads_parts_and_commits(self, api_key, api_server, upload_file):
+        """Test the file is split, uploaded concurrently and reassembled."""
+        client = make_client(api_key, api_server)
+
+        result = client.upload_scenario_file_multipart(
+            upload_file,
+            scenario_id="scn-1",
+            folder="outputs",
+            part_size=4096,
+            concurrency=3,
+        )
+
+        assert result == {"id": "file-1", "size": len(CONTENT)}
+        assert api_server.files["multipart"] == CONTENT
+        assert sorted(api_server.part_requests) == list(range(1, 8))
+        assert api_server.initiated[0] == {
+            "name": "orders.csv",
+            "folder": "outputs",
+            "size": len(CONTENT),
+            "mimeType": "text/csv",
+            "partSize": 4096,
+        }
+
+    def test_retries_failed_part_only(self, api_key, api_server, upload_file):
+        """Test a throttled part is retried without restarting the upload."""
+        api_server.fail_parts = {3: 2}
+        client = make_client(api_key, api_server)
+
+        client.upload_scenario_file_multipart(
+            upload_file, scenario_id="scn-1", part_size=4096
+        )
+
+        assert api_server.files["multipart"] == CONTENT
+        assert api_server.part_requests.count(3) == 3
+        assert api_server.part_requests.count(1) == 1
+
+    def test_aborts_when_part_keeps_failing(self, api_key, api_server, upload_file):
+        """Test a part that fails for good aborts the upload and raises."""
+        api_server.fail_parts = {2: 100}
+        api_server.fail_status = 400
+        client = make_client(api_key, api_server)
+
+        with pytest.raises(DataMakerError):
+            client.upload_scenario_file_multipart(
+                upload_file, scenario_id="scn-1", part_size=4096
+            )
+
+        assert api_server.aborted
+        assert "multipart" not in api_server.files
+
+    def test_falls_back_to_single_upload(self, api_key, api_server, upload_file):
+        """Test servers without multipart endpoints get one upload request."""
+        api_server.multipart = False
+        client = make_client(api_key, api_server)
+
+        result = client.upload_scenario_file_multipart(
+            upload_file, scenario_id="scn-1", part_size=4096
+        )
+
+        assert result == {"id": "file-2"}
+        assert api_server.files["single"] == CONTENT
+        assert api_server.part_requests == []
+
+    def test_async_upload(self, api_key, api_server, upload_file):
+        """Test the async client uploads parts concurrently on the event loop."""
+        httpx = pytest.importorskip("httpx")
+        from src.datamaker.async_main import AsyncDataMaker
+
+        async def run():
+            async with AsyncDataMaker(
+                api_key=api_key,
+                base_url=api_server.base_url,
+                retry=RetryPolicy(backoff_factor=0),
+            ) as dm:
+                return await dm.upload_scenario_file_multipart(
+                    upload_file, scenario_id="scn-1", part_size=4096, concurrency=4
+                )
+
+        api_server.fail_parts = {5: 1}
+        result = asyncio.run(run())
+
+        assert result["id"] == "file-1"
+        assert api_server.files["multipart"] == CONTENT
@@ -0,0 +1,93 @@
+"""Tests for splitting templates between local and remote generation."""
+
+import pytest
+from src.datamaker.error import DataMakerError
+from src.datamaker.planner import derived_references, plan_template
+
+LOCAL_TYPES = {"UUID", "Number", "Custom"}
+
+
+def is_local(field):
+    return field.get("type") in LOCAL_TYPES
+
+
+def derived(name, value):
+    return {"name": name, "type": "Derived", "options": {"value": value}}
+
+
+def remote_names(plan):
+    return [field["name"] for field in plan.remote]
+
+
+class TestPlanTemplate:
+    """Test cases for plan_template."""
+
+    def test_splits_cheap_and_expensive_fields(self):
+        """Test local types stay local and other types go to the API."""
+        template = {
+            "name": "people",
+            "quantity": 5,
+            "fields": [
+                {"name": "id", "type": "UUID"},
+                {"name": "first", "type": "First Name"},
+                {"name": "bio", "type": "AI", "options": {"prompt": "x"}},
+                {"name": "age", "type": "Number"},
+            ],
+        }
+
+        plan = plan_template(template, is_local)
+
+        assert plan.local == ["id", "age"]
+        assert plan.derived == []
+        assert remote_names(plan) == ["first", "bio"]
+        assert plan.remote_template(10) == {
+            "name": "people",
+            "quantity": 10,
+            "fields": plan.remote,
+        }
+
+    def test_derived_fields_resolve_after_their_dependencies(self):
+        """Test derived fields referencing fields are ordered and kept local."""
+        template = {
+            "fields": [
+                derived("login", "{{email}}-{{id}}"),
+                derived("email", "{{first}}@x.com"),
+                {"name": "first", "type": "First Name"},
+                {"name": "id", "type": "UUID"},
+            ]
+        }
+
+        plan = plan_template(template, is_local)
+
+        assert plan.derived == ["email", "login"]
+        assert plan.local == ["id"]
+        assert remote_names(plan) == ["first"]
+
+    def test_server_side_placeholders_pull_dependencies_remote(self):
+        """Test derived values the API must evaluate take their fields along."""
+        template = {
+            "fields": [
+                {"name": "n", "type": "Number"},
+                derived("code", "{{n}}"),
+                derived("employee", "EMP-{{UUID}}-{{code}}"),
+                {"name": "other", "type": "Custom"},
+            ]
+        }
+
+        plan = plan_template(template, is_local)
+
+        assert remote_names(plan) == ["n", "code", "employee"]
+        assert plan.local == ["other"]
+        assert plan.derived == []
+
+    def test_cycles_raise(self):
+        """Test derived fields referencing each other in a loop are rejected."""
+        template = {"fields": [derived("a", "{{b}}"), derived("b", "{{a}}")]}
+
+        with pytest.raises(DataMakerError, match="a -> b -> a"):
+            plan_template(template, is_local)
+
+    def test_derived_references(self):
+        """Test placeholders are parsed only from Derived string values."""
+        assert derived_references(derived("x", "{{ a }} and {{b}}")) == ["a", "b"]
+        assert derived_references({"name": "x", "type": "UUID"}) is None
@@ -0,0 +1,71 @@
+"""Tests for the shared client-side rate limiter."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+from src.datamaker.main import DataMaker
+from src.datamaker.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """Test cases for the RateLimiter class."""
+
+    def test_token_bucket_spaces_requests(self):
+        """Test requests beyond the burst wait for refilled tokens."""
+        limiter = RateLimiter(rate=50, burst=1)
+        started = time.monotonic()
+        for _ in range(5):
+            with limiter.acquire():
+                pass
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.07
+        stats = limiter.stats()
+        assert stats["requests"] == 5
+        assert stats["total_wait"] > 0
+        assert stats["in_flight"] == 0
+
+    def test_burst_is_not_throttled(self):
+        """Test requests within the burst proceed immediately."""
+        limiter = RateLimiter(rate=1, burst=3)
+        for _ in range(3):
+            with limiter.acquire():
+                pass
+        assert limiter.stats()["max_wait"] < 0.05
+        assert limiter.current_wait() > 0.5
+
+    def test_max_concurrent_is_shared_across_threads(self):
+        """Test no more than max_concurrent requests run at once."""
+        limiter = RateLimiter(max_concurrent=2)
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        def work(_):
+            with limiter.acquire():
+                with lock:
+                    state["now"] += 1
+                    state["peak"] = max(state["peak"], state["now"])
+                time.sleep(0.01)
+                with lock:
+                    state["now"] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(16)))
+
+        assert state["peak"] == 2
+        assert limiter.stats()["requests"] == 16
+
+    @patch("requests.Session.request")
+    def test_datamaker_routes_requests_through_limiter(self, mock_request, api_key):
+        """Test every route client uses the limiter configured on DataMaker."""
+        mock_request.return_value = Mock(status_code=200)
+        limiter = RateLimiter(rate=1000, max_concurrent=4)
+
+        dm = DataMaker(api_key=api_key, rate_limiter=limiter)
+        dm.get_sets()
+        dm.get_keymaps()
+
+        assert dm.rate_limiter is limiter
+        assert dm.keymaps.transport.rate_limiter is limiter
+        assert limiter.stats()["requests"] == 2
@@ -1,7 +1,16 @@
 """Tests for the route client classes."""
 
+import base64
+import gzip
+import hashlib
+import io
+import json
 import os
+import re
+import time
 import pytest
+import requests
+from email.utils import formatdate
 from unittest.mock import Mock, patch, MagicMock
 from src.datamaker.routes.base import BaseClient
 from src.datamaker.routes.generation import GenerationClient
@@ -13,8 +22,16 @@ from src.datamaker.routes.users import UsersClient
 from src.datamaker.routes.teams import TeamsClient, TeamMembersClient
 from src.datamaker.routes.sets import SetsClient
 from src.datamaker.routes.keymaps import KeyMapsClient
+from src.datamaker.routes.scenario_files import ScenarioFilesClient
+from src.datamaker.multipart import MultipartStream
+from src.datamaker.local_keymap import LocalKeyMap
 from src.datamaker.routes.custom_types import EndpointsClient
 from src.datamaker.error import DataMakerError
+from src.datamaker.transport import Transport
+from src.datamaker.cache import TTLCache
+from src.datamaker.file_cache import FileCache
+from src.datamaker.retry import RetryPolicy
+from src.datamaker.template import Template, UUIDField
 
 
 class TestBaseClient:
@@ -34,7 +51,7 @@ class TestBaseClient:
             client = BaseClient()
             assert client.api_key == api_key
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_make_request_success(self, mock_request, api_key):
         """Test successful API request."""
         mock_response = Mock()
@@ -48,7 +65,7 @@ class TestBaseClient:
         mock_request.assert_called_once()
         assert response == mock_response
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_make_request_error(self, mock_request, api_key):
         """Test API request error handling."""
         mock_response = Mock()
@@ -61,6 +78,119 @@ class TestBaseClient:
         with pytest.raises(DataMakerError):
             client._make_request("GET", "/test")
 
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("requests.Session.request")
+    def test_make_request_retries_throttled_get(
+        self, mock_request, mock_sleep, api_key
+    ):
+        """Test a 429 is retried, honoring Retry-After."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = Mock(status_code=200)
+        mock_request.side_effect = [throttled, ok]
+
+        client = BaseClient(api_key=api_key)
+        assert client._make_request("GET", "/test") is ok
+
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("requests.Session.request")
+    def test_make_request_does_not_retry_post(
+        self, mock_request, mock_sleep, api_key
+    ):
+        """Test non-idempotent requests fail fast with the status code."""
+        mock_request.return_value = Mock(
+            status_code=503, headers={}, text="Unavailable"
+        )
+
+        client = BaseClient(api_key=api_key)
+        with pytest.raises(DataMakerError) as excinfo:
+            client._make_request("POST", "/test")
+
+        assert excinfo.value.status_code == 503
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("requests.Session.request")
+    def test_make_request_retries_idempotent_post(
+        self, mock_request, mock_sleep, api_key
+    ):
+        """Test POSTs marked idempotent are retried up to max_retries."""
+        mock_request.return_value = Mock(
+            status_code=503, headers={}, text="Unavailable"
+        )
+
+        transport = Transport(retry=RetryPolicy(max_retries=2, jitter=False))
+        client = BaseClient(api_key=api_key, transport=transport)
+        with pytest.raises(DataMakerError):
+            client._make_request("POST", "/test", idempotent=True)
+
+        assert mock_request.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("requests.Session.request")
+    def test_make_request_retries_connection_errors(
+        self, mock_request, mock_sleep, api_key
+    ):
+        """Test dropped connections are retried for idempotent requests."""
+        ok = Mock(status_code=200)
+        mock_request.side_effect = [requests.ConnectionError("reset"), ok]
+
+        client = BaseClient(api_key=api_key)
+        assert client._make_request("GET", "/test") is ok
+
+    def test_retry_policy_caps_total_time(self):
+        """Test no retry is scheduled past max_elapsed."""
+        policy = RetryPolicy(max_elapsed=5.0, jitter=False)
+        started = time.monotonic()
+
+        assert policy.next_delay(0, started) == 0.5
+        assert policy.next_delay(0, started, retry_after="10") is None
+        assert policy.next_delay(3, started) is None
+
+    def test_retry_policy_transient_statuses(self):
+        """Test which failure statuses the retry policy treats as transient."""
+        policy = RetryPolicy()
+
+        assert policy.is_transient(None)
+        assert policy.is_transient(429)
+        assert policy.is_transient(500)
+        assert policy.is_transient(503)
+        assert not policy.is_transient(400)
+        assert not policy.is_transient(404)
+
+    def test_retry_after_http_date(self):
+        """Test Retry-After given as an HTTP date."""
+        when = formatdate(time.time() + 30, usegmt=True)
+        assert 25 < RetryPolicy.parse_retry_after(when) <= 30
+
+    def test_init_creates_private_transport(self, api_key):
+        """Test standalone clients get their own pooled transport."""
+        first = BaseClient(api_key=api_key)
+        second = BaseClient(api_key=api_key)
+        assert isinstance(first.transport, Transport)
+        assert first.transport is not second.transport
+
+    @patch("requests.Session.request")
+    def test_make_request_uses_shared_transport(self, mock_request, api_key):
+        """Test requests go through the transport passed to the client."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        transport = Transport(pool_maxsize=32)
+        client = GenerationClient(api_key=api_key, transport=transport)
+        client._make_request("GET", "/test")
+
+        assert client.transport is transport
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][1] == (
+            "https://api.datamaker.automators.com/test"
+        )
+
 
 class TestGenerationClient:
     """Test cases for the GenerationClient class."""
@@ -103,6 +233,237 @@ class TestGenerationClient:
         assert result == {"generated_data": "test"}
 
 
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_iter_generate_streams_rows(self, mock_make_request, api_key):
+        """Test iter_generate parses the streamed body into rows."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter(
+            [b'[{"id": 1},', b' {"id"', b": 2}]"]
+        )
+        mock_make_request.return_value = mock_response
+
+        client = GenerationClient(api_key=api_key)
+        rows = client.iter_generate({"fields": [], "quantity": 1}, quantity=2)
+
+        assert next(rows) == {"id": 1}
+        assert list(rows) == [{"id": 2}]
+        mock_make_request.assert_called_once_with(
+            "POST", "/datamaker", json={"fields": [], "quantity": 2}, stream=True
+        )
+        mock_response.close.assert_called_once()
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_columnar(self, mock_make_request, api_key):
+        """Test columnar generation fills typed columns from the stream."""
+        np = pytest.importorskip("numpy")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter(
+            [b'[{"id": "a", "qty": 1}, {"id": "b",', b' "qty": 2}]']
+        )
+        mock_make_request.return_value = mock_response
+        template = {
+            "fields": [
+                {"name": "id", "type": "UUID"},
+                {"name": "qty", "type": "Float"},
+            ]
+        }
+
+        client = GenerationClient(api_key=api_key)
+        result = client.generate(template, columnar=True)
+
+        assert len(result) == 2
+        assert result["id"].tolist() == ["a", "b"]
+        assert result["qty"].dtype == np.float64
+        assert mock_make_request.call_args.kwargs["stream"] is True
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_iter_generate_columnar_batches(self, mock_make_request, api_key):
+        """Test columnar streaming yields batches of at most batch_size rows."""
+        pytest.importorskip("numpy")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter(
+            [b"[" + b",".join(b'{"n": %d}' % i for i in range(5)) + b"]"]
+        )
+        mock_make_request.return_value = mock_response
+
+        client = GenerationClient(api_key=api_key)
+        batches = list(
+            client.iter_generate({"fields": []}, columnar=True, batch_size=2)
+        )
+
+        assert [batch["n"].tolist() for batch in batches] == [[0, 1], [2, 3], [4]]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_hybrid_sends_only_remote_fields(self, mock_make_request, api_key):
+        """Test hybrid generation requests only fields that need the server."""
+        pytest.importorskip("numpy")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter(
+            [b'[{"first": "Ada"}, {"first": "Alan"}]']
+        )
+        mock_make_request.return_value = mock_response
+        template = Template(
+            [
+                UUIDField("id"),
+                {"name": "first", "type": "First Name"},
+                {
+                    "name": "email",
+                    "type": "Derived",
+                    "options": {"value": "{{first}}@example.com"},
+                },
+            ],
+            quantity=2,
+        )
+
+        client = GenerationClient(api_key=api_key)
+        rows = client.generate_hybrid(template, seed=1)
+
+        payload = mock_make_request.call_args.kwargs["json"]
+        assert [field["name"] for field in payload["fields"]] == ["first"]
+        assert payload["quantity"] == 2
+        assert [row["email"] for row in rows] == [
+            "Ada@example.com",
+            "Alan@example.com",
+        ]
+        assert list(rows[0]) == ["id", "first", "email"]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_hybrid_fully_local(self, mock_make_request, api_key):
+        """Test templates of local field types make no request."""
+        pytest.importorskip("numpy")
+        client = GenerationClient(api_key=api_key)
+
+        result = client.generate_hybrid(Template([UUIDField("id")]), 3, columnar=True)
+
+        assert len(result) == 3
+        mock_make_request.assert_not_called()
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_bulk_columnar(self, mock_make_request, api_key):
+        """Test columnar bulk generation joins the chunks in order."""
+        pytest.importorskip("numpy")
+
+        def respond(method, endpoint, json, stream):
+            response = Mock()
+            rows = ",".join('{"n": %d}' % i for i in range(json["quantity"]))
+            response.iter_content.return_value = iter([f"[{rows}]".encode()])
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = GenerationClient(api_key=api_key)
+        result = client.generate_bulk(
+            {"fields": []}, 25, chunk_size=10, concurrency=3, columnar=True
+        )
+
+        assert len(result) == 25
+        assert result["n"].tolist()[8:12] == [8, 9, 0, 1]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_bulk_chunks_in_order(self, mock_make_request, api_key):
+        """Test bulk generation splits quantity and keeps chunk order."""
+
+        def respond(method, endpoint, json):
+            response = Mock()
+            response.json.return_value = [
+                {"n": i} for i in range(json["quantity"])
+            ]
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = GenerationClient(api_key=api_key)
+        template = {"name": "bulk", "fields": [], "quantity": 1}
+        rows = client.generate_bulk(template, 25, chunk_size=10, concurrency=3)
+
+        quantities = sorted(
+            call.kwargs["json"]["quantity"] for call in mock_make_request.call_args_list
+        )
+        assert quantities == [5, 10, 10]
+        assert len(rows) == 25
+        assert rows[:10] == [{"n": i} for i in range(10)]
+        assert rows[20:] == [{"n": i} for i in range(5)]
+        assert template["quantity"] == 1
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_bulk_retries_failed_chunk(
+        self, mock_make_request, mock_sleep, api_key
+    ):
+        """Test a failing chunk is retried without failing the run."""
+        ok = Mock()
+        ok.json.return_value = [{"n": 1}]
+        mock_make_request.side_effect = [DataMakerError("503", status_code=503), ok]
+
+        client = GenerationClient(api_key=api_key)
+        rows = client.generate_bulk({"fields": []}, 1, concurrency=1)
+
+        assert rows == [{"n": 1}]
+        assert mock_make_request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    def test_generate_bulk_chunk_retry_honors_retry_after(self, mock_sleep, api_key):
+        """Test a throttled chunk waits as long as the server's Retry-After."""
+        throttled = Mock(
+            status_code=429, headers={"Retry-After": "7"}, text="Slow down"
+        )
+        ok = Mock(status_code=200)
+        ok.json.return_value = [{"n": 1}]
+        transport = Transport()
+        transport.request = Mock(side_effect=[throttled, ok])
+
+        client = GenerationClient(api_key=api_key, transport=transport)
+        rows = client.generate_bulk({"fields": []}, 1, concurrency=1)
+
+        assert rows == [{"n": 1}]
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_bulk_gives_up_after_retries(
+        self, mock_make_request, mock_sleep, api_key
+    ):
+        """Test a chunk that keeps failing raises DataMakerError."""
+        mock_make_request.side_effect = DataMakerError("503")
+
+        client = GenerationClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="chunk 0 failed after 3 attempts"):
+            client.generate_bulk({"fields": []}, 5, retries=2)
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_bulk_retries_connection_errors(
+        self, mock_make_request, mock_sleep, api_key
+    ):
+        """Test a chunk whose connection drops is retried."""
+        ok = Mock()
+        ok.json.return_value = [{"n": 1}]
+        mock_make_request.side_effect = [requests.ConnectionError("reset"), ok]
+
+        client = GenerationClient(api_key=api_key)
+        rows = client.generate_bulk({"fields": []}, 1, concurrency=1)
+
+        assert rows == [{"n": 1}]
+        assert mock_make_request.call_count == 2
+
+    @patch("src.datamaker.routes.base.time.sleep")
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_generate_bulk_does_not_retry_client_errors(
+        self, mock_make_request, mock_sleep, api_key
+    ):
+        """Test a chunk rejected with a 4xx fails at once."""
+        mock_make_request.side_effect = DataMakerError("invalid", status_code=422)
+
+        client = GenerationClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="invalid") as excinfo:
+            client.generate_bulk({"fields": []}, 5, retries=2)
+
+        assert excinfo.value.status_code == 422
+        assert mock_make_request.call_count == 1
+        mock_sleep.assert_not_called()
+
+
 class TestTemplatesClient:
     """Test cases for the TemplatesClient class."""
 
@@ -202,6 +563,120 @@ class TestTemplatesClient:
             client.get_template_by_id("1")
 
 
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_get_template_by_id_is_cached(self, mock_make_request, api_key):
+        """Test repeated lookups of the same ID hit the API once."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "1", "name": "Template 1"}
+        mock_make_request.return_value = mock_response
+
+        client = TemplatesClient(api_key=api_key)
+        first = client.get_template_by_id("1")
+        first["quantity"] = 99
+        second = client.get_template_by_id("1")
+
+        assert mock_make_request.call_count == 1
+        assert second == {"id": "1", "name": "Template 1"}
+        assert client.template_cache.stats()["hits"] == 1
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_update_template_invalidates_cache(self, mock_make_request, api_key):
+        """Test updating a template drops its cached copy."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "1", "name": "Template 1"}
+        mock_make_request.return_value = mock_response
+
+        client = TemplatesClient(api_key=api_key)
+        client.get_template_by_id("1")
+        client.update_template("1", {"name": "Renamed"})
+        client.get_template_by_id("1")
+
+        methods = [call.args[0] for call in mock_make_request.call_args_list]
+        assert methods == ["GET", "PUT", "GET"]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_read_during_update_is_not_cached(self, mock_make_request, api_key):
+        """Test a read made while an update is in flight is dropped after it."""
+        old = {"id": "1", "name": "Old"}
+        new = {"id": "1", "name": "New"}
+        current = {"template": old}
+
+        def respond(method, endpoint, **kwargs):
+            response = Mock()
+            if method == "PUT":
+                # Another caller reads before the server applies the update
+                assert client.get_template_by_id("1") == old
+                current["template"] = new
+            response.json.return_value = current["template"]
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = TemplatesClient(api_key=api_key)
+        client.update_template("1", {"name": "New"})
+
+        assert client.get_template_by_id("1") == new
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_read_overlapping_update_is_not_cached(self, mock_make_request, api_key):
+        """Test a read that started before an update does not cache its result."""
+        old = {"id": "1", "name": "Old"}
+        new = {"id": "1", "name": "New"}
+        current = {"template": old}
+
+        def respond(method, endpoint, **kwargs):
+            response = Mock()
+            response.json.return_value = current["template"]
+            if method == "GET" and current["template"] is old:
+                # The template is updated while this read is in flight
+                current["template"] = new
+                client.update_template("1", {"name": "New"})
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = TemplatesClient(api_key=api_key)
+
+        assert client.get_template_by_id("1") == old
+        assert client.get_template_by_id("1") == new
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_get_template_by_id_fallback_reuses_index(
+        self, mock_make_request, api_key
+    ):
+        """Test the fallback listing is downloaded once and indexed by ID."""
+        listing = Mock()
+        listing.json.return_value = [
+            {"id": "1", "name": "Template 1"},
+            {"id": "2", "name": "Template 2"},
+        ]
+        mock_make_request.side_effect = [
+            DataMakerError("Not found"),
+            listing,
+            DataMakerError("Not found"),
+        ]
+
+        client = TemplatesClient(api_key=api_key)
+        assert client.get_template_by_id("1")["name"] == "Template 1"
+        assert client.get_template_by_id("2")["name"] == "Template 2"
+
+        endpoints = [call.args[1] for call in mock_make_request.call_args_list]
+        assert endpoints == ["/templates/1", "/templates", "/templates/2"]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_template_cache_can_be_disabled(self, mock_make_request, api_key):
+        """Test a zero-size cache fetches on every call."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "1"}
+        mock_make_request.return_value = mock_response
+
+        client = TemplatesClient(api_key=api_key, template_cache=TTLCache(maxsize=0))
+        client.get_template_by_id("1")
+        client.get_template_by_id("1")
+
+        assert mock_make_request.call_count == 2
+
+
 class TestApiKeysClient:
     """Test cases for the ApiKeysClient class."""
 
@@ -667,6 +1142,271 @@ class TestSetsClient:
         mock_make_request.assert_called_once_with("POST", "/sets", json=expected_data)
         assert result["rowCount"] == 1
 
+    @staticmethod
+    def _paged_sets_api(pages_supported=True, fail_page=None):
+        """A ``_make_request`` stand-in for the paged set endpoints."""
+        calls = []
+
+        def make_request(method, endpoint, **kwargs):
+            calls.append((method, endpoint, kwargs))
+            body = {}
+            if method == "POST":
+                body = {"id": "set-1", "name": kwargs["json"]["name"]}
+            elif method == "PUT":
+                if not pages_supported:
+                    raise DataMakerError("Not found", status_code=404)
+                if endpoint.endswith(f"/pages/{fail_page}"):
+                    raise DataMakerError("Bad page", status_code=400)
+            elif method == "PATCH":
+                body = {"id": "set-1", **kwargs["json"]}
+            return Mock(json=Mock(return_value=body))
+
+        return make_request, calls
+
+    def test_save_set_stream_uploads_compressed_pages(self, api_key):
+        """Test rows are paged, gzip-compressed and counted as they upload."""
+        make_request, calls = self._paged_sets_api()
+        client = SetsClient(api_key=api_key)
+        rows = ({"n": i} for i in range(12))
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            result = client.save_set_stream("big", rows, page_size=5, concurrency=2)
+
+        assert result == {"id": "set-1", "rowCount": 12}
+        puts = [call for call in calls if call[0] == "PUT"]
+        assert [call[1] for call in puts] == [
+            "/sets/set-1/pages/1",
+            "/sets/set-1/pages/2",
+            "/sets/set-1/pages/3",
+        ]
+        assert puts[0][2]["headers"]["Content-Encoding"] == "gzip"
+        pages = [json.loads(gzip.decompress(call[2]["data"]))["rows"] for call in puts]
+        assert [row["n"] for page in pages for row in page] == list(range(12))
+
+    def test_save_set_stream_falls_back_to_full_update(self, api_key):
+        """Test servers without page endpoints get one replacement update."""
+        make_request, calls = self._paged_sets_api(pages_supported=False)
+        client = SetsClient(api_key=api_key)
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            result = client.save_set_stream(
+                "big", iter([{"n": 1}, {"n": 2}]), page_size=1
+            )
+
+        assert result["rowCount"] == 2
+        assert calls[-1][:2] == ("PATCH", "/sets/set-1")
+        assert calls[-1][2]["json"]["data"] == [{"n": 1}, {"n": 2}]
+
+    def test_save_set_stream_discards_partial_set(self, api_key):
+        """Test a page that fails for good deletes the half-saved set."""
+        make_request, calls = self._paged_sets_api(fail_page=2)
+        client = SetsClient(api_key=api_key)
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            with pytest.raises(DataMakerError, match="Bad page"):
+                client.save_set_stream(
+                    "big", [{"n": i} for i in range(10)], page_size=3
+                )
+
+        assert calls[-1][:2] == ("DELETE", "/sets/set-1")
+
+    def test_iter_set_rows_prefetches_pages(self, api_key):
+        """Test pages after the first are fetched and yielded in order."""
+
+        def make_request(method, endpoint):
+            page = int(endpoint.split("page=")[1].split("&")[0])
+            rows = [{"n": n} for n in range((page - 1) * 5, min(page * 5, 12))]
+            body = {"rows": rows, "total": 12, "page": page, "pageSize": 5}
+            return Mock(json=Mock(return_value=body))
+
+        client = SetsClient(api_key=api_key)
+        with patch.object(client, "_make_request", side_effect=make_request) as mock:
+            rows = list(client.iter_set_rows("set-1", page_size=5, concurrency=2))
+
+        assert [row["n"] for row in rows] == list(range(12))
+        assert mock.call_count == 3
+
+    def test_columnar_set_reads(self, api_key):
+        """Test columnar iteration yields one ColumnarResult per page."""
+        np = pytest.importorskip("numpy")
+
+        def make_request(method, endpoint):
+            if "/rows" in endpoint:
+                page = int(endpoint.split("page=")[1].split("&")[0])
+                rows = [{"n": n} for n in range((page - 1) * 5, min(page * 5, 7))]
+                body = {"rows": rows, "total": 7, "page": page, "pageSize": 5}
+            else:
+                body = {"id": "set-1", "data": [{"n": 1}, {"n": 2}]}
+            return Mock(json=Mock(return_value=body))
+
+        client = SetsClient(api_key=api_key)
+        with patch.object(client, "_make_request", side_effect=make_request):
+            pages = list(client.iter_set_rows("set-1", page_size=5, columnar=True))
+            result = client.get_set("set-1", columnar=True)
+
+        assert [len(page) for page in pages] == [5, 2]
+        assert pages[1]["n"].tolist() == [5, 6]
+        assert pages[0]["n"].dtype == np.int64
+        assert result["id"] == "set-1"
+        assert result["data"]["n"].tolist() == [1, 2]
+
+    @staticmethod
+    def _row_delta_api(rows, deltas_supported=True):
+        """A ``_make_request`` stand-in for a set with row delta endpoints."""
+        calls = []
+
+        def make_request(method, endpoint, **kwargs):
+            calls.append((method, endpoint, kwargs))
+            if endpoint.endswith("/rows"):
+                if not deltas_supported:
+                    raise DataMakerError("Method not allowed", status_code=405)
+                return Mock(json=Mock(return_value={"id": "set-1"}))
+            if method == "GET":
+                return Mock(json=Mock(return_value={"id": "set-1", "data": rows}))
+            return Mock(json=Mock(return_value={"id": "set-1", **kwargs["json"]}))
+
+        return make_request, calls
+
+    def test_append_set_rows_sends_only_new_rows(self, api_key):
+        """Test appends POST just the new rows, compressed and not retried."""
+        make_request, calls = self._row_delta_api([])
+        client = SetsClient(api_key=api_key)
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            client.append_set_rows("set-1", [{"id": 3}])
+
+        method, endpoint, kwargs = calls[0]
+        assert (method, endpoint) == ("POST", "/sets/set-1/rows")
+        assert json.loads(gzip.decompress(kwargs["data"])) == {"rows": [{"id": 3}]}
+        assert kwargs["idempotent"] is False
+
+    def test_patch_set_rows_sends_delta(self, api_key):
+        """Test patches send upserts and deletes by key as an idempotent PATCH."""
+        make_request, calls = self._row_delta_api([])
+        client = SetsClient(api_key=api_key)
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            client.patch_set_rows(
+                "set-1", upserts=[{"sku": "A", "qty": 2}], deletes=["B"], key="sku"
+            )
+
+        method, endpoint, kwargs = calls[0]
+        assert (method, endpoint) == ("PATCH", "/sets/set-1/rows")
+        assert json.loads(gzip.decompress(kwargs["data"])) == {
+            "key": "sku",
+            "upserts": [{"sku": "A", "qty": 2}],
+            "deletes": ["B"],
+        }
+        assert kwargs["idempotent"] is True
+
+    def test_patch_set_rows_falls_back_to_local_diff(self, api_key):
+        """Test servers without deltas get the locally patched rows."""
+        current = [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}, {"id": 3, "v": "c"}]
+        make_request, calls = self._row_delta_api(current, deltas_supported=False)
+        client = SetsClient(api_key=api_key, set_cache=TTLCache(maxsize=4))
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            result = client.patch_set_rows(
+                "set-1", upserts=[{"id": 2, "v": "B"}, {"id": 4, "v": "d"}], deletes=[1]
+            )
+            client.append_set_rows("set-1", [{"id": 5, "v": "e"}])
+
+        assert result["data"] == [
+            {"id": 2, "v": "B"},
+            {"id": 3, "v": "c"},
+            {"id": 4, "v": "d"},
+        ]
+        assert result["rowCount"] == 3
+        # The delta endpoint is tried once and the set fetched once
+        assert [call[:2] for call in calls] == [
+            ("PATCH", "/sets/set-1/rows"),
+            ("GET", "/sets/set-1"),
+            ("PATCH", "/sets/set-1"),
+            ("PATCH", "/sets/set-1"),
+        ]
+        assert [row["id"] for row in calls[-1][2]["json"]["data"]] == [2, 3, 4, 5]
+
+    @pytest.mark.parametrize(
+        "body", ["Not found", "Cannot PATCH /sets/set-1/rows", '{"error":"Not Found"}']
+    )
+    def test_patch_set_rows_route_404_falls_back(self, api_key, body):
+        """Test a 404 from a server without the delta route is a fallback."""
+        make_request, calls = self._row_delta_api([{"id": 1}])
+
+        def route_missing(method, endpoint, **kwargs):
+            if endpoint.endswith("/rows"):
+                calls.append((method, endpoint, kwargs))
+                raise DataMakerError(f"API request failed: {body}", status_code=404)
+            return make_request(method, endpoint, **kwargs)
+
+        client = SetsClient(api_key=api_key)
+        with patch.object(client, "_make_request", side_effect=route_missing):
+            result = client.patch_set_rows("set-1", upserts=[{"id": 2}])
+
+        assert result["data"] == [{"id": 1}, {"id": 2}]
+        assert client._row_deltas_supported is False
+
+    @pytest.mark.parametrize(
+        "body", ['{"error":"Set not found"}', "Set set-1 does not exist"]
+    )
+    def test_patch_set_rows_missing_set_is_raised(self, api_key, body):
+        """Test a 404 for a missing set is raised instead of falling back."""
+        calls = []
+
+        def make_request(method, endpoint, **kwargs):
+            calls.append((method, endpoint))
+            raise DataMakerError(f"API request failed: {body}", status_code=404)
+
+        client = SetsClient(api_key=api_key)
+        with patch.object(client, "_make_request", side_effect=make_request):
+            with pytest.raises(DataMakerError) as excinfo:
+                client.append_set_rows("set-1", [{"id": 3}])
+
+        assert excinfo.value.status_code == 404
+        assert calls == [("POST", "/sets/set-1/rows")]
+        assert client._row_deltas_supported is True
+
+    def test_patch_set_rows_skips_no_op_replacement(self, api_key):
+        """Test a patch that changes nothing sends no replacement."""
+        make_request, calls = self._row_delta_api(
+            [{"id": 1, "v": "a"}], deltas_supported=False
+        )
+        client = SetsClient(api_key=api_key)
+
+        with patch.object(client, "_make_request", side_effect=make_request):
+            result = client.patch_set_rows(
+                "set-1", upserts=[{"id": 1, "v": "a"}], deletes=[99]
+            )
+
+        assert result == {"id": "set-1", "changed": False}
+        assert ("PATCH", "/sets/set-1") not in [call[:2] for call in calls]
+
+    def test_empty_deltas_send_nothing(self, api_key):
+        """Test empty appends and patches return without a request."""
+        client = SetsClient(api_key=api_key)
+        with patch.object(client, "_make_request") as mock_make_request:
+            assert client.append_set_rows("set-1", [])["changed"] is False
+            assert client.patch_set_rows("set-1")["changed"] is False
+        mock_make_request.assert_not_called()
+
+    def test_patch_set_rows_requires_key(self, api_key):
+        """Test upserted rows without the key field are rejected."""
+        client = SetsClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="'id'"):
+            client.patch_set_rows("set-1", upserts=[{"v": 1}])
+
+    def test_iter_set_rows_falls_back_to_get_set(self, api_key):
+        """Test servers without paged reads are read through get_set."""
+
+        def make_request(method, endpoint):
+            if "/rows" in endpoint:
+                raise DataMakerError("Not found", status_code=404)
+            return Mock(json=Mock(return_value={"id": "set-1", "data": [{"n": 1}]}))
+
+        client = SetsClient(api_key=api_key)
+        with patch.object(client, "_make_request", side_effect=make_request):
+            assert list(client.iter_set_rows("set-1")) == [{"n": 1}]
+
 
 class TestEndpointsClient:
     """Test cases for the EndpointsClient class."""
@@ -743,6 +1483,7 @@ class TestKeyMapsClient:
                 "runId": "run-1",
                 "projectId": "proj-1",
             },
+            idempotent=True,
         )
         assert result["upserted"] == 2
 
@@ -754,6 +1495,75 @@ class TestKeyMapsClient:
             client.keymap_put("m1", "Material", {})
         mock_make_request.assert_not_called()
 
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_keymap_put_bulk_batches_generator(self, mock_make_request, api_key):
+        """Test bulk put pages a generator into capped batches."""
+
+        def respond(method, endpoint, json, idempotent):
+            response = Mock()
+            response.json.return_value = {"upserted": len(json["entries"])}
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = KeyMapsClient(api_key=api_key)
+        pairs = ((f"OLD-{i}", f"NEW-{i}") for i in range(12))
+        result = client.keymap_put_bulk(
+            "m1", "Material", pairs, batch_size=5, concurrency=3, run_id="run-1"
+        )
+
+        sizes = sorted(
+            len(call.kwargs["json"]["entries"])
+            for call in mock_make_request.call_args_list
+        )
+        assert sizes == [2, 5, 5]
+        assert result == {
+            "mapName": "m1",
+            "object": "Material",
+            "upserted": 12,
+            "batches": 3,
+            "failed": [],
+        }
+        assert all(
+            call.kwargs["json"]["runId"] == "run-1"
+            for call in mock_make_request.call_args_list
+        )
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_keymap_put_bulk_reports_failed_batches(
+        self, mock_make_request, api_key
+    ):
+        """Test a failed batch is reported while the others are written."""
+
+        def respond(method, endpoint, json, idempotent):
+            if json["entries"][0]["oldKey"] == "OLD-2":
+                raise DataMakerError("API request failed: boom", status_code=500)
+            response = Mock()
+            response.json.return_value = {"upserted": len(json["entries"])}
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = KeyMapsClient(api_key=api_key)
+        entries = {f"OLD-{i}": f"NEW-{i}" for i in range(6)}
+        result = client.keymap_put_bulk("m1", "Material", entries, batch_size=2)
+
+        assert result["upserted"] == 4
+        assert result["batches"] == 3
+        assert result["failed"] == [
+            {
+                "batch": 1,
+                "entries": {"OLD-2": "NEW-2", "OLD-3": "NEW-3"},
+                "error": "API request failed: boom",
+            }
+        ]
+
+    def test_keymap_put_bulk_rejects_oversized_batches(self, api_key):
+        """Test batch_size cannot exceed the server cap."""
+        client = KeyMapsClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="batch_size"):
+            client.keymap_put_bulk("m1", "Material", {}, batch_size=5001)
+
     @patch("src.datamaker.routes.base.BaseClient._make_request")
     def test_keymap_lookup(self, mock_make_request, api_key):
         """Test batch key lookup returns mappings and missing keys."""
@@ -780,10 +1590,122 @@ class TestKeyMapsClient:
                 "oldKeys": ["MAT-001", "MAT-999"],
                 "projectId": "proj-1",
             },
+            idempotent=True,
         )
         assert result["mappings"] == {"MAT-001": "700001"}
         assert result["missing"] == ["MAT-999"]
 
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_keymap_lookup_reads_through_cache(self, mock_make_request, api_key):
+        """Test cached keys are served locally and only misses are fetched."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "mappings": {"MAT-001": "700001"},
+            "missing": ["MAT-999"],
+        }
+        mock_make_request.return_value = mock_response
+
+        client = KeyMapsClient(
+            api_key=api_key, lookup_cache=TTLCache(maxsize=100), missing_ttl=60
+        )
+        client.keymap_lookup("m1", "Material", ["MAT-001", "MAT-999"])
+        mock_response.json.return_value = {
+            "mappings": {"MAT-002": "700002"},
+            "missing": [],
+        }
+        result = client.keymap_lookup(
+            "m1", "Material", ["MAT-001", "MAT-002", "MAT-999"]
+        )
+
+        assert mock_make_request.call_count == 2
+        assert mock_make_request.call_args.kwargs["json"]["oldKeys"] == ["MAT-002"]
+        assert result["mappings"] == {"MAT-001": "700001", "MAT-002": "700002"}
+        assert result["missing"] == ["MAT-999"]
+        assert client.lookup_cache.stats()["hits"] == 2
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_keymap_lookup_cache_scoped_and_missing_not_cached_by_default(
+        self, mock_make_request, api_key
+    ):
+        """Test cache keys include the object and missing keys are refetched."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"mappings": {"K": "N"}, "missing": ["X"]}
+        mock_make_request.return_value = mock_response
+
+        client = KeyMapsClient(api_key=api_key, lookup_cache=TTLCache(maxsize=100))
+        client.keymap_lookup("m1", "Material", ["K", "X"])
+        client.keymap_lookup("m1", "Material", ["K", "X"])
+        client.keymap_lookup("m1", "Customer", ["K"])
+
+        sent = [c.kwargs["json"]["oldKeys"] for c in mock_make_request.call_args_list]
+        assert sent == [["K", "X"], ["X"], ["K"]]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_keymap_put_writes_through_and_delete_clears(
+        self, mock_make_request, api_key
+    ):
+        """Test puts populate the lookup cache and deleting a map clears it."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"upserted": 1}
+        mock_make_request.return_value = mock_response
+
+        client = KeyMapsClient(api_key=api_key, lookup_cache=TTLCache(maxsize=100))
+        client.keymap_put("m1", "Material", {"MAT-001": "700001"})
+        result = client.keymap_lookup("m1", "Material", ["MAT-001"])
+
+        assert mock_make_request.call_count == 1
+        assert result == {"mappings": {"MAT-001": "700001"}, "missing": []}
+
+        client.delete_keymap("m1")
+        assert len(client.lookup_cache) == 0
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_keymap_lookup_bulk_dedupes_and_merges(
+        self, mock_make_request, api_key
+    ):
+        """Test bulk lookup de-duplicates keys, batches them and merges."""
+        known = {"K1": "N1", "K3": "N3", "K4": "N4"}
+
+        def respond(method, endpoint, json, idempotent):
+            keys = json["oldKeys"]
+            response = Mock()
+            response.json.return_value = {
+                "mappings": {k: known[k] for k in keys if k in known},
+                "missing": [k for k in keys if k not in known],
+            }
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = KeyMapsClient(api_key=api_key)
+        keys = iter(["K1", "K2", "K1", "K3", "K4", "K2", "K5"])
+        result = client.keymap_lookup_bulk(
+            "m1", "Material", keys, batch_size=2, concurrency=2
+        )
+
+        sent = [call.kwargs["json"]["oldKeys"] for call in mock_make_request.call_args_list]
+        assert sorted(sent) == [["K1", "K2"], ["K3", "K4"], ["K5"]]
+        assert result["mappings"] == known
+        assert result["missing"] == ["K2", "K5"]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_iter_keymap_lookup_yields_batches(self, mock_make_request, api_key):
+        """Test the streaming variant yields one result per batch in order."""
+
+        def respond(method, endpoint, json, idempotent):
+            response = Mock()
+            response.json.return_value = {"mappings": {}, "missing": json["oldKeys"]}
+            return response
+
+        mock_make_request.side_effect = respond
+
+        client = KeyMapsClient(api_key=api_key)
+        results = list(
+            client.iter_keymap_lookup("m1", "Material", ["a", "b", "c"], batch_size=2)
+        )
+
+        assert [r["missing"] for r in results] == [["a", "b"], ["c"]]
+
     @patch("src.datamaker.routes.base.BaseClient._make_request")
     def test_get_keymap_entries(self, mock_make_request, api_key):
         """Test paginated entry inspection with an object filter."""
@@ -808,6 +1730,83 @@ class TestKeyMapsClient:
         )
         assert result["total"] == 1
 
+    @staticmethod
+    def _paged_entries(total):
+        """A _make_request stand-in serving ``total`` entries page by page."""
+
+        def respond(method, endpoint):
+            query = dict(p.split("=") for p in endpoint.split("?")[1].split("&"))
+            page, size = int(query["page"]), int(query["pageSize"])
+            start = (page - 1) * size
+            response = Mock()
+            response.json.return_value = {
+                "page": page,
+                "pageSize": size,
+                "total": total,
+                "entries": [
+                    {"object": "Material", "oldKey": f"K{i}", "newKey": f"N{i}"}
+                    for i in range(start, min(start + size, total))
+                ],
+            }
+            return response
+
+        return respond
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_iter_keymap_entries_fetches_all_pages_in_order(
+        self, mock_make_request, api_key
+    ):
+        """Test every page is fetched once and entries come out in order."""
+        mock_make_request.side_effect = self._paged_entries(23)
+
+        client = KeyMapsClient(api_key=api_key)
+        entries = list(
+            client.iter_keymap_entries("m1", page_size=5, concurrency=3)
+        )
+
+        assert [e["oldKey"] for e in entries] == [f"K{i}" for i in range(23)]
+        assert mock_make_request.call_count == 5
+
+    def test_iter_keymap_entries_rejects_page_size(self, api_key):
+        """Test page sizes above the server cap are rejected."""
+        client = KeyMapsClient(api_key=api_key)
+        with pytest.raises(DataMakerError):
+            list(client.iter_keymap_entries("m1", page_size=501))
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_export_keymap_writes_sqlite_snapshot(
+        self, mock_make_request, api_key, tmp_path
+    ):
+        """Test the export streams all entries into a SQLite file."""
+        mock_make_request.side_effect = self._paged_entries(1200)
+        path = tmp_path / "m1.sqlite"
+
+        client = KeyMapsClient(api_key=api_key)
+        result = client.export_keymap("m1", str(path))
+
+        assert result == {"mapName": "m1", "path": str(path), "entries": 1200}
+        with LocalKeyMap(str(path)) as keymap:
+            assert len(keymap) == 1200
+            assert keymap.get("K777", object="Material") == "N777"
+            assert keymap.meta == {"mapName": "m1", "entryCount": "1200"}
+        assert not (tmp_path / "m1.sqlite.partial").exists()
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_export_keymap_keeps_existing_file_on_failure(
+        self, mock_make_request, api_key, tmp_path
+    ):
+        """Test a failed export leaves no partial file behind."""
+        mock_make_request.side_effect = DataMakerError("boom", status_code=500)
+        path = tmp_path / "m1.sqlite"
+        path.write_bytes(b"previous")
+
+        client = KeyMapsClient(api_key=api_key)
+        with pytest.raises(DataMakerError):
+            client.export_keymap("m1", str(path))
+
+        assert path.read_bytes() == b"previous"
+        assert not (tmp_path / "m1.sqlite.partial").exists()
+
     @patch("src.datamaker.routes.base.BaseClient._make_request")
     def test_delete_keymap(self, mock_make_request, api_key):
         """Test dropping a key map scoped to one object type."""
@@ -822,3 +1821,420 @@ class TestKeyMapsClient:
             "DELETE", "/keymaps/m1?object=Material&projectId=proj-1"
         )
         assert result["deleted"] == 5
+
+
+class TestScenarioFilesClient:
+    """Test cases for the ScenarioFilesClient class."""
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_create_scenario_file_streams_multipart(self, mock_make_request, api_key):
+        """Test content is sent as a streaming multipart upload, not base64 JSON."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"file": {"id": "file-1"}}
+        mock_make_request.return_value = mock_response
+
+        client = ScenarioFilesClient(api_key=api_key)
+        result = client.create_scenario_file(
+            "data.json", io.BytesIO(b'{"a": 1}'), scenario_id="scn-1", team_id="t-1"
+        )
+
+        assert result == {"id": "file-1"}
+        args, kwargs = mock_make_request.call_args
+        assert args == ("POST", "/scenarios/scn-1/files/upload")
+        body = kwargs["data"]
+        assert isinstance(body, MultipartStream)
+        assert kwargs["headers"] == {"Content-Type": body.content_type}
+        assert kwargs["idempotent"] is False
+        encoded = body.read()
+        assert b'filename="data.json"' in encoded
+        assert b"Content-Type: application/json" in encoded
+        assert b'{"a": 1}' in encoded
+        assert b"t-1" in encoded
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_create_scenario_file_from_read_only_object(
+        self, mock_make_request, api_key
+    ):
+        """Test a file-like with only ``read()`` is buffered, not rejected."""
+
+        class Reader:
+            def read(self):
+                return b"streamed"
+
+        mock_make_request.return_value.json.return_value = {"file": {"id": "f-1"}}
+
+        client = ScenarioFilesClient(api_key=api_key)
+        client.create_scenario_file("a.bin", Reader(), scenario_id="scn-1")
+
+        encoded = mock_make_request.call_args.kwargs["data"].read()
+        assert b"\r\n\r\nstreamed\r\n" in encoded
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_create_scenario_file_multipart_fields(self, mock_make_request, api_key):
+        """Test only the fields the upload endpoint stores are sent to it."""
+        mock_make_request.return_value.json.return_value = {"file": {"id": "f-1"}}
+
+        client = ScenarioFilesClient(api_key=api_key)
+        with patch.dict("os.environ", {}, clear=True):
+            client.create_scenario_file(
+                "a.txt", "hello", scenario_id="scn-1", project_id="p-1"
+            )
+
+        encoded = mock_make_request.call_args.kwargs["data"].read()
+        fields = re.findall(rb'name="(\w+)"', encoded)
+        assert fields == [b"folder", b"projectId", b"file"]
+
+    @patch("src.datamaker.routes.base.BaseClient._make_request")
+    def test_create_scenario_file_with_description_uses_json(
+        self, mock_make_request, api_key
+    ):
+        """Test description and folder_id reach the server via the JSON endpoint."""
+        mock_make_request.return_value.json.return_value = {"id": "file-1"}
+
+        client = ScenarioFilesClient(api_key=api_key)
+        with patch.dict("os.environ", {}, clear=True):
+            result = client.create_scenario_file(
+                "a.txt",
+                io.BytesIO(b"hello"),
+                scenario_id="scn-1",
+                team_id="t-1",
+                description="Greeting",
+                folder_id="folder-1",
+            )
+
+        assert result == {"id": "file-1"}
+        mock_make_request.assert_called_once_with(
+            "POST",
+            "/scenario-files",
+            json={
+                "name": "a.txt",
+                "content": base64.b64encode(b"hello").decode(),
+                "scenarioId": "scn-1",
+                "teamId": "t-1",
+                "mimeType": "text/plain",
+                "size": 5,
+                "description": "Greeting",
+                "folderId": "folder-1",
+            },
+        )
+
+    def test_create_scenario_file_with_folder_id_requires_team_id(self, api_key):
+        """Test the JSON create path still requires a team ID."""
+        client = ScenarioFilesClient(api_key=api_key)
+        with patch.dict("os.environ", {}, clear=True):
+            with pytest.raises(DataMakerError, match="team_id"):
+                client.create_scenario_file(
+                    "a.txt", "hello", scenario_id="scn-1", folder_id="folder-1"
+                )
+
+    def test_create_scenario_file_requires_scenario_id(self, api_key):
+        """Test a missing scenario ID raises before any request."""
+        client = ScenarioFilesClient(api_key=api_key)
+        with patch.dict("os.environ", {}, clear=True):
+            with pytest.raises(DataMakerError):
+                client.create_scenario_file("a.txt", "hello")
+
+    @patch("requests.Session.request")
+    def test_upload_sends_multipart_content_type(self, mock_request, api_key, tmp_path):
+        """Test the JSON default Content-Type does not override the boundary."""
+        mock_request.return_value = Mock(
+            status_code=201, json=Mock(return_value={"file": {"id": "file-1"}})
+        )
+        path = tmp_path / "report.csv"
+        path.write_text("a,b\n1,2\n")
+
+        client = ScenarioFilesClient(api_key=api_key)
+        client.upload_scenario_file_from_path(str(path), scenario_id="scn-1")
+
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert headers["X-API-Key"] == api_key
+
+    @staticmethod
+    def _download_responses(content, chunk=4, headers=None):
+        """Session.request side effect: file metadata, then the download."""
+        metadata = Mock(status_code=200)
+        metadata.json.return_value = {"presignedUrl": "https://storage/f1?sig=x"}
+        download = Mock(status_code=200)
+        download.headers = (
+            headers if headers is not None else {"Content-Length": str(len(content))}
+        )
+        download.iter_content.return_value = [
+            content[i : i + chunk] for i in range(0, len(content), chunk)
+        ]
+        return [metadata, download]
+
+    @patch("requests.Session.request")
+    def test_download_to_path_streams_chunks(self, mock_request, api_key, tmp_path):
+        """Test the download is streamed with a read timeout and progress."""
+        mock_request.side_effect = self._download_responses(b"0123456789")
+        destination = tmp_path / "out.bin"
+        progress = []
+
+        client = ScenarioFilesClient(api_key=api_key)
+        result = client.download_scenario_file_to_path(
+            "f1",
+            str(destination),
+            scenario_id="scn-1",
+            chunk_size=4,
+            progress=lambda done, total: progress.append((done, total)),
+            timeout=(5, 20),
+        )
+
+        assert result == str(destination)
+        assert destination.read_bytes() == b"0123456789"
+        assert progress == [(4, 10), (8, 10), (10, 10)]
+        download_call = mock_request.call_args_list[1]
+        assert download_call.args == ("GET", "https://storage/f1?sig=x")
+        assert download_call.kwargs == {"stream": True, "timeout": (5, 20)}
+        assert not (tmp_path / "out.bin.part").exists()
+
+    @patch("requests.Session.request")
+    def test_download_to_path_truncated_keeps_destination(
+        self, mock_request, api_key, tmp_path
+    ):
+        """Test a short download raises and never replaces the destination."""
+        mock_request.side_effect = self._download_responses(
+            b"01234", headers={"Content-Length": "10"}
+        )
+        destination = tmp_path / "out.bin"
+        destination.write_bytes(b"previous")
+
+        client = ScenarioFilesClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="incomplete"):
+            client.download_scenario_file_to_path(
+                "f1", str(destination), scenario_id="scn-1"
+            )
+
+        assert destination.read_bytes() == b"previous"
+        assert not (tmp_path / "out.bin.part").exists()
+
+
+    def test_save_directory_skips_unchanged(self, api_key, tmp_path):
+        """Test only new or changed files are uploaded, concurrently."""
+        (tmp_path / "same.csv").write_bytes(b"a,b\n1,2\n")
+        (tmp_path / "changed.csv").write_bytes(b"a,b\n3,4\n")
+        (tmp_path / "new.csv").write_bytes(b"a\n")
+        (tmp_path / "notes.txt").write_bytes(b"skip me")
+        listing = {
+            "files": [
+                {
+                    "id": "f1",
+                    "name": "same.csv",
+                    "size": 8,
+                    "md5": hashlib.md5(b"a,b\n1,2\n").hexdigest(),
+                },
+                {"id": "f2", "name": "changed.csv", "size": 8, "md5": "0" * 32},
+            ]
+        }
+        client = ScenarioFilesClient(api_key=api_key)
+
+        upload = Mock(side_effect=lambda path, scenario_id, name, folder: {"name": name})
+        with patch.multiple(
+            client,
+            get_scenario_files=Mock(return_value=listing),
+            upload_scenario_file_from_path=upload,
+        ):
+            result = client.save_directory(
+                str(tmp_path), scenario_id="scn-1", include="*.csv", concurrency=2
+            )
+
+        assert result == {
+            "uploaded": [{"name": "changed.csv"}, {"name": "new.csv"}],
+            "skipped": ["same.csv"],
+        }
+        assert upload.call_args.kwargs["folder"] == "outputs"
+
+    def test_save_directory_missing_dir(self, api_key, tmp_path):
+        """Test a missing local directory raises before any request."""
+        client = ScenarioFilesClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="Directory not found"):
+            client.save_directory(str(tmp_path / "nope"), scenario_id="scn-1")
+
+    def test_download_folder_skips_matching_files(self, api_key, tmp_path):
+        """Test files already present with the same size and MD5 are not fetched."""
+        (tmp_path / "same.csv").write_bytes(b"12345")
+        listing = {
+            "files": [
+                {
+                    "id": "f1",
+                    "name": "same.csv",
+                    "size": 5,
+                    "etag": f'"{hashlib.md5(b"12345").hexdigest()}"',
+                },
+                {"id": "f2", "name": "sub/new.csv", "size": 3},
+            ]
+        }
+        client = ScenarioFilesClient(api_key=api_key)
+
+        download = Mock(side_effect=lambda file_id, path, scenario_id: path)
+        with patch.multiple(
+            client,
+            get_scenario_files=Mock(return_value=listing),
+            download_scenario_file_to_path=download,
+        ):
+            result = client.download_folder(str(tmp_path), scenario_id="scn-1")
+
+        new_path = str(tmp_path / "sub" / "new.csv")
+        assert result == {
+            "downloaded": [new_path],
+            "skipped": [str(tmp_path / "same.csv")],
+        }
+        download.assert_called_once_with("f2", new_path, "scn-1")
+        assert (tmp_path / "sub").is_dir()
+
+    @pytest.mark.parametrize(
+        "checksum",
+        [{}, {"etag": f'"{hashlib.md5(b"12345").hexdigest()}-2"'}],
+        ids=["no-checksum", "multipart-etag"],
+    )
+    def test_transfers_without_md5_are_not_skipped(self, api_key, tmp_path, checksum):
+        """Test same-size files listed without a real MD5 are transferred."""
+        local = tmp_path / "local"
+        local.mkdir()
+        (local / "data.csv").write_bytes(b"12345")
+        listing = {"files": [{"id": "f1", "name": "data.csv", "size": 5, **checksum}]}
+        client = ScenarioFilesClient(api_key=api_key)
+
+        upload = Mock(side_effect=lambda path, scenario_id, name, folder: {"name": name})
+        download = Mock(side_effect=lambda file_id, path, scenario_id: path)
+        with patch.multiple(
+            client,
+            get_scenario_files=Mock(return_value=listing),
+            upload_scenario_file_from_path=upload,
+            download_scenario_file_to_path=download,
+        ):
+            saved = client.save_directory(str(local), scenario_id="scn-1")
+            fetched = client.download_folder(str(local), scenario_id="scn-1")
+
+        assert saved == {"uploaded": [{"name": "data.csv"}], "skipped": []}
+        assert fetched == {"downloaded": [str(local / "data.csv")], "skipped": []}
+
+    def test_download_folder_rejects_escaping_names(self, api_key, tmp_path):
+        """Test remote names cannot write outside the destination."""
+        listing = {"files": [{"id": "f1", "name": "../evil.sh", "size": 1}]}
+        client = ScenarioFilesClient(api_key=api_key)
+
+        with patch.object(client, "get_scenario_files", return_value=listing):
+            with pytest.raises(DataMakerError, match="outside"):
+                client.download_folder(str(tmp_path / "dest"), scenario_id="scn-1")
+
+    @staticmethod
+    def _signed_url(expires_in):
+        """An S3-style presigned URL expiring ``expires_in`` seconds from now."""
+        signed_at = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        return (
+            f"https://storage/f1?X-Amz-Date={signed_at}"
+            f"&X-Amz-Expires={expires_in}&X-Amz-Signature=x"
+        )
+
+    @staticmethod
+    def _storage_response(status_code=200, content=b"data", etag=None):
+        response = Mock(status_code=status_code, content=content)
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    @patch("requests.Session.request")
+    def test_presigned_url_is_reused(self, mock_request, api_key):
+        """Test a second read skips the API call while the URL is valid."""
+        metadata = Mock(status_code=200)
+        metadata.json.return_value = {"presignedUrl": self._signed_url(3600)}
+        mock_request.side_effect = [
+            metadata,
+            self._storage_response(content=b"one"),
+            self._storage_response(content=b"two"),
+        ]
+
+        client = ScenarioFilesClient(api_key=api_key)
+        assert client.read_file_by_path("scenarios/x/a.txt") == b"one"
+        assert client.read_file_by_path("scenarios/x/a.txt") == b"two"
+
+        assert mock_request.call_count == 3
+        assert client.url_cache.stats()["hits"] == 1
+
+    @patch("requests.Session.request")
+    def test_short_lived_presigned_url_not_cached(self, mock_request, api_key):
+        """Test URLs expiring within the safety margin are fetched every time."""
+        metadata = Mock(status_code=200)
+        metadata.json.return_value = {"presignedUrl": self._signed_url(30)}
+        mock_request.side_effect = [
+            metadata,
+            self._storage_response(),
+            metadata,
+            self._storage_response(),
+        ]
+
+        client = ScenarioFilesClient(api_key=api_key)
+        client.read_file_by_path("scenarios/x/a.txt")
+        client.read_file_by_path("scenarios/x/a.txt")
+
+        assert len(client.url_cache) == 0
+
+    @patch("requests.Session.request")
+    def test_rejected_cached_url_is_refreshed(self, mock_request, api_key):
+        """Test a cached URL storage rejects is replaced with a fresh one."""
+        metadata = Mock(status_code=200)
+        metadata.json.return_value = {"presignedUrl": self._signed_url(3600)}
+        mock_request.side_effect = [
+            metadata,
+            self._storage_response(content=b"one"),
+            self._storage_response(status_code=403),
+            metadata,
+            self._storage_response(content=b"two"),
+        ]
+
+        client = ScenarioFilesClient(api_key=api_key)
+        client.download_scenario_file("f1", scenario_id="scn-1")
+
+        assert client.download_scenario_file("f1", scenario_id="scn-1") == b"two"
+        assert mock_request.call_count == 5
+
+    @patch("requests.Session.request")
+    def test_file_cache_serves_unchanged_content(self, mock_request, api_key, tmp_path):
+        """Test a 304 revalidation returns the content cached on disk."""
+        metadata = Mock(status_code=200)
+        metadata.json.return_value = {"presignedUrl": self._signed_url(3600)}
+        mock_request.side_effect = [
+            metadata,
+            self._storage_response(content=b"cached", etag='"v1"'),
+            self._storage_response(status_code=304, content=b""),
+        ]
+
+        client = ScenarioFilesClient(
+            api_key=api_key, file_cache=FileCache(str(tmp_path))
+        )
+        client.read_file_by_path("scenarios/x/a.txt")
+
+        assert client.read_file_by_path("scenarios/x/a.txt") == b"cached"
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch("requests.Session.request")
+    def test_map_file_by_path(self, mock_request, api_key, tmp_path):
+        """Test the file is streamed into the cache once and mapped from there."""
+        metadata = Mock(status_code=200)
+        metadata.json.return_value = {"presignedUrl": self._signed_url(3600)}
+        download = self._storage_response(etag='"v1"')
+        download.headers["Content-Length"] = "10"
+        download.iter_content.return_value = [b"01234", b"56789"]
+        mock_request.side_effect = [
+            metadata,
+            download,
+            self._storage_response(status_code=304, content=b""),
+        ]
+
+        client = ScenarioFilesClient(
+            api_key=api_key, file_cache=FileCache(str(tmp_path))
+        )
+        first = client.map_file_by_path("scenarios/x/big.csv")
+        second = client.map_file_by_path("scenarios/x/big.csv")
+
+        assert isinstance(first, memoryview) and first.readonly
+        assert bytes(first) == bytes(second) == b"0123456789"
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert mock_request.call_args.kwargs["stream"] is True
+
+    def test_map_file_by_path_requires_file_cache(self, api_key):
+        """Test mapping without a cache directory raises before any request."""
+        client = ScenarioFilesClient(api_key=api_key)
+        with pytest.raises(DataMakerError, match="file_cache_dir"):
+            client.map_file_by_path("scenarios/x/big.csv")
@@ -0,0 +1,121 @@
+"""Tests for seeded, sharded generation."""
+
+import json
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from src.datamaker.error import DataMakerError
+from src.datamaker.local_generator import LocalGenerator
+from src.datamaker.planner import plan_template
+from src.datamaker.routes.generation import GenerationClient
+from src.datamaker.sharding import run_shards, shard_seeds, shard_sizes
+from src.datamaker.template import (
+    AccountTemplate,
+    AIField,
+    BooleanField,
+    CustomField,
+    FloatField,
+    NumberField,
+    Template,
+    UUIDField,
+    WordsField,
+)
+
+np = pytest.importorskip("numpy")
+
+FIELDS = [
+    UUIDField("id"),
+    NumberField("qty", {"min": 1, "max": 100}),
+    FloatField("price", {"min": 0.0, "max": 9.0}),
+    BooleanField("active"),
+    CustomField("tier", ["gold", "silver"]),
+    WordsField("note", {"count": 3}),
+    {"name": "ref", "type": "Derived", "options": {"value": "{{tier}}-{{qty}}"}},
+]
+PLAN = plan_template(Template(FIELDS), LocalGenerator.supports)
+
+
+def as_bytes(result):
+    return json.dumps(result.to_rows()).encode()
+
+
+class TestSharding:
+    """Test cases for shard sizes, seeds and sharded runs."""
+
+    def test_shard_sizes(self):
+        """Test sizes cover the quantity and differ by at most one."""
+        assert shard_sizes(10, 4) == [3, 3, 2, 2]
+        assert shard_sizes(2, 3) == [1, 1, 0]
+        with pytest.raises(DataMakerError, match="shards"):
+            shard_sizes(10, 0)
+
+    def test_shard_seeds_match_spawn(self):
+        """Test shard seeds are the children SeedSequence.spawn would give."""
+        spawned = np.random.SeedSequence(7).spawn(3)
+
+        seeds = shard_seeds(7, 3)
+
+        for seed, child in zip(seeds, spawned):
+            assert (seed.generate_state(4) == child.generate_state(4)).all()
+
+    def test_output_independent_of_workers(self):
+        """Test one worker and a process pool give byte-identical rows."""
+        serial = run_shards(PLAN, 1001, shards=5, seed=42, workers=1)
+        pooled = run_shards(PLAN, 1001, shards=5, seed=42, workers=3)
+
+        assert len(serial) == 1001
+        assert serial.column_names == [field["name"] for field in PLAN.fields]
+        assert as_bytes(serial) == as_bytes(pooled)
+
+    def test_seed_and_shards_change_output(self):
+        """Test the rows depend on the seed and the shard count."""
+        base = as_bytes(run_shards(PLAN, 100, shards=4, seed=1, workers=1))
+
+        assert base == as_bytes(run_shards(PLAN, 100, shards=4, seed=1, workers=1))
+        assert base != as_bytes(run_shards(PLAN, 100, shards=4, seed=2, workers=1))
+        assert base != as_bytes(run_shards(PLAN, 100, shards=5, seed=1, workers=1))
+
+    def test_more_shards_than_rows(self):
+        """Test empty shards are joined without changing the columns."""
+        result = run_shards(PLAN, 2, shards=4, seed=3, workers=1)
+
+        assert len(result) == 2
+        assert result["qty"].dtype == np.int64
+
+    def test_remote_fields_raise(self):
+        """Test API-generated fields are rejected, as they cannot be seeded."""
+        plan = plan_template(Template([AIField("bio", "x")]), LocalGenerator.supports)
+
+        with pytest.raises(DataMakerError, match="bio"):
+            run_shards(plan, 10, shards=2, seed=1, workers=1)
+
+    def test_broken_pool_explains_main_guard(self, monkeypatch):
+        """Test a dead worker process raises with the __main__ guard advice."""
+
+        class BrokenExecutor(ProcessPoolExecutor):
+            def map(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr(
+            "src.datamaker.sharding.ProcessPoolExecutor", BrokenExecutor
+        )
+
+        with pytest.raises(DataMakerError, match="__main__"):
+            run_shards(PLAN, 10, shards=2, seed=1, workers=2)
+
+    def test_account_template_seed(self, api_key):
+        """Test generate_sharded falls back to an AccountTemplate's seed."""
+        account = AccountTemplate("t1", "Orders", [NumberField("qty")], "", "", seed=9)
+        client = GenerationClient(api_key=api_key)
+
+        rows = client.generate_sharded(account, 20, shards=3, workers=1)
+
+        assert rows == client.generate_sharded(
+            {"fields": [{"name": "qty", "type": "Number"}]},
+            20,
+            shards=3,
+            seed=9,
+            workers=1,
+        )
+        with pytest.raises(DataMakerError, match="quantity"):
+            client.generate_sharded({"fields": []}, seed=1)
@@ -0,0 +1,66 @@
+"""Tests for incremental JSON parsing of streamed responses."""
+
+import json
+import pytest
+from src.datamaker.streaming import JSONArrayParser
+from src.datamaker.error import DataMakerError
+
+
+def parse_in_pieces(body: bytes, size: int):
+    """Feed ``body`` to a parser ``size`` bytes at a time."""
+    parser = JSONArrayParser()
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start : start + size]))
+    items.extend(parser.close())
+    return items
+
+
+class TestJSONArrayParser:
+    """Test cases for the JSONArrayParser class."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 4096])
+    def test_matches_json_loads(self, size):
+        """Test any chunking yields the same items as json.loads."""
+        rows = [
+            {"id": i, "name": f"Zoë {i}", "tags": ["a", "]"], "score": i * 1.5}
+            for i in range(50)
+        ] + [12345, "tail", None, True]
+        body = json.dumps(rows).encode("utf-8")
+
+        assert parse_in_pieces(body, size) == rows
+
+    FLOATS = b"[1.5, -2e3, 3.25E-2, 4e+1, 0, -0.5]"
+
+    @pytest.mark.parametrize("split", range(1, len(FLOATS)))
+    def test_numbers_split_at_any_byte(self, split):
+        """Test floats and exponents cut by a chunk boundary parse whole."""
+        parser = JSONArrayParser()
+        items = parser.feed(self.FLOATS[:split]) + parser.feed(self.FLOATS[split:])
+        items += parser.close()
+
+        assert items == json.loads(self.FLOATS)
+
+    def test_empty_array(self):
+        """Test an empty array yields nothing."""
+        assert parse_in_pieces(b"  [ ]  ", 1) == []
+
+    def test_items_are_released_incrementally(self):
+        """Test completed items are returned before the array ends."""
+        parser = JSONArrayParser()
+        assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+        assert parser.feed(b": 2}") == [{"b": 2}]
+        assert parser.feed(b"]") == []
+        assert parser.close() == []
+
+    def test_truncated_body_raises(self):
+        """Test a body that ends mid-array raises DataMakerError."""
+        parser = JSONArrayParser()
+        parser.feed(b'[{"a": 1}, {"b": ')
+        with pytest.raises(DataMakerError):
+            parser.close()
+
+    def test_non_array_raises(self):
+        """Test a non-array body raises DataMakerError."""
+        with pytest.raises(DataMakerError, match="JSON array"):
+            JSONArrayParser().feed(b'{"error": "nope"}')